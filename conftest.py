@@ -18,6 +18,14 @@ pytest_plugins = [
     'pytest_plugins.settings_skip',
     'pytest_plugins.rerun_rp.rerun_rp',
     'pytest_plugins.fspath_plugins',
+    'pytest_plugins.hammer_timings',
+    'pytest_plugins.contenthost_pool',
+    'pytest_plugins.async_checkin',
+    'pytest_plugins.fixture_affinity',
+    'pytest_plugins.xdist_scheduling',
+    'pytest_plugins.satellite_balancing',
+    'pytest_plugins.fixture_profiler',
+    'pytest_plugins.manifest_pool',
     'pytest_plugins.factory_collection',
     'pytest_plugins.requirements.update_requirements',
     'pytest_plugins.sanity_plugin',
@@ -1,4 +1,6 @@
 # Content Component fixtures
+from contextlib import contextmanager
+
 from manifester import Manifester
 import pytest
 
@@ -128,11 +130,28 @@ def class_els_sca_manifest_org(class_org, class_sca_els_manifest, class_target_s
 # or stage RHSM accounts.
 
 
+@contextmanager
+def _sca_manifest(manifest_pool, category, reusable=True):
+    """Yield a manifest of the ``category`` of conf/manifest.yaml, leased from the manifest pool
+    when ``manifest.pool.enabled`` is set, see robottelo/manifest_pool.py
+
+    The manifests of function and module scoped fixtures aren't ``reusable``, as the tests and
+    module fixtures using them may refresh or delete them, e.g. ``module_repos_col`` of
+    tests/foreman/ui/test_organization.py.
+    """
+    if manifest_pool is None:
+        with Manifester(manifest_category=getattr(settings.manifest, category)) as manifest:
+            yield manifest
+    else:
+        with manifest_pool.lease(category, reusable=reusable) as manifest:
+            yield manifest
+
+
 @pytest.fixture(scope='session')
-def session_sca_manifest():
+def session_sca_manifest(manifest_pool):
     """Yields a manifest in entitlement mode with subscriptions determined by the
     `manifest_category.entitlement` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
+    with _sca_manifest(manifest_pool, 'golden_ticket') as manifest:
         yield manifest
 
 
@@ -147,59 +166,59 @@ def module_extra_rhel_sca_manifest():
 
 
 @pytest.fixture(scope='module')
-def module_sca_manifest():
+def module_sca_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
+    with _sca_manifest(manifest_pool, 'golden_ticket', reusable=False) as manifest:
         yield manifest
 
 
 @pytest.fixture(scope='class')
-def class_sca_manifest():
+def class_sca_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
+    with _sca_manifest(manifest_pool, 'golden_ticket') as manifest:
         yield manifest
 
 
 @pytest.fixture
-def function_sca_manifest():
+def function_sca_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
+    with _sca_manifest(manifest_pool, 'golden_ticket', reusable=False) as manifest:
         yield manifest
 
 
 @pytest.fixture
-def second_function_sca_manifest():
+def second_function_sca_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml.
     A different one than is used in `function_sca_manifest_org`."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
+    with _sca_manifest(manifest_pool, 'golden_ticket', reusable=False) as manifest:
         yield manifest
 
 
 @pytest.fixture(scope='module')
-def module_sca_els_manifest():
+def module_sca_els_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.els_rhel_manifest` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.els_rhel_manifest) as manifest:
+    with _sca_manifest(manifest_pool, 'els_rhel_manifest', reusable=False) as manifest:
         yield manifest
 
 
 @pytest.fixture(scope='class')
-def class_sca_els_manifest():
+def class_sca_els_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.els_rhel_manifest` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.els_rhel_manifest) as manifest:
+    with _sca_manifest(manifest_pool, 'els_rhel_manifest') as manifest:
         yield manifest
 
 
 @pytest.fixture
-def function_sca_els_manifest():
+def function_sca_els_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.els_rhel_manifest` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.els_rhel_manifest) as manifest:
+    with _sca_manifest(manifest_pool, 'els_rhel_manifest', reusable=False) as manifest:
         yield manifest
 
 
@@ -1,11 +1,11 @@
 from contextlib import contextmanager
 
 from box import Box
-from broker import Broker
 import pytest
 
 from robottelo.config import settings
 from robottelo.exceptions import ContentHostError
+from robottelo.host_checkin import release_hosts
 from robottelo.hosts import Satellite, lru_sat_ready_rhel
 
 
@@ -27,8 +27,7 @@ def _target_sat_imp(request, _default_sat, satellite_factory):
         new_sat = satellite_factory()
         new_sat.enable_satellite_ipv6_http_proxy()
         yield new_sat
-        new_sat.teardown()
-        Broker(hosts=[new_sat]).checkin()
+        release_hosts([new_sat])
     elif 'sanity' in request.config.option.markexpr:
         installer_sat = lru_sat_ready_rhel(settings.server.version.rhel_version)
         settings.set('server.hostname', installer_sat.hostname)
@@ -11,6 +11,7 @@ import pytest
 from robottelo import constants
 from robottelo.config import settings
 from robottelo.enums import NetworkType
+from robottelo.host_checkin import setup_hosts
 from robottelo.hosts import ContentHost, Satellite
 
 
@@ -47,78 +48,92 @@ def host_conf(request):
     return conf
 
 
+def _contenthosts(request, contenthost_pool, count=1):
+    """Return the context manager checking out the content hosts of ``request``
+
+    The hosts are taken from the content host pool when it is enabled,
+    see pytest_plugins/contenthost_pool.py, and released with robottelo.host_checkin.release_hosts
+    """
+    conf = host_conf(request)
+    if contenthost_pool is not None:
+        return contenthost_pool.hosts(conf, count)
+    if count > 1:
+        conf['_count'] = count
+    return setup_hosts(Broker(**conf, host_class=ContentHost).checkout())
+
+
 @pytest.fixture
-def rhel_contenthost(request):
+def rhel_contenthost(request, contenthost_pool):
     """A function-level fixture that provides a content host object parametrized"""
     # Request should be parametrized through pytest_fixtures.fixture_markers
     # unpack params dict
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthosts(request, contenthost_pool) as host:
         yield host
 
 
 @pytest.fixture(scope='module')
-def module_rhel_contenthost(request):
+def module_rhel_contenthost(request, contenthost_pool):
     """A module-level fixture that provides a content host object parametrized"""
     # Request should be parametrized through pytest_fixtures.fixture_markers
     # unpack params dict
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthosts(request, contenthost_pool) as host:
         yield host
 
 
 @pytest.fixture(params=[{'rhel_version': '7'}])
-def rhel7_contenthost(request):
+def rhel7_contenthost(request, contenthost_pool):
     """A function-level fixture that provides a rhel7 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthosts(request, contenthost_pool) as host:
         yield host
 
 
 @pytest.fixture(scope="class", params=[{'rhel_version': '7'}])
-def rhel7_contenthost_class(request):
+def rhel7_contenthost_class(request, contenthost_pool):
     """A fixture for use with unittest classes. Provides a rhel7 Content Host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthosts(request, contenthost_pool) as host:
         yield host
 
 
 @pytest.fixture(scope='module', params=[{'rhel_version': '7'}])
-def rhel7_contenthost_module(request):
+def rhel7_contenthost_module(request, contenthost_pool):
     """A module-level fixture that provides a rhel7 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthosts(request, contenthost_pool) as host:
         yield host
 
 
 @pytest.fixture(params=[{'rhel_version': '8'}])
-def rhel8_contenthost(request):
+def rhel8_contenthost(request, contenthost_pool):
     """A fixture that provides a rhel8 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthosts(request, contenthost_pool) as host:
         yield host
 
 
 @pytest.fixture(scope='module', params=[{'rhel_version': '8'}])
-def rhel8_contenthost_module(request):
+def rhel8_contenthost_module(request, contenthost_pool):
     """A module-level fixture that provides a rhel8 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthosts(request, contenthost_pool) as host:
         yield host
 
 
 @pytest.fixture(params=[{'rhel_version': '9'}])
-def rhel9_contenthost(request):
+def rhel9_contenthost(request, contenthost_pool):
     """A fixture that provides a rhel9 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthosts(request, contenthost_pool) as host:
         yield host
 
 
 @pytest.fixture
-def content_hosts(request):
+def content_hosts(request, contenthost_pool):
     """A function-level fixture that provides two rhel content hosts object"""
-    with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
+    with _contenthosts(request, contenthost_pool, count=2) as hosts:
         hosts[0].set_infrastructure_type('physical')
         yield hosts
 
 
 @pytest.fixture(scope='module')
-def mod_content_hosts(request):
+def mod_content_hosts(request, contenthost_pool):
     """A module-level fixture that provides two rhel content hosts object"""
-    with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
+    with _contenthosts(request, contenthost_pool, count=2) as hosts:
         hosts[0].set_infrastructure_type('physical')
         yield hosts
 
@@ -155,9 +170,9 @@ def cockpit_host(class_target_sat, class_org, rhel_contenthost):
 
 
 @pytest.fixture
-def rex_contenthost(request, module_org, target_sat, module_ak_with_cv):
+def rex_contenthost(request, module_org, target_sat, module_ak_with_cv, contenthost_pool):
     request.param['no_containers'] = True
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthosts(request, contenthost_pool) as host:
         repo = settings.repos['SATCLIENT_REPO'][f'RHEL{host.os_version.major}']
         host.register(
             module_org, None, module_ak_with_cv.name, target_sat, repo_data=f'repo={repo}'
@@ -166,9 +181,9 @@ def rex_contenthost(request, module_org, target_sat, module_ak_with_cv):
 
 
 @pytest.fixture
-def rex_contenthosts(request, module_org, target_sat, module_ak_with_cv):
+def rex_contenthosts(request, module_org, target_sat, module_ak_with_cv, contenthost_pool):
     request.param['no_containers'] = True
-    with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
+    with _contenthosts(request, contenthost_pool, count=2) as hosts:
         for host in hosts:
             repo = settings.repos['SATCLIENT_REPO'][f'RHEL{host.os_version.major}']
             host.register(
@@ -210,10 +225,10 @@ def katello_host_tools_tracer_host(rex_contenthost, target_sat):
 
 
 @pytest.fixture
-def rhel_contenthost_with_repos(request, target_sat):
+def rhel_contenthost_with_repos(request, target_sat, contenthost_pool):
     """Install katello-host-tools-tracer, create custom
     repositories on the host"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthosts(request, contenthost_pool) as host:
         # add IPv6 proxy for IPv6 communication
         if not host.network_type.has_ipv4:
             host.enable_ipv6_dnf_and_rhsm_proxy()
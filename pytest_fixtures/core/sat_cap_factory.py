@@ -7,6 +7,7 @@ import pytest
 from wait_for import wait_for
 
 from robottelo.config import configure_airgun, configure_nailgun, settings
+from robottelo.host_checkin import release_hosts
 from robottelo.hosts import (
     Capsule,
     IPAHost,
@@ -33,8 +34,7 @@ def _target_satellite_host(request, satellite_factory):
         new_sat = satellite_factory()
         new_sat.enable_satellite_ipv6_http_proxy()
         yield new_sat
-        new_sat.teardown()
-        Broker(hosts=[new_sat]).checkin()
+        release_hosts([new_sat])
     else:
         yield
 
@@ -53,8 +53,7 @@ def _target_capsule_host(request, capsule_factory):
         new_cap = capsule_factory()
         new_cap.enable_ipv6_dnf_and_rhsm_proxy()
         yield new_cap
-        new_cap.teardown()
-        Broker(hosts=[new_cap]).checkin()
+        release_hosts([new_cap])
     elif request.config.option.n_minus:
         if not settings.capsule.hostname:
             hosts = Capsule.get_hosts_from_inventory(filter="'cap' in @inv.name")
@@ -69,24 +68,44 @@ def _target_capsule_host(request, capsule_factory):
         yield
 
 
+def resolve_settings_deploy_args(section):
+    """Resolve the deploy arguments of ``settings.<section>``, i.e. server or capsule"""
+    if settings.get(section).get('deploy_arguments'):
+        logger.debug(
+            f'Original deploy arguments for {section}: {settings.get(section).deploy_arguments}'
+        )
+        resolved = resolve_deploy_args(settings.get(section).deploy_arguments)
+        settings.set(f'{section}.deploy_arguments', resolved)
+        logger.debug(
+            f'Resolved deploy arguments for {section}: {settings.get(section).deploy_arguments}'
+        )
+
+
+def satellite_deploy_args(workflow=None, **broker_args):
+    """Return the Broker args of a Satellite deployed by satellite_factory"""
+    if settings.server.deploy_arguments:
+        broker_args.update(settings.server.deploy_arguments)
+    return {'workflow': workflow or settings.server.deploy_workflows.product, **broker_args}
+
+
+def capsule_deploy_args(workflow=None, **broker_args):
+    """Return the Broker args of a Capsule deployed by capsule_factory"""
+    if settings.capsule.deploy_arguments:
+        broker_args.update(settings.capsule.deploy_arguments)
+    return {'workflow': workflow or settings.capsule.deploy_workflows.product, **broker_args}
+
+
 @pytest.fixture(scope='session')
-def satellite_factory():
-    if settings.server.get('deploy_arguments'):
-        logger.debug(f'Original deploy arguments for sat: {settings.server.deploy_arguments}')
-        resolved = resolve_deploy_args(settings.server.deploy_arguments)
-        settings.set('server.deploy_arguments', resolved)
-        logger.debug(f'Resolved deploy arguments for sat: {settings.server.deploy_arguments}')
+def satellite_factory(factory_host_pools):
+    resolve_settings_deploy_args('server')
 
     def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
-        if settings.server.deploy_arguments:
-            broker_args.update(settings.server.deploy_arguments)
-            logger.debug(f'Updated broker args for sat: {broker_args}')
-
-        vmb = Broker(
-            host_class=Satellite,
-            workflow=workflow or settings.server.deploy_workflows.product,
-            **broker_args,
-        )
+        deploy_args = satellite_deploy_args(workflow, **broker_args)
+        logger.debug(f'Broker args for sat: {deploy_args}')
+        # use a Satellite provisioned ahead of time, see pytest_plugins/factory_collection.py
+        if (pool := factory_host_pools.get(Satellite)) and (sats := pool.take(deploy_args)):
+            return sats[0]
+        vmb = Broker(host_class=Satellite, **deploy_args)
         timeout = (1200 + delay) * retry_limit
         sat = wait_for(vmb.checkout, timeout=timeout, delay=delay, fail_condition=[])
         return sat.out
@@ -100,26 +119,19 @@ def large_capsule_host(capsule_factory):
     new_cap = capsule_factory(deploy_flavor=settings.flavors.custom_db)
     new_cap.enable_ipv6_dnf_and_rhsm_proxy()
     yield new_cap
-    new_cap.teardown()
-    Broker(hosts=[new_cap]).checkin()
+    release_hosts([new_cap])
 
 
 @pytest.fixture(scope='session')
-def capsule_factory():
-    if settings.capsule.get('deploy_arguments'):
-        logger.debug(f'Original deploy arguments for cap: {settings.capsule.deploy_arguments}')
-        resolved = resolve_deploy_args(settings.capsule.deploy_arguments)
-        settings.set('capsule.deploy_arguments', resolved)
-        logger.debug(f'Resolved deploy arguments for cap: {settings.capsule.deploy_arguments}')
+def capsule_factory(factory_host_pools):
+    resolve_settings_deploy_args('capsule')
 
     def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
-        if settings.capsule.deploy_arguments:
-            broker_args.update(settings.capsule.deploy_arguments)
-        vmb = Broker(
-            host_class=Capsule,
-            workflow=workflow or settings.capsule.deploy_workflows.product,
-            **broker_args,
-        )
+        deploy_args = capsule_deploy_args(workflow, **broker_args)
+        # use a Capsule provisioned ahead of time, see pytest_plugins/factory_collection.py
+        if (pool := factory_host_pools.get(Capsule)) and (caps := pool.take(deploy_args)):
+            return caps[0]
+        vmb = Broker(host_class=Capsule, **deploy_args)
         timeout = (1200 + delay) * retry_limit
         cap = wait_for(vmb.checkout, timeout=timeout, delay=delay, fail_condition=[])
         return cap.out
@@ -269,8 +281,7 @@ def module_lb_capsule(retry_limit=3, delay=300, **broker_args):
     [cap.enable_ipv6_dnf_and_rhsm_proxy() for cap in cap_hosts.out]
     yield cap_hosts.out
 
-    [cap.teardown() for cap in cap_hosts.out]
-    Broker(hosts=cap_hosts.out).checkin()
+    release_hosts(cap_hosts.out)
 
 
 @pytest.fixture(scope='module')
@@ -311,9 +322,7 @@ def parametrized_enrolled_sat(
     else:
         new_sat.enroll_ad_and_configure_external_auth(ad_data)
         yield new_sat
-    new_sat.unregister()
-    new_sat.teardown()
-    Broker(hosts=[new_sat]).checkin()
+    release_hosts([new_sat], unregister=True)
 
 
 def get_sat_deploy_args(request):
@@ -419,5 +428,4 @@ def installer_satellite(request):
     yield sat
     if 'sanity' not in request.config.option.markexpr:
         sat = Satellite.get_host_by_hostname(sat.hostname)
-        sat.unregister()
-        Broker(hosts=[sat]).checkin()
+        release_hosts([sat], teardown=False, unregister=True)
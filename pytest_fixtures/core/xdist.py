@@ -8,6 +8,17 @@ import pytest
 from robottelo.config import configure_airgun, configure_nailgun, settings
 from robottelo.hosts import ContentHost, Satellite
 from robottelo.logging import logger
+from robottelo.satellite_balancer import SatelliteBalancer
+
+# seconds a worker waits for the controller to publish the work queued on the workers
+PENDING_WAIT = 30
+
+
+def _load_per_cpu(hostname):
+    """Return the load average over the last minute of a Satellite, per CPU"""
+    result = Satellite(hostname=hostname).execute('cut -d " " -f 1 /proc/loadavg; nproc')
+    load, cpus = result.stdout.split()
+    return float(load) / int(cpus)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -46,6 +57,20 @@ def align_to_satellite(request, worker_id, satellite_factory):
         # attempt to align a worker to a satellite
         if settings.server.xdist_behavior == 'run-on-one' and settings.server.hostnames:
             settings.set("server.hostname", settings.server.hostnames[0])
+        elif (
+            settings.server.xdist_behavior == 'least-loaded'
+            and settings.server.hostnames
+            and (balancer := SatelliteBalancer.from_config(request.config))
+        ):
+            settings.set(
+                "server.hostname",
+                balancer.choose(
+                    worker_id,
+                    settings.server.hostnames,
+                    sample=_load_per_cpu if settings.server.xdist_sample_load else None,
+                    wait=PENDING_WAIT,
+                ),
+            )
         elif settings.server.hostnames and worker_pos < len(settings.server.hostnames):
             settings.set("server.hostname", settings.server.hostnames[worker_pos])
         elif settings.server.xdist_behavior == 'balance' and settings.server.hostnames:
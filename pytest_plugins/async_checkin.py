@@ -0,0 +1,42 @@
+"""Wait for the hosts released in the background and report the failed check-ins
+
+With ``settings.broker.async_checkin.enabled``, fixtures release their hosts through
+:data:`robottelo.host_checkin.checkin_queue` without waiting for them. The queue is drained once
+all fixtures are torn down, and the hosts which could not be checked in are listed in the
+terminal summary, the xdist workers sending theirs to the controller.
+"""
+
+from dataclasses import asdict
+
+import pytest
+from xdist import is_xdist_worker
+
+from robottelo.host_checkin import CheckinFailure, checkin_queue
+
+WORKEROUTPUT_KEY = 'checkin_failures'
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Gather the failed check-ins of a finished xdist worker"""
+    checkin_queue.failures.extend(
+        CheckinFailure(**failure)
+        for failure in getattr(node, 'workeroutput', {}).get(WORKEROUTPUT_KEY, [])
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """Wait for the check-ins, after the session fixtures released their hosts"""
+    failures = checkin_queue.drain()
+    if is_xdist_worker(session):
+        session.config.workeroutput[WORKEROUTPUT_KEY] = [asdict(failure) for failure in failures]
+
+
+def pytest_terminal_summary(terminalreporter):
+    """List the hosts which could not be checked in"""
+    if not checkin_queue.failures:
+        return
+    terminalreporter.section('Failed host check-ins', red=True)
+    for failure in checkin_queue.failures:
+        terminalreporter.line(f'{", ".join(failure.hostnames)}: {failure.error}')
@@ -0,0 +1,104 @@
+"""Check the content hosts of the collected tests out of Broker ahead of time
+
+When ``settings.content_host.pool.enabled`` is set, the content hosts needed by the collected
+tests are counted per flavor (rhel version, network type, VM or container) once the collection is
+finished, and a :class:`robottelo.host_pool.HostPool` starts checking them out in the background.
+The content host fixtures of :mod:`pytest_fixtures.core.contenthosts` take their hosts from the
+pool through the ``contenthost_pool`` fixture, and the hosts left over are checked in at the end
+of the session.
+
+Every xdist worker collects all the tests but only runs the ones the controller sends it. A worker
+counts the content hosts of the tests sent to it as soon as they are queued on it, see
+``pytest_plugins/xdist_worker_queue.py``, and keeps at most ``settings.content_host.pool.depth``
+hosts of each flavor ahead of them. Without xdist, all the collected tests are counted.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from pytest_plugins.xdist_worker_queue import on_tests_sent
+from robottelo.config import settings
+from robottelo.host_pool import HostPool, flavor_key
+from robottelo.hosts import ContentHost
+from robottelo.logging import logger
+
+# content host fixtures taking their hosts from the pool: number of hosts, params they enforce
+POOLED_FIXTURES = {
+    'rhel_contenthost': (1, {}),
+    'module_rhel_contenthost': (1, {}),
+    'rhel7_contenthost': (1, {}),
+    'rhel7_contenthost_class': (1, {}),
+    'rhel7_contenthost_module': (1, {}),
+    'rhel8_contenthost': (1, {}),
+    'rhel8_contenthost_module': (1, {}),
+    'rhel9_contenthost': (1, {}),
+    'content_hosts': (2, {}),
+    'mod_content_hosts': (2, {}),
+    'rex_contenthost': (1, {'no_containers': True}),
+    'rex_contenthosts': (2, {'no_containers': True}),
+    'rhel_contenthost_with_repos': (1, {}),
+}
+
+pool_key = pytest.StashKey[HostPool]()
+
+
+def planned_hosts(items, planned=None):
+    """Yield the Broker args and the number of the content hosts checked out for ``items``
+
+    The hosts of a fixture with a broader scope than function are only counted once per node of
+    that scope.
+
+    :param set planned: The fixtures and nodes already counted, updated with those of ``items``.
+    """
+    from pytest_fixtures.core.contenthosts import host_conf
+
+    planned = set() if planned is None else planned
+    for item in items:
+        params = item.callspec.params if hasattr(item, 'callspec') else {}
+        for name in POOLED_FIXTURES.keys() & set(item.fixturenames):
+            count, enforced = POOLED_FIXTURES[name]
+            param = {**params.get(name, {}), **enforced}
+            scope = item._fixtureinfo.name2fixturedefs[name][-1].scope
+            node = {
+                'function': item,
+                'class': item.getparent(pytest.Class),
+                'module': item.getparent(pytest.Module),
+            }.get(scope) or item.session
+            if (key := (name, node.nodeid, flavor_key(param))) in planned:
+                continue
+            planned.add(key)
+            yield host_conf(SimpleNamespace(param=param, config=item.config, node=node)), count
+
+
+def pytest_collection_finish(session):
+    """Start checking out the content hosts of the collected tests"""
+    pool_settings = settings.content_host.pool
+    if not pool_settings.enabled or session.config.option.collectonly or not session.items:
+        return
+    pool = HostPool(
+        ContentHost, depth=pool_settings.depth, max_workers=pool_settings.max_workers
+    )
+    planned = set()
+
+    def plan(items):
+        for conf, count in planned_hosts(items, planned):
+            pool.plan(conf, count)
+
+    if not on_tests_sent(session, plan):
+        plan(session.items)
+    logger.info(f'Checking out content hosts ahead of time for {len(pool)} flavors')
+    pool.start()
+    session.config.stash[pool_key] = pool
+
+
+@pytest.fixture(scope='session')
+def contenthost_pool(request):
+    """The pool of content hosts checked out ahead of time, ``None`` when it is disabled"""
+    return request.config.stash.get(pool_key, None)
+
+
+def pytest_sessionfinish(session):
+    """Check in the content hosts left over in the pool"""
+    if (pool := session.config.stash.get(pool_key, None)) is not None:
+        pool.close()
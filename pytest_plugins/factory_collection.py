@@ -1,5 +1,35 @@
+"""Mark the tests deploying their own Satellite or Capsule, and provision those ahead of time
+
+Tests using the fixtures of :mod:`pytest_fixtures.core.sat_cap_factory` are marked with
+``factory_instance``. When ``settings.server.preprovision`` or ``settings.capsule.preprovision``
+is set, the Satellites and Capsules which the destructive and ``factory_instance`` tests are going
+to check out are counted per set of deploy arguments once the collection is finished. A
+:class:`robottelo.host_pool.HostPool` per host class then checks out up to that number of hosts of
+each set ahead of the tests, and ``satellite_factory``/``capsule_factory`` take their hosts from
+it through the ``factory_host_pools`` fixture.
+
+xdist workers collect all the tests, but only run the ones the controller sends them. A worker
+counts the hosts of the tests the controller sent it, as soon as they are queued on it, see
+``pytest_plugins/xdist_worker_queue.py``, so it only provisions hosts for the tests it runs.
+"""
+
 from inspect import getmembers, isfunction
 
+import pytest
+
+from pytest_plugins.xdist_worker_queue import on_tests_sent
+from robottelo.config import settings
+from robottelo.host_pool import HostPool
+from robottelo.hosts import Capsule, Satellite
+from robottelo.logging import logger
+
+# fixtures checking out a new Satellite for destructive tests
+TARGET_SAT_FIXTURES = {'target_sat', 'module_target_sat', 'class_target_sat', 'session_target_sat'}
+SATELLITE_FIXTURES = {'satellite_host', 'module_satellite_host', 'session_satellite_host'}
+CAPSULE_FIXTURES = {'capsule_host', 'module_capsule_host', 'session_capsule_host'}
+
+pools_key = pytest.StashKey[dict]()
+
 
 def pytest_configure(config):
     """Register markers related to testimony tokens"""
@@ -18,3 +48,94 @@ def pytest_collection_modifyitems(session, items, config):
         has_factoryfixture = set(itemfixtures).intersection(set(factory_fixture_names))
         if has_factoryfixture:
             item.add_marker('factory_instance')
+
+
+def scope_node(item, fixture_name):
+    """Return the node for which ``fixture_name`` is set up when running ``item``"""
+    scope = item._fixtureinfo.name2fixturedefs[fixture_name][-1].scope
+    return {
+        'function': item,
+        'class': item.getparent(pytest.Class),
+        'module': item.getparent(pytest.Module),
+    }.get(scope) or item.session
+
+
+def planned_hosts(items, option, planned=None):
+    """Yield the host class and the deploy args of each host the factories deploy for ``items``
+
+    The hosts of a fixture with a broader scope than function are only counted once per node of
+    that scope.
+
+    :param set planned: The fixtures and nodes already counted, updated with those of ``items``.
+    """
+    from pytest_fixtures.core import sat_cap_factory
+
+    if 'sanity' in option.markexpr:
+        # the sanity tests run on the hosts they installed
+        return
+    planned = set() if planned is None else planned
+    for item in items:
+        fixtures = set(item.fixturenames)
+        needed = [(name, Satellite, {}) for name in SATELLITE_FIXTURES & fixtures]
+        needed.extend(
+            (name, Satellite, {})
+            for name in TARGET_SAT_FIXTURES & fixtures
+            if scope_node(item, name).get_closest_marker('destructive')
+        )
+        if not option.n_minus:
+            needed.extend((name, Capsule, {}) for name in CAPSULE_FIXTURES & fixtures)
+            if 'large_capsule_host' in fixtures:
+                needed.append(
+                    ('large_capsule_host', Capsule, {'deploy_flavor': settings.flavors.custom_db})
+                )
+        for name, host_class, broker_args in needed:
+            if (key := (name, scope_node(item, name).nodeid)) in planned:
+                continue
+            planned.add(key)
+            if host_class is Satellite:
+                yield host_class, sat_cap_factory.satellite_deploy_args(**broker_args)
+            else:
+                yield host_class, sat_cap_factory.capsule_deploy_args(**broker_args)
+
+
+def pytest_collection_finish(session):
+    """Start checking out the Satellites and Capsules of the collected tests"""
+    depths = {Satellite: settings.server.preprovision, Capsule: settings.capsule.preprovision}
+    if not any(depths.values()) or session.config.option.collectonly or not session.items:
+        return
+    from pytest_fixtures.core import sat_cap_factory
+
+    for section in ('server', 'capsule'):
+        sat_cap_factory.resolve_settings_deploy_args(section)
+    pools = {
+        host_class: HostPool(host_class, depth=depth, max_workers=depth)
+        for host_class, depth in depths.items()
+        if depth
+    }
+    planned = set()
+
+    def plan(items):
+        for host_class, deploy_args in planned_hosts(items, session.config.option, planned):
+            if (pool := pools.get(host_class)) is not None:
+                pool.plan(deploy_args)
+
+    if not on_tests_sent(session, plan):
+        plan(session.items)
+    for host_class, pool in pools.items():
+        logger.info(
+            f'Provisioning {host_class.__name__} hosts of {len(pool)} flavors ahead of time'
+        )
+        pool.start()
+    session.config.stash[pools_key] = pools
+
+
+@pytest.fixture(scope='session')
+def factory_host_pools(request):
+    """The pools of Satellites and Capsules provisioned ahead of time, by host class"""
+    return request.config.stash.get(pools_key, {})
+
+
+def pytest_sessionfinish(session):
+    """Check in the Satellites and Capsules left over in the pools"""
+    for pool in session.config.stash.get(pools_key, {}).values():
+        pool.close()
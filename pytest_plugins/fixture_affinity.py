@@ -0,0 +1,200 @@
+"""xdist scheduler keeping the tests sharing expensive module fixtures on one worker
+
+With ``--dist load``, tests of a module sharing fixtures like ``module_sca_manifest_org``,
+``module_target_sat`` or ``module_rhel_contenthost`` are spread over several workers, each
+building the same module fixtures again. ``--fixture-affinity`` groups the tests which share an
+instance of their module- and class-scoped fixtures: the tests of a module using the same
+parametrization of those fixtures. Each group is sent to a single worker.
+
+The groups are computed by the workers, which know the fixtures of the tests, and handed to the
+scheduler of the controller through a file. The groups are assigned to workers as they run out of
+work, the groups with the highest estimated cost first. Costs are the durations of the tests in
+the previous runs, kept in the pytest cache. Without such durations, the groups are assigned like
+``--dist loadscope`` does, the groups with the most tests first.
+"""
+
+import heapq
+import json
+from pathlib import Path
+import shutil
+import tempfile
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+DURATIONS_CACHE_KEY = 'fixture_affinity/durations'
+GROUPS_DIR_KEY = 'fixture_affinity_groups_dir'
+# scopes of the fixtures whose instances are shared by several tests
+SHARED_SCOPES = ('class', 'module')
+
+
+def pytest_addoption(parser):
+    """Add --fixture-affinity option to schedule the tests by shared module fixtures."""
+    parser.addoption(
+        '--fixture-affinity',
+        action='store_true',
+        default=False,
+        help='With xdist, run the tests sharing module- and class-scoped fixtures (and their '
+        'parametrization) on the same worker, see pytest_plugins/fixture_affinity.py',
+    )
+
+
+def affinity_group(item):
+    """Return the group of ``item``, shared by the tests using the same module fixtures
+
+    :return: The nodeid of the module of the test, followed by the parameters of its class- and
+        module-scoped fixtures, if any.
+    """
+    module = item.getparent(pytest.Module)
+    group = module.nodeid if module else item.nodeid.split('::', 1)[0]
+    params = item.callspec.params if hasattr(item, 'callspec') else {}
+    shared = {
+        name: value
+        for name, value in params.items()
+        if (fixturedefs := item._fixtureinfo.name2fixturedefs.get(name))
+        and fixturedefs[-1].scope in SHARED_SCOPES
+    }
+    if shared:
+        group += json.dumps(shared, sort_keys=True, default=str)
+    return group
+
+
+def affinity_groups(items):
+    """Return the group of each of ``items`` by nodeid
+
+    The tests of a module not using any parametrized module fixture join the first group of
+    their module, which is the module itself unless all its groups are parametrized, so that the
+    other module fixtures they use are shared with that group.
+    """
+    groups = {item.nodeid: affinity_group(item) for item in items}
+    first_groups = {}
+    for item in items:
+        module = item.getparent(pytest.Module)
+        first_groups.setdefault(module.nodeid if module else None, groups[item.nodeid])
+    for item in items:
+        module = item.getparent(pytest.Module)
+        if module and groups[item.nodeid] == module.nodeid:
+            groups[item.nodeid] = first_groups[module.nodeid]
+    return groups
+
+
+class FixtureAffinityScheduling(LoadScopeScheduling):
+    """``--dist loadscope`` with the work units being the groups of :func:`affinity_group`
+
+    The cost of a work unit is the sum of the :meth:`estimate` of its tests, which subclasses
+    override to estimate the durations differently.
+
+    :param pathlib.Path groups_dir: Directory where the workers write the group of each test.
+    :param dict durations: Duration of the tests in previous runs, by nodeid.
+    """
+
+    def __init__(self, config, log=None, groups_dir=None, durations=None):
+        super().__init__(config, log)
+        self.groups_dir = groups_dir
+        self.durations = durations or {}
+        self.groups = {}
+        self._costs = {}
+        # the work units by decreasing cost, built on their first assignment
+        self._heap = None
+
+    @property
+    def by_cost(self):
+        """Whether the work units are assigned by decreasing cost rather than number of tests"""
+        return bool(self.durations)
+
+    def _split_scope(self, nodeid):
+        return self.groups.get(nodeid) or super()._split_scope(nodeid)
+
+    def schedule(self):
+        if self.collection is None and self.groups_dir is not None:
+            # every worker has written the groups of its collection by now
+            for path in self.groups_dir.glob('*.json'):
+                self.groups.update(json.loads(path.read_text()))
+            self.log(f'Fixture affinity groups of {len(self.groups)} tests')
+        super().schedule()
+
+    def estimate(self, nodeid):
+        """Return the expected duration of a test"""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        return sum(self.durations.values()) / len(self.durations) if self.durations else 1.0
+
+    def _cost(self, scope):
+        if (cost := self._costs.get(scope)) is None:
+            cost = self._costs[scope] = sum(map(self.estimate, self.workqueue[scope]))
+        return cost
+
+    def _push(self, scopes):
+        for scope in scopes:
+            heapq.heappush(self._heap, (-self._cost(scope), len(self._heap), scope))
+
+    def _assign_work_unit(self, node):
+        if self.by_cost:
+            if self._heap is None:
+                self._heap = []
+                self._push(self.workqueue)
+            # the longest groups first, so that the last ones to be assigned are short, skipping
+            # the entries of the groups assigned again after a crash
+            while (scope := heapq.heappop(self._heap)[2]) not in self.workqueue:
+                pass
+            self.workqueue.move_to_end(scope, last=False)
+        super()._assign_work_unit(node)
+
+    def remove_node(self, node):
+        if self._heap is not None:
+            # the pending groups of a crashed node are queued again
+            self._push(self.assigned_work.get(node, {}))
+        return super().remove_node(node)
+
+
+class FixtureAffinityController:
+    """Plugin of the xdist controller providing the scheduler and recording the durations"""
+
+    def __init__(self, config):
+        self.config = config
+        self.groups_dir = Path(tempfile.mkdtemp(prefix='fixture-affinity-'))
+        self.durations = {}
+
+    def pytest_configure_node(self, node):
+        """Tell the worker where to write the groups of its tests"""
+        node.workerinput[GROUPS_DIR_KEY] = str(self.groups_dir)
+
+    def pytest_xdist_make_scheduler(self, config, log):
+        durations = config.cache.get(DURATIONS_CACHE_KEY, {}) if config.cache else {}
+        return FixtureAffinityScheduling(
+            config, log, groups_dir=self.groups_dir, durations=durations
+        )
+
+    def pytest_runtest_logreport(self, report):
+        """Sum up the durations of the setup, call and teardown of each test"""
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        """Keep the durations of this run for the next ones"""
+        if self.durations and self.config.cache is not None:
+            self.config.cache.set(
+                DURATIONS_CACHE_KEY,
+                {**self.config.cache.get(DURATIONS_CACHE_KEY, {}), **self.durations},
+            )
+
+    def pytest_unconfigure(self, config):
+        shutil.rmtree(self.groups_dir, ignore_errors=True)
+
+
+def pytest_configure(config):
+    is_controller = config.getoption('dist') != 'no' and not hasattr(config, 'workerinput')
+    if config.getoption('fixture_affinity') and is_controller:
+        config.pluginmanager.register(FixtureAffinityController(config), 'fixture_affinity')
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_finish(session):
+    """Write the groups of the tests of a worker, before it reports its collection"""
+    workerinput = getattr(session.config, 'workerinput', {})
+    if (groups_dir := workerinput.get(GROUPS_DIR_KEY)) is None:
+        return
+    groups = affinity_groups(session.items)
+    path = Path(groups_dir, f'{workerinput["workerid"]}.json')
+    # the scheduler may read the file as soon as the collection is reported, write it atomically
+    path.with_suffix('.tmp').write_text(json.dumps(groups))
+    path.with_suffix('.tmp').replace(path)
@@ -0,0 +1,252 @@
+"""Profile the setup and teardown of the fixtures, and find the ones worth a broader scope
+
+``--fixture-profile PATH`` records, for each fixture, how many times it is set up and torn down
+and how long it takes, excluding the fixtures it depends on. The instances of each fixture are
+counted by parametrization, class and module, to tell how often a fixture is built again with the
+same parameters, and how many setups a broader scope would save. xdist workers send their profile
+to the controller, which writes the JSON report to PATH and ranks the fixtures in the terminal
+summary.
+"""
+
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from functools import partial
+import json
+from pathlib import Path
+import time
+
+import pytest
+from xdist import is_xdist_worker
+
+from robottelo.logging import logger
+
+WORKEROUTPUT_KEY = 'fixture_profile'
+# the scope a fixture would be promoted to, ``class`` being skipped as most tests have none
+PROMOTIONS = {'function': 'module', 'class': 'module', 'module': 'session'}
+SCOPES = ('function', 'class', 'module', 'package', 'session')
+SUMMARY_LENGTH = 15
+
+
+def pytest_addoption(parser):
+    """Add --fixture-profile option to profile the setup and teardown of the fixtures."""
+    parser.addoption(
+        '--fixture-profile',
+        help='Path of the JSON report of the setup and teardown times of the fixtures, and of '
+        'the fixtures worth a broader scope, see pytest_plugins/fixture_profiler.py',
+    )
+
+
+@dataclass
+class FixtureStats:
+    """Setups and teardowns of a fixture, times in seconds"""
+
+    fixture: str
+    module: str
+    scope: str
+    setups: int = 0
+    setup_time: float = 0.0
+    teardowns: int = 0
+    teardown_time: float = 0.0
+    # setups by JSON list of the parameters, class and module of the instance
+    instances: Counter = field(default_factory=Counter)
+
+    @property
+    def total_time(self):
+        return self.setup_time + self.teardown_time
+
+    @property
+    def mean_time(self):
+        return self.total_time / self.setups if self.setups else 0.0
+
+    @property
+    def rebuilds(self):
+        """Setups of the fixture with parameters it was already set up with"""
+        return self.setups - len({json.dumps(json.loads(key)[0]) for key in self.instances})
+
+    def merge(self, other):
+        self.setups += other.setups
+        self.setup_time += other.setup_time
+        self.teardowns += other.teardowns
+        self.teardown_time += other.teardown_time
+        self.instances.update(other.instances)
+
+    def savings(self, scope):
+        """Return the setups, and the time, saved if the fixture had ``scope``"""
+        if SCOPES.index(scope) <= SCOPES.index(self.scope):
+            return 0, 0.0
+        instances = set()
+        for key in self.instances:
+            params, cls, module = json.loads(key)
+            if scope == 'class':
+                instances.add(json.dumps([params, cls or module]))
+            elif scope == 'module':
+                instances.add(json.dumps([params, module]))
+            else:
+                instances.add(json.dumps(params))
+        saved = self.setups - len(instances)
+        return saved, saved * self.mean_time
+
+    def to_dict(self):
+        data = asdict(self)
+        data['instances'] = dict(self.instances)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{**data, 'instances': Counter(data['instances'])})
+
+
+class FixtureProfiler:
+    """Plugin recording the setups and teardowns of the fixtures"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.stats = {}
+        # time spent in the setup of the dependencies of the fixtures being set up
+        self._nested = []
+        self._teardown_starts = {}
+
+    def _stats(self, fixturedef):
+        module = getattr(fixturedef.func, '__module__', '')
+        key = f'{module}::{fixturedef.argname}'
+        if (stats := self.stats.get(key)) is None:
+            stats = self.stats[key] = FixtureStats(
+                fixture=fixturedef.argname, module=module, scope=fixturedef.scope
+            )
+        return stats
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        """Time the setup of the fixture, without the setup of its dependencies"""
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        nested = self._nested.pop()
+        if self._nested:
+            self._nested[-1] += elapsed
+        stats = self._stats(fixturedef)
+        stats.setups += 1
+        stats.setup_time += elapsed - nested
+        stats.instances[instance_key(fixturedef, request)] += 1
+        # finalizers run last in first out, this one right before the teardown of the fixture
+        fixturedef.addfinalizer(partial(self._start_teardown, fixturedef))
+
+    def _start_teardown(self, fixturedef):
+        self._teardown_starts[id(fixturedef)] = time.perf_counter()
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        if (start := self._teardown_starts.pop(id(fixturedef), None)) is None:
+            return
+        stats = self._stats(fixturedef)
+        stats.teardowns += 1
+        stats.teardown_time += time.perf_counter() - start
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Gather the profile of a finished xdist worker"""
+        for data in getattr(node, 'workeroutput', {}).get(WORKEROUTPUT_KEY, []):
+            stats = FixtureStats.from_dict(data)
+            key = f'{stats.module}::{stats.fixture}'
+            if key in self.stats:
+                self.stats[key].merge(stats)
+            else:
+                self.stats[key] = stats
+
+    def pytest_sessionfinish(self, session):
+        """Send the profile to the xdist controller, or write the report"""
+        if is_xdist_worker(session):
+            session.config.workeroutput[WORKEROUTPUT_KEY] = [
+                stats.to_dict() for stats in self.stats.values()
+            ]
+            return
+        if not self.stats:
+            return
+        self.path.write_text(json.dumps(self.report(), indent=2))
+        logger.info(f'Fixture profile reported to {self.path}')
+
+    def report(self):
+        """Return the fixtures by decreasing total time, and the candidates for a broader scope"""
+        fixtures = sorted(self.stats.values(), key=lambda stats: -stats.total_time)
+        return {
+            'fixtures': [
+                {
+                    **stats.to_dict(),
+                    'total_time': stats.total_time,
+                    'mean_time': stats.mean_time,
+                    'rebuilds': stats.rebuilds,
+                }
+                for stats in fixtures
+            ],
+            'candidates': self.candidates(),
+        }
+
+    def candidates(self):
+        """Return the fixtures saving time with a broader scope, the largest savings first"""
+        candidates = []
+        for stats in self.stats.values():
+            if (scope := PROMOTIONS.get(stats.scope)) is None:
+                continue
+            saved_setups, saved_time = stats.savings(scope)
+            if saved_setups:
+                candidates.append(
+                    {
+                        'fixture': stats.fixture,
+                        'module': stats.module,
+                        'scope': stats.scope,
+                        'promote_to': scope,
+                        'saved_setups': saved_setups,
+                        'saved_time': saved_time,
+                        'saved_time_session_scope': stats.savings('session')[1],
+                    }
+                )
+        return sorted(candidates, key=lambda candidate: -candidate['saved_time'])
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """List the slowest fixtures and the best candidates for a broader scope"""
+        if not self.stats or is_xdist_worker(terminalreporter):
+            return
+        terminalreporter.section('Fixture profile')
+        terminalreporter.line('total(s)  setups  rebuilds  mean(s)  scope     fixture')
+        for stats in sorted(self.stats.values(), key=lambda stats: -stats.total_time)[
+            :SUMMARY_LENGTH
+        ]:
+            terminalreporter.line(
+                f'{stats.total_time:8.1f}  {stats.setups:6}  {stats.rebuilds:8}  '
+                f'{stats.mean_time:7.1f}  {stats.scope:8}  {stats.fixture}'
+            )
+        if candidates := self.candidates()[:SUMMARY_LENGTH]:
+            terminalreporter.line('')
+            terminalreporter.line('saved(s)  setups  promotion           fixture')
+            for candidate in candidates:
+                promotion = f'{candidate["scope"]} -> {candidate["promote_to"]}'
+                terminalreporter.line(
+                    f'{candidate["saved_time"]:8.1f}  {candidate["saved_setups"]:6}  '
+                    f'{promotion:18}  {candidate["fixture"]}'
+                )
+        terminalreporter.line(f'Full report in {self.path}')
+
+
+def instance_key(fixturedef, request):
+    """Return the JSON list of the parameters, class and module of a fixture instance
+
+    The parameters are the ones of the fixture, and for a function-scoped fixture the ones of the
+    fixtures it directly depends on.
+    """
+    params = {}
+    if hasattr(request, 'param'):
+        params[fixturedef.argname] = request.param
+    if callspec := getattr(request.node, 'callspec', None):
+        params.update(
+            {name: callspec.params[name] for name in fixturedef.argnames if name in callspec.params}
+        )
+    cls = request.node.getparent(pytest.Class)
+    module = request.node.getparent(pytest.Module)
+    return json.dumps(
+        [params, cls and cls.nodeid, module and module.nodeid], sort_keys=True, default=str
+    )
+
+
+def pytest_configure(config):
+    if path := config.getoption('fixture_profile'):
+        config.pluginmanager.register(FixtureProfiler(path), 'fixture_profiler')
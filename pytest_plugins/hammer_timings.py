@@ -0,0 +1,76 @@
+"""Report the timings of hammer commands when ``settings.performance.time_hammer`` is enabled
+
+Timings collected by :mod:`robottelo.cli.hammer_timing` are summarized per test in the junit
+``user_properties`` of the test, and per session in a JSON and a CSV report. xdist workers send
+their timings to the controller, which writes the reports.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from xdist import is_xdist_worker
+
+from robottelo.cli.hammer_timing import collector, summarize
+from robottelo.config import settings
+from robottelo.logging import logger
+
+WORKEROUTPUT_KEY = 'hammer_timings'
+
+
+def pytest_addoption(parser):
+    """Add --hammer-timings-report option to set where the hammer timings are reported."""
+    parser.addoption(
+        '--hammer-timings-report',
+        default='hammer_timings',
+        help='Path prefix of the JSON and CSV reports of hammer timings, written when '
+        'settings.performance.time_hammer is enabled. Default: hammer_timings',
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Attribute the hammer commands run from now on to this test"""
+    collector.test = item.nodeid
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Add the summary of the hammer timings of the test to its teardown report"""
+    if (
+        call.when == 'teardown'
+        and settings.performance.time_hammer
+        and (summary := summarize(collector.for_test(item.nodeid)))
+    ):
+        item.user_properties.append(('hammer_timings', json.dumps(summary)))
+    yield
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    collector.test = None
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Gather the hammer timings of a finished xdist worker"""
+    collector.extend(getattr(node, 'workeroutput', {}).get(WORKEROUTPUT_KEY, []))
+
+
+def pytest_sessionfinish(session):
+    """Send the timings to the xdist controller, or write the reports"""
+    if not settings.performance.time_hammer:
+        return
+    if is_xdist_worker(session):
+        session.config.workeroutput[WORKEROUTPUT_KEY] = collector.to_dicts()
+        return
+    if not collector.timings:
+        return
+    prefix = session.config.getoption('hammer_timings_report')
+    metadata = {
+        'satellite_version': settings.server.version.get('release'),
+        'snap_version': settings.server.version.get('snap', ''),
+    }
+    json_path, csv_path = Path(f'{prefix}.json'), Path(f'{prefix}.csv')
+    json_path.write_text(json.dumps(collector.report(metadata), indent=2))
+    csv_path.write_text(collector.to_csv())
+    logger.info(f'Hammer timings reported to {json_path} and {csv_path}')
@@ -0,0 +1,98 @@
+"""Share a pool of manifests generated ahead of time between the manifest fixtures
+
+When ``settings.manifest.pool.enabled`` is set, the manifests the collected tests need are counted
+by ``settings.manifest`` category once the collection is finished, and a
+:class:`robottelo.manifest_pool.ManifestPool` starts generating them. The ``*_sca_manifest``
+fixtures lease their manifest from it through the ``manifest_pool`` fixture. With xdist, the
+controller creates the store of the pool, shared by the workers, and deletes the allocations of
+its manifests once the workers are done.
+"""
+
+from pathlib import Path
+import shutil
+import tempfile
+
+import pytest
+
+from pytest_plugins.factory_collection import scope_node
+from robottelo.config import settings
+from robottelo.manifest_pool import ManifestPool
+
+# manifest category of the fixtures leasing their manifest from the pool
+POOLED_FIXTURES = {
+    'session_sca_manifest': 'golden_ticket',
+    'module_sca_manifest': 'golden_ticket',
+    'class_sca_manifest': 'golden_ticket',
+    'function_sca_manifest': 'golden_ticket',
+    'second_function_sca_manifest': 'golden_ticket',
+    'module_sca_els_manifest': 'els_rhel_manifest',
+    'class_sca_els_manifest': 'els_rhel_manifest',
+    'function_sca_els_manifest': 'els_rhel_manifest',
+}
+STORE_DIR_KEY = 'manifest_pool_dir'
+
+pool_key = pytest.StashKey[ManifestPool]()
+
+
+def planned_manifests(items):
+    """Yield the category of each manifest the pooled fixtures lease for ``items``
+
+    The manifests of a fixture with a broader scope than function are only counted once per node
+    of that scope.
+    """
+    planned = set()
+    for item in items:
+        for name in POOLED_FIXTURES.keys() & set(item.fixturenames):
+            if (key := (name, scope_node(item, name).nodeid)) not in planned:
+                planned.add(key)
+                yield POOLED_FIXTURES[name]
+
+
+def pytest_configure(config):
+    if not settings.manifest.pool.enabled:
+        return
+    if hasattr(config, 'workerinput'):
+        store_dir = config.workerinput[STORE_DIR_KEY]
+    else:
+        # next to the manifest files of Manifester
+        manifests_dir = Path('manifests').absolute()
+        manifests_dir.mkdir(exist_ok=True)
+        store_dir = tempfile.mkdtemp(prefix='pool-', dir=manifests_dir)
+    config.stash[pool_key] = ManifestPool(
+        store_dir,
+        depth=settings.manifest.pool.depth,
+        max_workers=settings.manifest.pool.max_workers,
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Share the store of the pool with the worker"""
+    if (pool := node.config.stash.get(pool_key, None)) is not None:
+        node.workerinput[STORE_DIR_KEY] = str(pool.store_dir)
+
+
+def pytest_collection_finish(session):
+    """Start generating the manifests of the collected tests"""
+    pool = session.config.stash.get(pool_key, None)
+    if pool is None or session.config.option.collectonly or not session.items:
+        return
+    for category in planned_manifests(session.items):
+        pool.plan(category)
+    pool.start()
+
+
+@pytest.fixture(scope='session')
+def manifest_pool(request):
+    """The pool of manifests generated ahead of time, ``None`` when disabled"""
+    return request.config.stash.get(pool_key, None)
+
+
+def pytest_sessionfinish(session):
+    """Delete the allocations of the manifests once the last process using them is done"""
+    if (pool := session.config.stash.get(pool_key, None)) is None:
+        return
+    is_worker = hasattr(session.config, 'workerinput')
+    pool.close(delete=not is_worker)
+    if not is_worker:
+        shutil.rmtree(pool.store_dir, ignore_errors=True)
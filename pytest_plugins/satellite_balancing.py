@@ -0,0 +1,97 @@
+"""Publish the queued work of the xdist workers for the ``least-loaded`` xdist behavior
+
+With ``settings.server.xdist_behavior`` set to ``least-loaded``, the xdist controller shares a
+directory with the workers, where it publishes the estimated duration of the tests queued on each
+worker once the scheduler sent the first tests to the workers, before they align to a Satellite,
+and then every time a test finishes. ``align_to_satellite`` reads it through
+:class:`robottelo.satellite_balancer.SatelliteBalancer` to pick the least loaded Satellite.
+Durations are estimated by the scheduler of ``pytest_plugins/xdist_scheduling.py`` when it is in
+use, each test counts for one otherwise.
+"""
+
+import shutil
+import tempfile
+
+import pytest
+
+from robottelo.config import settings
+from robottelo.satellite_balancer import STATE_DIR_KEY, SatelliteBalancer
+
+
+def pending_tests(scheduler):
+    """Return the nodeids of the tests queued on each worker by worker id"""
+    if hasattr(scheduler, 'assigned_work'):
+        # --dist loadscope and its subclasses
+        return {
+            node.gateway.id: [
+                nodeid
+                for work_unit in workload.values()
+                for nodeid, completed in work_unit.items()
+                if not completed
+            ]
+            for node, workload in scheduler.assigned_work.items()
+        }
+    if hasattr(scheduler, 'node2pending') and scheduler.collection:
+        return {
+            node.gateway.id: [scheduler.collection[index] for index in pending]
+            for node, pending in scheduler.node2pending.items()
+        }
+    return {}
+
+
+class SatelliteLoadCoordinator:
+    """Plugin of the xdist controller publishing the queued work of each worker"""
+
+    def __init__(self, config):
+        self.config = config
+        self.balancer = SatelliteBalancer(tempfile.mkdtemp(prefix='satellite-balancer-'))
+        self.published = False
+
+    def pytest_configure_node(self, node):
+        """Tell the worker where the queued work is published"""
+        node.workerinput[STATE_DIR_KEY] = str(self.balancer.state_dir)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        """Publish the queued work as soon as the scheduler sent the first tests"""
+        outcome = yield
+        if (scheduler := outcome.get_result()) is not None:
+            self.watch_scheduler(scheduler)
+
+    def watch_scheduler(self, scheduler):
+        """Publish the queued work of ``scheduler`` after its first :meth:`schedule`"""
+        schedule = scheduler.schedule
+
+        def schedule_and_publish():
+            first = not self.published
+            schedule()
+            if first:
+                self.publish(scheduler)
+
+        scheduler.schedule = schedule_and_publish
+
+    def publish(self, scheduler):
+        estimate = getattr(scheduler, 'estimate', lambda nodeid: 1.0)
+        self.balancer.publish_pending(
+            {
+                worker_id: sum(map(estimate, nodeids))
+                for worker_id, nodeids in pending_tests(scheduler).items()
+            }
+        )
+        self.published = True
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != 'teardown':
+            return
+        if (dsession := self.config.pluginmanager.getplugin('dsession')) is None:
+            return
+        self.publish(dsession.sched)
+
+    def pytest_unconfigure(self, config):
+        shutil.rmtree(self.balancer.state_dir, ignore_errors=True)
+
+
+def pytest_configure(config):
+    is_controller = config.getoption('dist', 'no') != 'no' and not hasattr(config, 'workerinput')
+    if is_controller and settings.server.xdist_behavior == 'least-loaded':
+        config.pluginmanager.register(SatelliteLoadCoordinator(config), 'satellite_balancing')
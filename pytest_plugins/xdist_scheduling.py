@@ -0,0 +1,259 @@
+"""Balance the xdist workers with the durations of the tests in the previous runs
+
+``--timing-store PATH`` keeps the duration of each test, its setup and teardown included, in a
+JSON file updated at the end of each session. With xdist, the work units of the ``--dist`` mode
+(the tests, files, or modules and classes of ``--dist loadscope``), or the groups of
+``--fixture-affinity``, are then assigned to the workers as they run out of work, the longest
+first, by a subclass of the scheduler of ``pytest_plugins/fixture_affinity.py``. The duration of a
+test not in the store is estimated with the mean duration of the tests of its component, or of all
+the tests if its component has none. The terminal summary compares the makespan predicted from the
+estimates to the actual one, the longest time a worker spent in tests.
+"""
+
+from collections import defaultdict
+import heapq
+import json
+from pathlib import Path
+import shutil
+import tempfile
+
+import pytest
+
+from pytest_plugins.fixture_affinity import FixtureAffinityScheduling
+from robottelo.logging import logger
+
+# estimated duration of every test when there is no timing at all, the units with the most tests
+# are assigned first like with --dist loadscope
+DEFAULT_DURATION = 1.0
+# the --dist modes whose work units are assigned the longest first, the others are left to xdist
+DIST_MODES = ('load', 'loadfile', 'loadscope')
+INFO_DIR_KEY = 'xdist_scheduling_info_dir'
+
+
+def pytest_addoption(parser):
+    """Add --timing-store option to keep the test durations and balance the xdist workers."""
+    parser.addoption(
+        '--timing-store',
+        help='JSON file keeping the durations of the tests, with xdist the longest tests are '
+        'assigned first, see pytest_plugins/xdist_scheduling.py',
+    )
+
+
+class TimingStore:
+    """Durations of the tests in the previous runs, with the component of each test
+
+    :param path: JSON file of the store, ``None`` for a store which isn't kept.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.tests = {}
+        if self.path and self.path.exists():
+            try:
+                self.tests = json.loads(self.path.read_text())
+            except ValueError as err:
+                logger.warning(f'Ignoring the timing store {self.path}: {err}')
+        self._defaults = None
+
+    def update(self, durations, components):
+        """Keep the latest ``durations`` of the tests by nodeid, and their ``components``"""
+        for nodeid, duration in durations.items():
+            self.tests[nodeid] = {
+                'duration': round(duration, 3),
+                'component': components.get(nodeid),
+            }
+        self._defaults = None
+
+    def save(self):
+        if self.path is None:
+            return
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(self.tests, indent=2, sort_keys=True))
+        tmp_path.replace(self.path)
+
+    @property
+    def defaults(self):
+        """The mean duration of the tests by component, and of all the tests under ``None``"""
+        if self._defaults is None:
+            by_component = defaultdict(list)
+            for test in self.tests.values():
+                by_component[test['component']].append(test['duration'])
+                if test['component'] is not None:
+                    by_component[None].append(test['duration'])
+            self._defaults = {
+                component: sum(durations) / len(durations)
+                for component, durations in by_component.items()
+            }
+        return self._defaults
+
+    def estimate(self, nodeid, component=None):
+        """Return the expected duration of a test"""
+        if (test := self.tests.get(nodeid)) is not None:
+            return test['duration']
+        return self.defaults.get(component) or self.defaults.get(None, DEFAULT_DURATION)
+
+
+def lpt_makespan(costs, workers):
+    """Return the makespan of assigning ``costs`` to ``workers``, the longest first"""
+    loads = [0.0] * min(workers, len(costs))
+    for cost in sorted(costs, reverse=True):
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads, default=0.0)
+
+
+class DurationScheduling(FixtureAffinityScheduling):
+    """xdist scheduler assigning the work units with the longest estimated duration first
+
+    :param pathlib.Path groups_dir: Directory where the workers write the ``--fixture-affinity``
+        group of each test, ``None`` without ``--fixture-affinity``.
+    :param pathlib.Path info_dir: Directory where the workers write the component of each test.
+    :param TimingStore timings: Durations of the tests in the previous runs.
+    """
+
+    by_cost = True
+
+    def __init__(self, config, log=None, groups_dir=None, info_dir=None, timings=None):
+        super().__init__(config, log, groups_dir=groups_dir)
+        self.info_dir = info_dir
+        self.timings = timings or TimingStore()
+        self.dist = config.getvalue('dist')
+        self.info = {}
+        self.predicted_makespan = None
+
+    def _split_scope(self, nodeid):
+        if nodeid in self.groups:
+            return self.groups[nodeid]
+        if self.dist == 'load':
+            return nodeid
+        if self.dist == 'loadfile':
+            return nodeid.split('::', 1)[0]
+        return super()._split_scope(nodeid)
+
+    def estimate(self, nodeid):
+        return self.timings.estimate(nodeid, self.info.get(nodeid, {}).get('component'))
+
+    def schedule(self):
+        if self.collection is not None:
+            super().schedule()
+            return
+        if self.info_dir is not None:
+            # every worker has written the info of its collection by now
+            for path in self.info_dir.glob('*.json'):
+                self.info.update(json.loads(path.read_text()))
+        super().schedule()
+        if self.collection:
+            units = defaultdict(float)
+            for nodeid in self.collection:
+                units[self._split_scope(nodeid)] += self.estimate(nodeid)
+            self.predicted_makespan = lpt_makespan(list(units.values()), len(self.nodes))
+            self.log(f'{len(units)} work units, predicted makespan {self.predicted_makespan:.0f}s')
+
+
+class TimingRecorder:
+    """Plugin recording the durations of the tests in the timing store
+
+    On the xdist controller, it also provides the scheduler and compares the predicted makespan
+    to the actual one.
+    """
+
+    def __init__(self, config, timings):
+        self.config = config
+        self.timings = timings
+        # without timings of previous runs, the prediction only counts the tests
+        self.has_history = bool(timings.tests)
+        self.durations = defaultdict(float)
+        self.worker_durations = defaultdict(float)
+        self.components = {}
+        self.scheduler = None
+        self.info_dir = None
+        if is_controller(config):
+            self.info_dir = Path(tempfile.mkdtemp(prefix='xdist-scheduling-'))
+
+    def pytest_configure_node(self, node):
+        """Tell the worker where to write the info of its tests"""
+        node.workerinput[INFO_DIR_KEY] = str(self.info_dir)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        """Replace the scheduler of ``--dist`` and of ``--fixture-affinity``"""
+        affinity = config.pluginmanager.getplugin('fixture_affinity')
+        if config.getvalue('dist') not in DIST_MODES and affinity is None:
+            return None
+        self.scheduler = DurationScheduling(
+            config,
+            log,
+            groups_dir=affinity.groups_dir if affinity else None,
+            info_dir=self.info_dir,
+            timings=self.timings,
+        )
+        return self.scheduler
+
+    def pytest_collection_finish(self, session):
+        self.components = collection_info(session)
+
+    def pytest_runtest_logreport(self, report):
+        """Sum up the durations of the setup, call and teardown of each test"""
+        self.durations[report.nodeid] += report.duration
+        node = getattr(report, 'node', None)
+        self.worker_durations[node.gateway.id if node else 'main'] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        """Keep the durations of this run for the next ones"""
+        info = self.scheduler.info if self.scheduler else self.components
+        if self.durations:
+            self.timings.update(
+                self.durations,
+                {nodeid: test.get('component') for nodeid, test in info.items()},
+            )
+            self.timings.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Compare the predicted makespan to the actual one"""
+        if (
+            self.scheduler is None
+            or self.scheduler.predicted_makespan is None
+            or not self.has_history
+        ):
+            return
+        actual = max(self.worker_durations.values(), default=0.0)
+        terminalreporter.write_sep(
+            '-',
+            f'xdist makespan: predicted {self.scheduler.predicted_makespan:.1f}s, '
+            f'actual {actual:.1f}s',
+        )
+
+    def pytest_unconfigure(self, config):
+        if self.info_dir is not None:
+            shutil.rmtree(self.info_dir, ignore_errors=True)
+
+
+def is_controller(config):
+    return config.getoption('dist') != 'no' and not hasattr(config, 'workerinput')
+
+
+def collection_info(session):
+    """Return the component of each test by nodeid"""
+    info = {}
+    for item in session.items:
+        marker = item.get_closest_marker('component')
+        info[item.nodeid] = {'component': marker.args[0] if marker and marker.args else None}
+    return info
+
+
+def pytest_configure(config):
+    path = config.getoption('timing_store')
+    if path is None or hasattr(config, 'workerinput'):
+        return
+    config.pluginmanager.register(TimingRecorder(config, TimingStore(path)), 'xdist_scheduling')
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_finish(session):
+    """Write the info of the tests of a worker, before it reports its collection"""
+    workerinput = getattr(session.config, 'workerinput', {})
+    if (info_dir := workerinput.get(INFO_DIR_KEY)) is None:
+        return
+    path = Path(info_dir, f'{workerinput["workerid"]}.json')
+    # the scheduler may read the file as soon as the collection is reported, write it atomically
+    path.with_suffix('.tmp').write_text(json.dumps(collection_info(session)))
+    path.with_suffix('.tmp').replace(path)
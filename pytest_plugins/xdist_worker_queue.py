@@ -0,0 +1,55 @@
+"""Follow the tests the xdist controller sends to a worker
+
+An xdist worker collects all the tests, but only runs the ones the controller sends it, in
+batches, as it runs out of work. :func:`on_tests_sent` lets a worker plan the resources of its
+tests as soon as they are queued on it, ahead of running them. It is used by
+``pytest_plugins/factory_collection.py`` and ``pytest_plugins/contenthost_pool.py``, and isn't a
+plugin of its own.
+"""
+
+from robottelo.logging import logger
+
+
+def _worker_interactor(config):
+    """Return the plugin of xdist running the tests of a worker, ``None`` if there is none"""
+    for plugin in config.pluginmanager.get_plugins():
+        if hasattr(plugin, 'handle_command') and hasattr(plugin, 'torun'):
+            return plugin
+    return None
+
+
+def on_tests_sent(session, callback):
+    """Call ``callback`` with the items of each batch of tests the controller sends the worker
+
+    It has to be called before the tests run, e.g. from ``pytest_collection_finish``. The
+    callback is called from the thread receiving the commands of the controller. Tests stolen
+    back by the controller of ``--dist worksteal`` are not reported.
+
+    :return: Whether the tests sent can be followed, they can't outside of an xdist worker.
+    """
+    if not hasattr(session.config, 'workerinput'):
+        return False
+    if (interactor := _worker_interactor(session.config)) is None:
+        logger.warning('The xdist worker plugin was not found, its tests cannot be followed')
+        return False
+    handle_command = interactor.handle_command
+
+    def report_and_handle(command):
+        # report the tests before queueing them, so that their resources get a head start
+        name, kwargs = command if isinstance(command, tuple) else (None, {})
+        items = None
+        if name == 'runtests':
+            items = [session.items[index] for index in kwargs['indices']]
+        elif name == 'runtests_all':
+            items = list(session.items)
+        if items:
+            try:
+                callback(items)
+            except Exception as err:
+                # the tests run all the same, without their resources planned
+                logger.warning(f'Failed to plan the resources of the tests sent: {err}')
+        handle_command(command)
+
+    # the worker only registers its command handler when it starts running the tests
+    interactor.handle_command = report_and_handle
+    return True
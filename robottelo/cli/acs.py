@@ -36,8 +36,7 @@ class ACS(Base):
     @classmethod
     def refresh(cls, options=None):
         """Refresh the ACS"""
-        cls.command_sub = 'refresh'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('refresh', options))
 
 
 class ACSBulk(Base):
@@ -50,17 +49,14 @@ class ACSBulk(Base):
     @classmethod
     def destroy(cls, options=None):
         """Destroy the ACS(s)"""
-        cls.command_sub = 'destroy'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('destroy', options))
 
     @classmethod
     def refresh(cls, options=None):
         """Refresh the ACS(s)"""
-        cls.command_sub = 'refresh'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('refresh', options))
 
     @classmethod
     def refresh_all(cls, options=None):
         """Refresh all ACSs"""
-        cls.command_sub = 'refresh-all'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('refresh-all', options))
@@ -23,20 +23,17 @@ class Auth(Base):
     @classmethod
     def login(cls, options=None):
         """Set credentials"""
-        cls.command_sub = 'login'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('login', options), output_format='csv')
 
     @classmethod
     def logout(cls, options=None):
         """Wipe credentials"""
-        cls.command_sub = 'logout'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('logout', options), output_format='csv')
 
     @classmethod
     def status(cls, options=None):
         """Show login status"""
-        cls.command_sub = 'status'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('status', options), output_format='csv')
 
 
 class AuthLogin(Base):
@@ -47,17 +44,14 @@ class AuthLogin(Base):
     @classmethod
     def basic(cls, options=None):
         """Provide username and password"""
-        cls.command_sub = 'basic'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('basic', options), output_format='csv')
 
     @classmethod
     def oauth(cls, options=None):
         """Supports for both with/without 2fa"""
-        cls.command_sub = 'oauth'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('oauth', options), output_format='csv')
 
     @classmethod
     def negotiate(cls, options=None):
         """Kerberos ticket based auth"""
-        cls.command_sub = 'negotiate'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('negotiate', options), output_format='csv')
@@ -1,34 +1,313 @@
 """Generic base class for cli hammer commands."""
 
+import base64
+from dataclasses import dataclass
+import io
+import itertools
 import re
+from types import MappingProxyType
 
 from wait_for import wait_for
 
 from robottelo import ssh
-from robottelo.cli import hammer
+from robottelo.cli import hammer, hammer_shell, hammer_timing
 from robottelo.config import settings
-from robottelo.exceptions import CLIDataBaseError, CLIError, CLIReturnCodeError
+from robottelo.exceptions import (
+    CLIDataBaseError,
+    CLIError,
+    CLIOptionError,
+    CLIReturnCodeError,
+    HammerShellError,
+)
 from robottelo.logging import logger
 from robottelo.utils.ssh import get_client
 
 
+class HammerCommand(str):
+    """A hammer command line which keeps the parts it was built from
+
+    It is a plain string to everything consuming the command line, while ``command_base``,
+    ``command_sub``, ``options`` and ``command_end`` are kept as read-only attributes.
+    """
+
+    def __new__(cls, command_base=None, command_sub=None, options=None, command_end=None):
+        options = dict(options or {})
+        tail = ''
+        for key, val in options.items():
+            if val is None:
+                continue
+            if val is True:
+                tail += f' --{key}'
+            elif val is not False:
+                if isinstance(val, list):
+                    val = ','.join(str(el) for el in val)
+                tail += f' --{key}="{val}"'
+        command = super().__new__(
+            cls, f"{command_base or ''} {command_sub or ''} {tail.strip()} {command_end or ''}"
+        )
+        command.__dict__.update(
+            command_base=command_base,
+            command_sub=command_sub,
+            options=MappingProxyType(options),
+            command_end=command_end,
+        )
+        return command
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __reduce__(self):
+        return (
+            type(self),
+            (self.command_base, self.command_sub, dict(self.options), self.command_end),
+        )
+
+
+@dataclass(frozen=True)
+class CLIRequest:
+    """Everything needed to run a single hammer command, resolved when the call is made
+
+    Nothing is read back from the CLI class once the request is built, so concurrent calls on
+    the same class can't leak their subcommand or credentials into each other.
+    """
+
+    command: str
+    command_base: str | None
+    command_sub: str | None
+    hostname: str
+    user: str | None = None
+    password: str | None = None
+    omit_credentials: bool = False
+    output_format: str | None = None
+    timeout: int | str | None = None
+
+    @property
+    def name(self):
+        return f'{self.command_base} {self.command_sub}'
+
+
+@dataclass
+class CLIBatchResult:
+    """Outcome of a single command of :meth:`Base.execute_batch`
+
+    ``status`` is ``None`` when the command was skipped after an earlier command failed, and
+    ``output`` holds ``stdout`` parsed according to the output format of the request.
+    """
+
+    request: CLIRequest
+    status: int | None
+    stdout: str = ''
+    stderr: str = ''
+    output: object = None
+
+    @property
+    def skipped(self):
+        return self.status is None
+
+
+class CLIBatch:
+    """Record hammer commands and run them in a single ssh round-trip when the context exits
+
+    The classmethods of the CLI entities are recorded instead of run when called through the
+    batch, with their own subcommand, output format, ``ignore_stderr`` and timeout::
+
+        with target_sat.cli.batch(max_parallel=4) as batch:
+            batch.Repository.synchronize({'id': repo_id})
+            batch.ContentView.publish({'id': cv_id})
+        batch.results[1].status
+
+    A recorded classmethod returns the index of its command in :attr:`results`, so only the
+    ones returning the output of a single ``execute`` call can be recorded.
+
+    The error of the first failed command is raised once the batch ran, like the classmethod
+    would have raised it, and :attr:`failed` is the index of that command. A command rejected by
+    ``settings.performance.validate_hammer_options`` raises when it is recorded.
+
+    :param str hostname: Satellite to run the commands on, defaults to the one of each class.
+    :param namespace: The CLI entities of the Satellite, see :mod:`robottelo.cli.registry`, which
+        are recorded when read from the batch.
+    :param kwargs: passed through to :meth:`Base.execute_batch`. The timeout of the batch
+        defaults to the sum of the timeouts of the recorded commands.
+    """
+
+    def __init__(self, hostname=None, namespace=None, **kwargs):
+        self.hostname = hostname
+        self.namespace = namespace
+        self.kwargs = kwargs
+        self.requests = []
+        self.ignore_stderr = []
+        self.results = None
+        self.failed = None
+        self._recorders = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.run()
+
+    def __getattr__(self, name):
+        # only called for the names which are not attributes of the batch, i.e. the entities
+        if name.startswith('_') or self.namespace is None:
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+        return self.record(getattr(self.namespace, name))
+
+    def record(self, cli_class):
+        """Return a subclass of ``cli_class`` whose commands are recorded in the batch"""
+        if (recorder := self._recorders.get(cli_class)) is None:
+            batch = self
+
+            def execute(
+                cls,
+                command,
+                hostname=None,
+                user=None,
+                password=None,
+                output_format=None,
+                timeout=None,
+                ignore_stderr=None,
+                return_raw_response=None,
+            ):
+                try:
+                    request = cli_class._build_request(
+                        command,
+                        hostname or batch.hostname,
+                        user,
+                        password,
+                        output_format,
+                        timeout,
+                    )
+                except CLIOptionError:
+                    # rejected before running it, see Base._validate_request
+                    batch.failed = len(batch.requests)
+                    raise
+                return batch._queue(request, ignore_stderr)
+
+            recorder = type(
+                cli_class.__name__,
+                (cli_class,),
+                {'execute': classmethod(execute), '__module__': cli_class.__module__},
+            )
+            self._recorders[cli_class] = recorder
+        return recorder
+
+    def add(self, cli_class, command_sub, options=None, output_format=None, ignore_stderr=None):
+        """Queue ``hammer <cli_class.command_base> <command_sub> <options>``
+
+        Meant for the commands without a classmethod, see :meth:`record` otherwise.
+
+        :return: the index of the command in :attr:`results`.
+        """
+        command = HammerCommand(cli_class.command_base, command_sub, options, cli_class.command_end)
+        return self._queue(
+            cli_class._build_request(command, hostname=self.hostname, output_format=output_format),
+            ignore_stderr,
+        )
+
+    def _queue(self, request, ignore_stderr=None):
+        """Queue ``request``, its stderr is logged unless ``ignore_stderr`` or the batch's"""
+        self.requests.append(request)
+        if ignore_stderr is None:
+            ignore_stderr = self.kwargs.get('ignore_stderr')
+        self.ignore_stderr.append(ignore_stderr)
+        return len(self.requests) - 1
+
+    def run(self):
+        """Run all queued commands, see :meth:`Base.execute_batch`"""
+        if not self.requests:
+            self.results = []
+            return self.results
+        kwargs = {**self.kwargs, 'ignore_stderr': self.ignore_stderr, 'raise_on_error': False}
+        if kwargs.get('timeout') is None:
+            timeouts = [request.timeout for request in self.requests]
+            kwargs['timeout'] = sum(t for t in timeouts if isinstance(t, int)) or None
+        self.results = Base.execute_batch(self.requests, **kwargs)
+        if self.kwargs.get('raise_on_error', True):
+            for index, result in enumerate(self.results):
+                if not result.skipped and result.status != 0:
+                    self.failed = index
+                    Base._handle_response(result, request=result.request)
+        return self.results
+
+
+_BATCH_MARKER = '@@robottelo-batch@@'
+
+
+def _batch_script(command_lines, max_parallel=1, stop_on_error=True):
+    """Build a bash script running ``command_lines`` and reporting each of them
+
+    Every command reports one line with the marker, its index, its exit status and its base64
+    encoded stdout and stderr. Skipped commands report an empty status.
+    """
+    script = ['d=$(mktemp -d)', 'trap \'rm -rf "$d"\' EXIT']
+    for index, command_line in enumerate(command_lines):
+        script.append(f'cmd_{index}() {{\n{command_line}\n}}')
+    script.append('failed=0')
+    for index in range(len(command_lines)):
+        # the script itself is read from stdin, which the commands must not consume
+        run = (
+            f'(cmd_{index}) </dev/null >"$d/{index}.out" 2>"$d/{index}.err"; '
+            f'echo $? >"$d/{index}.rc"'
+        )
+        if max_parallel > 1:
+            script.append(
+                f'( {run} ) &\nwhile [ "$(jobs -rp | wc -l)" -ge {max_parallel} ]; do wait -n; done'
+            )
+        elif stop_on_error:
+            script.append(
+                f'if [ "$failed" = 0 ]; then {run}; [ "$(cat "$d/{index}.rc")" = 0 ] || failed=1; fi'
+            )
+        else:
+            script.append(run)
+    script.append('wait')
+    script.append(
+        f'for i in $(seq 0 {len(command_lines) - 1}); do '
+        f'echo "{_BATCH_MARKER} $i $(cat "$d/$i.rc" 2>/dev/null) '
+        f'$(base64 -w0 "$d/$i.out" 2>/dev/null) $(base64 -w0 "$d/$i.err" 2>/dev/null)"; done'
+    )
+    return "bash << 'ROBOTTELO_BATCH'\n{}\nROBOTTELO_BATCH".format('\n'.join(script))
+
+
+def _parse_batch_output(output):
+    """Return the (status, stdout, stderr) reported by a :func:`_batch_script` per command"""
+    outcomes = {}
+    for line in output.splitlines():
+        if not line.startswith(_BATCH_MARKER):
+            continue
+        # empty fields collapse with split(), keep them positional instead
+        index, status, stdout, stderr = (line[len(_BATCH_MARKER) + 1 :].split(' ') + [''] * 4)[:4]
+        outcomes[int(index)] = (
+            int(status) if status else None,
+            base64.b64decode(stdout).decode() if status else '',
+            base64.b64decode(stderr).decode() if status else '',
+        )
+    return [outcomes[index] for index in sorted(outcomes)]
+
+
 class Base:
     """Base class for hammer CLI interaction
 
     See Subcommands section in `hammer --help` output on your Satellite.
+
+    Each method builds its own :class:`HammerCommand`, and each call is turned into an immutable
+    :class:`CLIRequest`, so CLI classes can be used from several threads at once.
     """
 
     omitting_credentials = False
     command_base = None  # each inherited instance should define this
-    command_sub = None  # specific to instance, like: create, update, etc.
     command_end = None  # extending commands like for directory to pass
     command_requires_org = False  # True when command requires organization-id
+    command_paginated = True  # False when the list command has no --page/--per-page options
     hostname = None  # Now used for Satellite class hammer execution
     logger = logger
     _db_error_regex = re.compile(r'.*INSERT INTO|.*SELECT .*FROM|.*violates foreign key')
 
     @classmethod
-    def _handle_response(cls, response, ignore_stderr=None):
+    def _handle_response(cls, response, ignore_stderr=None, request=None):
         """Verify ``status`` of the CLI command.
 
         Check for a non-zero return code or any stderr contents.
@@ -36,6 +315,8 @@ class Base:
         :param response: a result object, returned by :mod:`robottelo.utils.ssh.command`.
         :param ignore_stderr: indicates whether to throw a warning in logs if
             ``stderr`` is not empty.
+        :param request: the :class:`CLIRequest` which produced the response, used to name the
+            command in errors.
         :return: contents of ``stdout``.
         :raises robottelo.exceptions.CLIReturnCodeError: If return code is
             different from zero.
@@ -49,8 +330,9 @@ class Base:
         if isinstance(response.stderr, bytes):
             response.stderr = response.stderr.decode()
         if response.status != 0:
+            command_name = request.name if request else cls.command_base
             full_msg = (
-                f'Command "{cls.command_base} {cls.command_sub}" '
+                f'Command "{command_name}" '
                 f'finished with status {response.status}\n'
                 f'stderr contains:\n{response.stderr}'
             )
@@ -68,9 +350,7 @@ class Base:
         Adds OS to record.
         """
 
-        cls.command_sub = 'add-operatingsystem'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-operatingsystem', options))
 
     @classmethod
     def ping(cls, options=None):
@@ -78,9 +358,7 @@ class Base:
         Display status of Satellite.
         """
 
-        cls.command_sub = 'ping'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('ping', options))
 
     @classmethod
     def create(cls, options=None, timeout=None):
@@ -88,12 +366,12 @@ class Base:
         Creates a new record using the arguments passed via dictionary.
         """
 
-        cls.command_sub = 'create'
-
         if options is None:
             options = {}
 
-        result = cls.execute(cls._construct_command(options), output_format='csv', timeout=timeout)
+        result = cls.execute(
+            cls._construct_command('create', options), output_format='csv', timeout=timeout
+        )
 
         # Extract new object ID if it was successfully created
         if len(result) > 0 and 'id' in result[0]:
@@ -129,8 +407,9 @@ class Base:
     @classmethod
     def delete(cls, options=None, timeout=None):
         """Deletes existing record."""
-        cls.command_sub = 'delete'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command('delete', options), ignore_stderr=True, timeout=timeout
+        )
 
     @classmethod
     def delete_parameter(cls, options=None, timeout=None):
@@ -138,9 +417,11 @@ class Base:
         Deletes parameter from record.
         """
 
-        cls.command_sub = 'delete-parameter'
-
-        return cls.execute(cls._construct_command(options), ignore_stderr=False, timeout=timeout)
+        return cls.execute(
+            cls._construct_command('delete-parameter', options),
+            ignore_stderr=False,
+            timeout=timeout,
+        )
 
     @classmethod
     def dump(cls, options=None, timeout=None):
@@ -148,9 +429,9 @@ class Base:
         Displays the content for existing partition table.
         """
 
-        cls.command_sub = 'dump'
-
-        return cls.execute(cls._construct_command(options), ignore_stderr=False, timeout=timeout)
+        return cls.execute(
+            cls._construct_command('dump', options), ignore_stderr=False, timeout=timeout
+        )
 
     @classmethod
     def _get_username_password(cls, username=None, password=None):
@@ -184,31 +465,212 @@ class Base:
         ignore_stderr=None,
         return_raw_response=None,
     ):
-        """Executes the cli ``command`` on the server via ssh"""
-        if cls.omitting_credentials:
+        """Executes the cli ``command`` on the server via ssh
+
+        When ``settings.performance.hammer_shell`` is enabled, the command is sent to a
+        long-lived hammer session, see :mod:`robottelo.cli.hammer_shell`. It is run in a
+        new hammer process whenever the session can't be used, or died while running it.
+
+        ``output_format='json-lazy'`` runs hammer with ``--output=json`` and returns a
+        :class:`robottelo.cli.hammer.HammerMapping`, which normalizes fields as they are read.
+        """
+        request = cls._build_request(command, hostname, user, password, output_format, timeout)
+        response = cls._send_request(request)
+        if return_raw_response:
+            return response
+        return cls._handle_response(response, ignore_stderr=ignore_stderr, request=request)
+
+    @classmethod
+    def _build_request(
+        cls, command, hostname=None, user=None, password=None, output_format=None, timeout=None
+    ):
+        """Resolve the hostname and credentials of a call into a :class:`CLIRequest`
+
+        When ``settings.performance.validate_hammer_options`` is enabled, the request is checked
+        against the hammer command index of its Satellite, see :meth:`_validate_request`.
+        """
+        omit_credentials = cls.omitting_credentials
+        if omit_credentials:
             user, password = None, None
         else:
             user, password = cls._get_username_password(user, password)
+        request = CLIRequest(
+            command=command,
+            command_base=getattr(command, 'command_base', cls.command_base),
+            command_sub=getattr(command, 'command_sub', None),
+            hostname=hostname or cls.hostname or settings.server.hostname,
+            user=user,
+            password=password,
+            omit_credentials=omit_credentials,
+            output_format=output_format,
+            timeout=timeout,
+        )
+        if settings.performance.validate_hammer_options:
+            cls._validate_request(request)
+        return request
+
+    @staticmethod
+    def _validate_request(request):
+        """Reject a command with an unknown subcommand or option without running it
+
+        Only commands built with ``_construct_command`` can be checked.
+
+        :raises robottelo.exceptions.CLIOptionError: when the subcommand or an option is unknown
+            to the hammer of the Satellite.
+        """
+        command = request.command
+        if not isinstance(command, HammerCommand) or not (
+            request.command_base and request.command_sub
+        ):
+            return
+        index = hammer.cached_command_index(request.hostname)
+        if index is None:
+            return
+        options = [
+            name
+            for name, value in command.options.items()
+            if value is not None and value is not False
+        ]
+        error = index.validate(f'hammer {request.command_base} {request.command_sub}', options)
+        if error:
+            raise CLIOptionError(
+                64,  # hammer's exit status for usage errors
+                error,
+                f'Command "{request.name}" was rejected before running it\n'
+                f'stderr contains:\n{error}',
+            )
+
+    @staticmethod
+    def _send_request(request, parse_output=True):
+        """Run a :class:`CLIRequest` on its Satellite and return the raw response
+
+        :param bool parse_output: parse ``stdout`` according to the output format of the
+            request, the text output by hammer is kept otherwise.
+        """
         time_hammer = settings.performance.time_hammer
 
+        if settings.performance.hammer_shell and not time_hammer and not request.omit_credentials:
+            try:
+                response = hammer_shell.execute(
+                    request.command,
+                    hostname=request.hostname,
+                    user=request.user,
+                    password=request.password,
+                    locale=settings.robottelo.locale,
+                    output_format=request.output_format,
+                    timeout=request.timeout,
+                    parse_output=parse_output,
+                )
+            except HammerShellError as err:
+                # the session is closed already, the next command starts a new one
+                logger.warning(f'Running "{request.name}" again in a new hammer process: {err}')
+                response = None
+            if response is not None:
+                return response
+
+        response = ssh.command(
+            Base._command_line(request),
+            hostname=request.hostname,
+            output_format=request.output_format if parse_output else None,
+            timeout=request.timeout,
+        )
+        if time_hammer:
+            Base._record_timing(request, response)
+        return response
+
+    @staticmethod
+    def _record_timing(request, response):
+        """Strip the ``time -p`` output from the stderr of ``response`` and record it
+
+        See :mod:`robottelo.cli.hammer_timing`.
+        """
+        response.stderr, times = hammer_timing.strip_time_output(response.stderr)
+        if times is not None:
+            hammer_timing.collector.record(request.name, times)
+
+    @staticmethod
+    def _command_line(request):
+        """Return the full shell command line running a :class:`CLIRequest` with hammer"""
         # add time to measure hammer performance
-        cmd = 'LANG={} {} hammer -v {} {} {} {}'.format(
+        return 'LANG={} {} hammer -v {} {} {} {}'.format(
             settings.robottelo.locale,
-            'time -p' if time_hammer else '',
-            f'-u {user}' if user else "--interactive no",
-            f'-p {password}' if password else "",
-            f'--output={output_format}' if output_format else "",
-            command,
-        )
-        response = ssh.command(
-            cmd,
-            hostname=hostname or cls.hostname or settings.server.hostname,
-            output_format=output_format,
-            timeout=timeout,
+            'time -p' if settings.performance.time_hammer else '',
+            f'-u {request.user}' if request.user else "--interactive no",
+            f'-p {request.password}' if request.password else "",
+            f'--output={hammer.output_option(request.output_format)}'
+            if request.output_format
+            else "",
+            request.command,
         )
-        if return_raw_response:
-            return response
-        return cls._handle_response(response, ignore_stderr=ignore_stderr)
+
+    @classmethod
+    def execute_batch(
+        cls,
+        commands,
+        hostname=None,
+        output_format=None,
+        max_parallel=1,
+        stop_on_error=True,
+        timeout=None,
+        ignore_stderr=None,
+        raise_on_error=True,
+    ):
+        """Executes several cli ``commands`` in a single ssh round-trip per Satellite
+
+        The commands are shipped as one remote script, which runs them one after the other, or
+        up to ``max_parallel`` of them at once.
+
+        :param commands: commands built with ``_construct_command``, or :class:`CLIRequest`
+            objects for commands with their own output format or credentials.
+        :param str output_format: output format of commands which are not a ``CLIRequest``.
+        :param int max_parallel: how many commands may run at the same time on the Satellite.
+        :param bool stop_on_error: skip the remaining commands once one of them failed, only
+            used when the commands run one after the other.
+        :param timeout: time to wait for the whole batch to finish.
+        :param ignore_stderr: don't log the stderr of the commands, a list gives the value of
+            each command.
+        :param bool raise_on_error: raise the error of the first failed command, like
+            :meth:`execute` would, once the batch finished.
+        :return: a list of :class:`CLIBatchResult`, in the order of ``commands``.
+        :raises robottelo.exceptions.CLIReturnCodeError: when a command failed.
+        :raises robottelo.exceptions.CLIDataBaseError: when a command failed on a database
+            error.
+        """
+        requests = [
+            command
+            if isinstance(command, CLIRequest)
+            else cls._build_request(command, hostname=hostname, output_format=output_format)
+            for command in commands
+        ]
+        results = [None] * len(requests)
+        batches = {}
+        for index, request in enumerate(requests):
+            batches.setdefault(request.hostname, []).append(index)
+        for batch_hostname, indexes in batches.items():
+            script = _batch_script(
+                [cls._command_line(requests[index]) for index in indexes],
+                max_parallel=max_parallel,
+                stop_on_error=stop_on_error,
+            )
+            response = ssh.command(script, hostname=batch_hostname, timeout=timeout)
+            outcomes = _parse_batch_output(response.stdout)
+            if len(outcomes) != len(indexes):
+                raise CLIError(
+                    f'hammer batch on {batch_hostname} finished with status {response.status}, '
+                    f'reporting {len(outcomes)} of {len(indexes)} commands\n{response.stderr}'
+                )
+            for index, (status, stdout, stderr) in zip(indexes, outcomes, strict=True):
+                results[index] = CLIBatchResult(requests[index], status, stdout, stderr)
+                if settings.performance.time_hammer:
+                    cls._record_timing(requests[index], results[index])
+        if not isinstance(ignore_stderr, list | tuple):
+            ignore_stderr = [ignore_stderr] * len(results)
+        for result, ignore in zip(results, ignore_stderr, strict=True):
+            if result.skipped or (result.status != 0 and not raise_on_error):
+                continue
+            stdout = cls._handle_response(result, ignore_stderr=ignore, request=result.request)
+            result.output = hammer.parse_output(stdout, result.request.output_format)
+        return results
 
     @classmethod
     def sm_execute(cls, command, hostname=None, timeout=None, **kwargs):
@@ -222,7 +684,7 @@ class Base:
         """Search for an entity using the query ``search[0]="search[1]"``
 
         Will be used the ``list`` command with the ``--search`` option to do
-        the search.
+        the search, only the first matching entity is fetched.
 
         If ``options`` argument already have a search key, then the ``search``
         argument will not be evaluated. Which allows different search query.
@@ -235,16 +697,12 @@ class Base:
         if search is not None and 'search' not in options:
             options.update({'search': f'{search[0]}=\\"{search[1]}\\"'})
 
-        result = cls.list(options)
-        if result:
-            result = result[0]
-
-        return result
+        result = cls.first(options)
+        return [] if result is None else result
 
     @classmethod
     def info(cls, options=None, output_format=None, return_raw_response=None):
         """Reads the entity information."""
-        cls.command_sub = 'info'
 
         if options is None:
             options = {}
@@ -253,11 +711,11 @@ class Base:
             raise CLIError(f'organization-id option is required for {cls.__name__}.info')
 
         result = cls.execute(
-            command=cls._construct_command(options),
+            command=cls._construct_command('info', options),
             output_format=output_format,
             return_raw_response=return_raw_response,
         )
-        if not return_raw_response and output_format != 'json':
+        if not return_raw_response and output_format not in ('json', hammer.JSON_LAZY):
             result = hammer.parse_info(result)
         return result
 
@@ -268,8 +726,6 @@ class Base:
         @param options: ID (sometimes name works as well) to retrieve info.
         """
 
-        cls.command_sub = 'list'
-
         if options is None:
             options = {}
 
@@ -282,7 +738,59 @@ class Base:
         # if cls.command_requires_org and 'organization-id' not in options:
         #     raise CLIError(f'organization-id option is required for {cls.__name__}.list')
 
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(cls._construct_command('list', options), output_format=output_format)
+
+    @classmethod
+    def list_iter(cls, options=None, page_size=1000):
+        """Iterate over the entities of the ``list`` command, one page at a time
+
+        A page is only fetched once all the entities of the previous page were consumed, and
+        its rows are parsed as they are consumed, so stopping early saves both hammer calls and
+        memory. Commands which are not paginated are fetched in one call.
+
+        :param dict options: options of the ``list`` command, ``page`` and ``per-page`` are
+            set by the iterator.
+        :param int page_size: number of entities fetched by each hammer call.
+        :return: a generator of dictionaries, like the items returned by :meth:`list`.
+        """
+        options = dict(options or {})
+        for page in itertools.count(1):
+            if cls.command_paginated:
+                options.update({'page': page, 'per-page': page_size})
+            request = cls._build_request(
+                cls._construct_command('list', options), output_format='csv'
+            )
+            stdout = cls._handle_response(
+                cls._send_request(request, parse_output=False), request=request
+            )
+            rows = 0
+            for row in hammer.iter_csv(io.StringIO(stdout or '')):
+                rows += 1
+                yield row
+            if not cls.command_paginated or rows < page_size:
+                return
+
+    @classmethod
+    def first(cls, options=None):
+        """Return the first entity of the ``list`` command, or ``None`` when there is none
+
+        The entities are listed by :meth:`list`, which subclasses may override, a single one
+        being fetched when the command is paginated.
+        """
+        options = dict(options or {})
+        if cls.command_paginated:
+            options['per-page'] = 1
+        return next(iter(cls.list(options) or ()), None)
+
+    @classmethod
+    def count(cls, options=None, limit=None, page_size=1000):
+        """Count the entities of the ``list`` command
+
+        :param int limit: stop counting, and fetching pages, once ``limit`` entities were found.
+        """
+        if limit is not None:
+            page_size = min(page_size, limit)
+        return sum(1 for _ in itertools.islice(cls.list_iter(options, page_size), limit))
 
     @classmethod
     def puppetclasses(cls, options=None):
@@ -290,9 +798,7 @@ class Base:
         Lists all puppet classes.
         """
 
-        cls.command_sub = 'puppet-classes'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('puppet-classes', options), output_format='csv')
 
     @classmethod
     def remove_operating_system(cls, options=None):
@@ -300,9 +806,7 @@ class Base:
         Removes OS from record.
         """
 
-        cls.command_sub = 'remove-operatingsystem'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-operatingsystem', options))
 
     @classmethod
     def sc_params(cls, options=None):
@@ -310,9 +814,7 @@ class Base:
         Lists all smart class parameters.
         """
 
-        cls.command_sub = 'sc-params'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('sc-params', options), output_format='csv')
 
     @classmethod
     def set_parameter(cls, options=None):
@@ -320,9 +822,7 @@ class Base:
         Creates or updates parameter for a record.
         """
 
-        cls.command_sub = 'set-parameter'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('set-parameter', options))
 
     @classmethod
     def update(cls, options=None, return_raw_response=None):
@@ -330,10 +830,8 @@ class Base:
         Updates existing record.
         """
 
-        cls.command_sub = 'update'
-
         return cls.execute(
-            cls._construct_command(options),
+            cls._construct_command('update', options),
             output_format='csv',
             return_raw_response=return_raw_response,
         )
@@ -354,20 +852,6 @@ class Base:
         return Wrapper
 
     @classmethod
-    def _construct_command(cls, options=None):
-        """Build a hammer cli command based on the options passed"""
-        tail = ''
-
-        if options is None:
-            options = {}
-
-        for key, val in options.items():
-            if val is None:
-                continue
-            if val is True:
-                tail += f' --{key}'
-            elif val is not False:
-                if isinstance(val, list):
-                    val = ','.join(str(el) for el in val)
-                tail += f' --{key}="{val}"'
-        return f"{cls.command_base or ''} {cls.command_sub or ''} {tail.strip()} {cls.command_end or ''}"
+    def _construct_command(cls, command_sub, options=None):
+        """Build the hammer cli command ``command_sub`` based on the options passed"""
+        return HammerCommand(cls.command_base, command_sub, options, cls.command_end)
@@ -26,17 +26,14 @@ class Bootdisk(Base):
     @classmethod
     def generic(cls, options=None):
         """Download generic image"""
-        cls.command_sub = 'generic'
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(cls._construct_command('generic', options), output_format='json')
 
     @classmethod
     def host(cls, options=None):
         """Download host image"""
-        cls.command_sub = 'host'
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(cls._construct_command('host', options), output_format='json')
 
     @classmethod
     def subnet(cls, options=None):
         """Download subnet generic image"""
-        cls.command_sub = 'subnet'
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(cls._construct_command('subnet', options), output_format='json')
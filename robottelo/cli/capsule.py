@@ -34,58 +34,57 @@ class Capsule(Base):
     def content_add_lifecycle_environment(cls, options):
         """Add lifecycle environments to the capsule."""
 
-        cls.command_sub = 'content add-lifecycle-environment'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('content add-lifecycle-environment', options),
+            output_format='csv',
+        )
 
     @classmethod
     def content_available_lifecycle_environments(cls, options):
         """List the lifecycle environments not attached to the capsule."""
 
-        cls.command_sub = 'content available-lifecycle-environments'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('content available-lifecycle-environments', options),
+            output_format='csv',
+        )
 
     @classmethod
     def content_info(cls, options):
         """Get current capsule synchronization status."""
 
-        cls.command_sub = 'content info'
-
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(cls._construct_command('content info', options), output_format='json')
 
     @classmethod
     def content_lifecycle_environments(cls, options):
         """List the lifecycle environments attached to the capsule."""
 
-        cls.command_sub = 'content lifecycle-environments'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('content lifecycle-environments', options), output_format='csv'
+        )
 
     @classmethod
     def content_remove_lifecycle_environment(cls, options):
         """Remove lifecycle environments from the capsule."""
 
-        cls.command_sub = 'content remove-lifecycle-environment'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('content remove-lifecycle-environment', options),
+            output_format='csv',
+        )
 
     @classmethod
     def content_synchronization_status(cls, options):
         """Get current capsule synchronization status."""
 
-        cls.command_sub = 'content synchronization-status'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('content synchronization-status', options), output_format='csv'
+        )
 
     @classmethod
     def content_synchronize(cls, options, return_raw_response=None, timeout=3600000):
         """Synchronize the content to the capsule."""
 
-        cls.command_sub = 'content synchronize'
-
         return cls.execute(
-            cls._construct_command(options),
+            cls._construct_command('content synchronize', options),
             output_format='csv',
             ignore_stderr=True,
             return_raw_response=return_raw_response,
@@ -96,30 +95,26 @@ class Capsule(Base):
     def content_update_counts(cls, options):
         """Trigger content counts update."""
 
-        cls.command_sub = 'content update-counts'
-
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(
+            cls._construct_command('content update-counts', options), output_format='json'
+        )
 
     @classmethod
     def content_verify_checksum(cls, options):
         """Trigger verify checksum task."""
 
-        cls.command_sub = 'content verify-checksum'
-
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(
+            cls._construct_command('content verify-checksum', options), output_format='json'
+        )
 
     @classmethod
     def import_classes(cls, options):
         """Import puppet classes from puppet Capsule."""
 
-        cls.command_sub = 'import-classes'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('import-classes', options), output_format='csv')
 
     @classmethod
     def refresh_features(cls, options):
         """Refresh capsule features."""
 
-        cls.command_sub = 'refresh-features'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('refresh-features', options), output_format='csv')
@@ -34,6 +34,4 @@ class ContentCredential(Base):
         Gets information for a content credential
         """
 
-        cls.command_sub = 'info'
-
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(cls._construct_command('info', options), output_format='json')
@@ -36,17 +36,17 @@ class ContentExport(Base):
         """
         List previous exports
         """
-        cls.command_sub = 'list'
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(cls._construct_command('list', options), output_format=output_format)
 
     @classmethod
     def completeLibrary(cls, options, output_format='json', timeout=None):
         """
         Make full library export
         """
-        cls.command_sub = 'complete library'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command('complete library', options),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -54,9 +54,10 @@ class ContentExport(Base):
         """
         Make full repository export
         """
-        cls.command_sub = 'complete repository'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command('complete repository', options),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -64,9 +65,10 @@ class ContentExport(Base):
         """
         Make full CV version export
         """
-        cls.command_sub = 'complete version'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command('complete version', options),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -74,9 +76,10 @@ class ContentExport(Base):
         """
         Make incremental library export
         """
-        cls.command_sub = 'incremental library'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command('incremental library', options),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -84,9 +87,10 @@ class ContentExport(Base):
         """
         Make incremental repository export
         """
-        cls.command_sub = 'incremental repository'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command('incremental repository', options),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -94,9 +98,10 @@ class ContentExport(Base):
         """
         Make incremental CV version export
         """
-        cls.command_sub = 'incremental version'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command('incremental version', options),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -104,5 +109,6 @@ class ContentExport(Base):
         """
         Generates export metadata
         """
-        cls.command_sub = 'generate-metadata'
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(
+            cls._construct_command('generate-metadata', options), output_format=output_format
+        )
@@ -31,35 +31,29 @@ class DiscoveredHost(Base):
     @classmethod
     def provision(cls, options=None):
         """Manually provision discovered host"""
-        cls.command_sub = 'provision'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('provision', options), output_format='csv')
 
     @classmethod
     def facts(cls, options=None):
         """Get all the facts associated with discovered host"""
-        cls.command_sub = 'facts'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('facts', options), output_format='csv')
 
     @classmethod
     def auto_provision(cls, options=None):
         """Auto provision discovered host"""
-        cls.command_sub = 'auto-provision'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('auto-provision', options), output_format='csv')
 
     @classmethod
     def reboot(cls, options=None):
         """Reboot discovered host"""
-        cls.command_sub = 'reboot'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('reboot', options), output_format='csv')
 
     @classmethod
     def refresh_facts(cls, options=None):
         """Refresh facts associated with discovered host"""
-        cls.command_sub = 'refresh-facts'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('refresh-facts', options), output_format='csv')
 
     @classmethod
     def list(cls, options=None):
         """List all the discovered host"""
-        cls.command_sub = 'list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('list', options), output_format='csv')
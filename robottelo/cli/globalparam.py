@@ -28,5 +28,4 @@ class GlobalParameter(Base):
     @classmethod
     def set(cls, options=None):
         """Set global parameter"""
-        cls.command_sub = 'set'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('set', options))
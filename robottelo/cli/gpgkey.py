@@ -34,6 +34,4 @@ class GPGKey(Base):
         Gets information for GPG Key
         """
 
-        cls.command_sub = 'info'
-
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(cls._construct_command('info', options), output_format='json')
@@ -1,10 +1,23 @@
 """Helpers to interact with hammer command line utility."""
 
+from collections.abc import Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import csv
+import difflib
+import hashlib
 import json
 import re
+import threading
 
-from robottelo.logging import logger
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from robottelo.logging import logger, robottelo_root_dir
+
+# output format of Base.execute/Base.info returning a lazy HammerMapping from hammer JSON output
+JSON_LAZY = 'json-lazy'
 
 
 def _normalize(header):
@@ -12,17 +25,46 @@ def _normalize(header):
     return header.replace(' ', '-').lower()
 
 
+def output_option(output_format):
+    """Return the value of the hammer ``--output`` option for ``output_format``"""
+    return 'json' if output_format == JSON_LAZY else output_format
+
+
+def _last_json_object(stdout):
+    """Return the last JSON object of ``stdout``, hammer may print one per API call"""
+    new_object_index = stdout.find('\n}\n{')
+    if new_object_index > -1:
+        stdout = stdout[new_object_index + 3 :]  # noqa: E203
+    return stdout
+
+
+def _loads(stdout):
+    """Decode JSON with orjson when it is installed, with the json module otherwise"""
+    if orjson is not None:
+        try:
+            return orjson.loads(stdout)
+        except orjson.JSONDecodeError:
+            # e.g. integers beyond 64 bits, json reports genuinely invalid documents
+            pass
+    return json.loads(stdout)
+
+
 def parse_json(stdout):
     """Parse JSON output from Hammer CLI and convert it to python dictionary
     while normalizing keys.
     """
-    new_object_index = stdout.find('\n}\n{')
-    if new_object_index > -1:
-        stdout = stdout[new_object_index + 3 :]  # noqa: E203
-    parsed = json.loads(stdout)
+    parsed = _loads(_last_json_object(stdout))
     return _normalize_obj(parsed)
 
 
+def parse_json_lazy(stdout):
+    """Parse JSON output from Hammer CLI into a :class:`HammerMapping`
+
+    Unlike :func:`parse_json`, keys and values are only normalized when they are accessed.
+    """
+    return _lazy(_loads(_last_json_object(stdout)))
+
+
 def _normalize_obj(obj):
     """Normalize all dict's keys replacing empty spaces with "-" and lowering
     chars
@@ -37,23 +79,147 @@ def _normalize_obj(obj):
     return obj
 
 
+def _lazy(obj):
+    """Wrap a decoded JSON value the way :func:`_normalize_obj` would normalize it"""
+    if isinstance(obj, dict):
+        return HammerMapping(obj)
+    if isinstance(obj, list):
+        return HammerList(obj)
+    if isinstance(obj, int) and not isinstance(obj, bool):
+        return str(obj)
+    return obj
+
+
+# normalized key -> raw key maps, shared by the objects with the same keys, e.g. rows of a list
+_KEY_MAPS = {}
+_KEY_MAPS_MAX_SIZE = 4096
+
+
+def _key_map(raw):
+    """Return the normalized key -> raw key map of the decoded JSON object ``raw``"""
+    shape = tuple(raw)
+    key_map = _KEY_MAPS.get(shape)
+    if key_map is None:
+        if len(_KEY_MAPS) >= _KEY_MAPS_MAX_SIZE:
+            _KEY_MAPS.clear()
+        key_map = _KEY_MAPS[shape] = {_normalize(key): key for key in shape}
+    return key_map
+
+
+class HammerMapping(Mapping):
+    """Read-only view of a decoded hammer JSON object
+
+    It compares equal to the dictionary :func:`parse_json` returns for the same output, but a
+    key is only normalized, and a value only wrapped or converted, when it is accessed.
+    """
+
+    __slots__ = ('_raw', '_keys')
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._keys = None  # normalized key -> raw key, set on first access
+
+    def __getitem__(self, key):
+        keys = self._keys
+        if keys is None:
+            keys = self._keys = _key_map(self._raw)
+        return _lazy(self._raw[keys[key]])
+
+    def __iter__(self):
+        if self._keys is None:
+            self._keys = _key_map(self._raw)
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.normalized()!r})'
+
+    def normalized(self):
+        """Return the plain dictionary :func:`parse_json` would have returned"""
+        return _normalize_obj(self._raw)
+
+
+class HammerList(Sequence):
+    """Read-only view of a decoded hammer JSON array, see :class:`HammerMapping`"""
+
+    __slots__ = ('_raw',)
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return HammerList(self._raw[index])
+        return _lazy(self._raw[index])
+
+    def __iter__(self):
+        return map(_lazy, self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __eq__(self, other):
+        if isinstance(other, HammerList | list | tuple):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.normalized()!r})'
+
+    def normalized(self):
+        """Return the plain list :func:`parse_json` would have returned"""
+        return _normalize_obj(self._raw)
+
+
 def parse_csv(output):
     """Parse CSV output from Hammer CLI and return a Python dictionary."""
     output = output.splitlines()
 
-    # Normalize the column names to use when generating the dictionary
     try:
-        keys = [_normalize(header) for header in next(csv.reader(output))]
-        return [value for value in csv.DictReader(output[1:], fieldnames=keys)]
+        return list(iter_csv(output))
     except csv.Error as err:
         logger.error(f'Exception while parsing CSV output {output}: {err}')
         raise
 
 
-def parse_help(output):
+def iter_csv(lines):
+    """Parse CSV output from Hammer CLI, yielding a dictionary per row
+
+    :param lines: an iterable of the output lines, e.g. a file object, which is only consumed
+        as the rows are.
+    """
+    lines = iter(lines)
+    # Normalize the column names to use when generating the dictionary
+    header = next(csv.reader(lines), None)
+    if header is None:
+        return
+    yield from csv.DictReader(lines, fieldnames=[_normalize(name) for name in header])
+
+
+def parse_output(output, output_format):
+    """Parse hammer ``output`` produced with ``--output=<output_format>``
+
+    Output of any other format is returned unchanged.
+    """
+    if output_format == 'csv':
+        return parse_csv(output) if output else {}
+    if output_format == 'json':
+        return parse_json(output) if output else None
+    if output_format == JSON_LAZY:
+        return parse_json_lazy(output) if output else None
+    return output
+
+
+def parse_help(output, aliases=False):
     """Parse the help output from a hammer command and return a dictionary
     mapping the subcommands and options accepted by that command.
 
+    :param bool aliases: add the ``aliases`` of each option, its deprecated name as in
+        ``--name, --deprecated-name`` and its negation as in ``--[no-]verbose``.
     """
     # Parsing states
     state = 0
@@ -62,7 +228,7 @@ def parse_help(output):
 
     contents = {'subcommands': [], 'options': []}
     option_regex = re.compile(
-        r'^ (-(?P<shortname>\w), )?(--(\[.*?\])?(?P<name>[\w\[\]|-]+))?'
+        r'^ (-(?P<shortname>\w), )?(--(?P<negation>\[no-\])?(\[.*?\])?(?P<name>[\w\[\]|-]+))?'
         r'(, --(?P<deprecation_name>[\w-]+))?( (?P<value>[\w-]+))?\s+(?P<help>.*)$'
     )
     subcommand_regex = re.compile(r'^ (?P<name>[\w-]+)?(, [\w-]+)?\s+(?P<description>.*)$')
@@ -96,14 +262,22 @@ def parse_help(output):
             if match.group('name') is None:
                 contents['options'][-1]['help'] += ' {}'.format(match.group('help'))
             else:
-                contents['options'].append(
-                    {
-                        'name': match.group('name'),
-                        'shortname': match.group('shortname'),
-                        'value': match.group('value'),
-                        'help': match.group('help'),
-                    }
-                )
+                option = {
+                    'name': match.group('name'),
+                    'shortname': match.group('shortname'),
+                    'value': match.group('value'),
+                    'help': match.group('help'),
+                }
+                if aliases:
+                    option['aliases'] = [
+                        alias
+                        for alias in (
+                            match.group('deprecation_name'),
+                            match.group('negation') and f'no-{match.group("name")}',
+                        )
+                        if alias
+                    ]
+                contents['options'].append(option)
 
     # handle multiple options disguised as one, e.g. --hostgroup[s|-ids|-titles]
     grouped_option_regex = re.compile(r'^(?P<prefix>[\w-]+)\[(?P<postfixes>\S+)\]$')
@@ -125,6 +299,258 @@ def parse_help(output):
     return contents
 
 
+def parse_version(output):
+    """Parse the output of ``hammer --version`` into a dictionary mapping hammer and each of
+    its plugins to their version.
+
+    """
+    return {
+        match.group('name'): match.group('version')
+        for match in re.finditer(r'^[\s*]*(?P<name>[\w-]+) \((?P<version>[^)]+)\)', output, re.M)
+    }
+
+
+def crawl_command_tree(hostname=None, max_workers=8, command='hammer'):
+    """Fetch the help of ``command`` and of all its subcommands, recursively
+
+    Help pages are fetched by ``max_workers`` threads at once, each of them reusing its own
+    pooled ssh connection, see :data:`robottelo.ssh.connection_pool`.
+
+    :return: a dictionary with the ``options`` and ``subcommands`` of ``command``, where every
+        subcommand has its own ``options`` and ``subcommands``, like ``hammer_commands.json``.
+    """
+    from robottelo import ssh
+
+    def fetch_help(command):
+        return parse_help(ssh.command(f'{command} --help', hostname=hostname).stdout, aliases=True)
+
+    tree = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(fetch_help, command): (command, tree)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                node_command, node = pending.pop(future)
+                node.update(future.result())
+                for subcommand in node['subcommands']:
+                    subcommand_command = f'{node_command} {subcommand["name"]}'
+                    future = executor.submit(fetch_help, subcommand_command)
+                    pending[future] = (subcommand_command, subcommand)
+    return tree
+
+
+def command_tree_key(hostname=None):
+    """Return the versions which identify the hammer command tree of a Satellite"""
+    from robottelo import ssh
+
+    satellite = ssh.command('rpm -q --qf "%{VERSION}" satellite', hostname=hostname)
+    return {
+        'satellite': satellite.stdout.strip() if satellite.status == 0 else None,
+        'hammer': parse_version(ssh.command('hammer --version', hostname=hostname).stdout),
+    }
+
+
+class HammerCommandIndex:
+    """Index of a hammer command tree with constant time lookups
+
+    Commands are looked up by their full name, e.g. ``'hammer content-view publish'``. The index
+    is saved to disk as a flat, compact JSON file named after its ``key``, the Satellite and
+    hammer plugin versions it was crawled from.
+
+    :param dict commands: maps every command name to a dictionary with its ``description``, its
+        ``options`` by name and the descriptions of its ``subcommands`` by name. Options are
+        looked up by their ``aliases`` as well.
+    :param dict key: the versions the index was built for, see :func:`command_tree_key`.
+    """
+
+    FORMAT = 2
+    OPTION_FIELDS = ('shortname', 'value', 'help', 'aliases')
+
+    def __init__(self, commands, key=None):
+        self.key = key or {}
+        self._commands = commands
+        self._aliases = {
+            name: {
+                alias: option['name']
+                for option in command['options'].values()
+                for alias in option.get('aliases') or ()
+            }
+            for name, command in commands.items()
+        }
+
+    def __contains__(self, command):
+        return command in self._commands
+
+    def __iter__(self):
+        return iter(self._commands)
+
+    def __len__(self):
+        return len(self._commands)
+
+    def description(self, command):
+        """Return the description of ``command``, as shown in the help of its parent"""
+        return self._commands[command]['description']
+
+    def subcommands(self, command):
+        """Return the names of the subcommands of ``command``"""
+        return list(self._commands[command]['subcommands'])
+
+    def options(self, command):
+        """Return the options of ``command``, keyed by name"""
+        return self._commands[command]['options']
+
+    def option(self, command, name):
+        """Return the option ``name`` of ``command``, ``None`` when there is no such option"""
+        name = self._aliases[command].get(name, name)
+        return self._commands[command]['options'].get(name)
+
+    def validate(self, command, options=()):
+        """Check ``command`` and its ``options`` exist, without running hammer
+
+        :param str command: the full command name, e.g. ``'hammer content-view publish'``.
+        :param options: names of the options passed to the command, without dashes.
+        :return: the error hammer would report, with close matches when there are any, or
+            ``None`` when the command is valid.
+        """
+        words = command.split()
+        path = words[0]
+        for word in words[1:]:
+            if f'{path} {word}' not in self._commands:
+                hint = self._hint(word, self._commands[path]['subcommands'], '')
+                return f"Error: No such sub-command '{word}' for '{path}'.{hint}"
+            path = f'{path} {word}'
+        known_options = self._commands[path]['options']
+        aliases = self._aliases[path]
+        for name in options:
+            if name not in known_options and name not in aliases:
+                hint = self._hint(name, known_options, '--')
+                return (
+                    f"Error: Unrecognised option '--{name}' for '{path}'.{hint}\n\n"
+                    f"See: '{path} --help'."
+                )
+        return None
+
+    @staticmethod
+    def _hint(word, candidates, prefix):
+        matches = difflib.get_close_matches(word, candidates, n=3)
+        if not matches:
+            return ''
+        return ' Did you mean {}?'.format(', '.join(f"'{prefix}{match}'" for match in matches))
+
+    @classmethod
+    def from_tree(cls, tree, key=None, command='hammer'):
+        """Build an index from a tree returned by :func:`crawl_command_tree`"""
+        commands = {}
+        nodes = [(command, tree)]
+        while nodes:
+            name, node = nodes.pop()
+            commands[name] = {
+                'description': node.get('description'),
+                'options': {option['name']: option for option in node['options']},
+                'subcommands': {
+                    subcommand['name']: subcommand['description']
+                    for subcommand in node['subcommands']
+                },
+            }
+            nodes.extend((f'{name} {sub["name"]}', sub) for sub in node['subcommands'])
+        return cls(commands, key=key)
+
+    def to_tree(self, command='hammer'):
+        """Return the tree of ``command``, in the format of :func:`crawl_command_tree`"""
+        node = self._commands[command]
+        return {
+            'options': list(node['options'].values()),
+            'subcommands': [
+                {'name': name, 'description': description, **self.to_tree(f'{command} {name}')}
+                for name, description in node['subcommands'].items()
+            ],
+        }
+
+    @classmethod
+    def path(cls, key, directory=None):
+        """Return the path of the index file for ``key`` in ``directory``"""
+        directory = directory or robottelo_root_dir.joinpath('.hammer_command_index')
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+        return directory.joinpath(f'hammer-{key.get("satellite")}-{digest}.json')
+
+    def save(self, directory=None):
+        """Write the index to ``directory`` and return the path of the file"""
+        commands = {
+            name: [
+                command['description'],
+                [
+                    [option['name'], *(option.get(field) for field in self.OPTION_FIELDS)]
+                    for option in command['options'].values()
+                ],
+                list(command['subcommands'].items()),
+            ]
+            for name, command in self._commands.items()
+        }
+        path = self.path(self.key, directory)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'format': self.FORMAT, 'key': self.key, 'commands': commands}
+        path.write_text(json.dumps(data, separators=(',', ':')))
+        return path
+
+    @classmethod
+    def load(cls, key, directory=None):
+        """Read the index saved for ``key``, ``None`` when there is none or it is outdated"""
+        path = cls.path(key, directory)
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text())
+        if data.get('format') != cls.FORMAT or data.get('key') != key:
+            return None
+        commands = {
+            name: {
+                'description': description,
+                'options': {
+                    option[0]: dict(zip(('name', *cls.OPTION_FIELDS), option, strict=True))
+                    for option in options
+                },
+                'subcommands': dict(subcommands),
+            }
+            for name, (description, options, subcommands) in data['commands'].items()
+        }
+        return cls(commands, key=key)
+
+
+def get_command_index(hostname=None, directory=None, refresh=False, max_workers=8):
+    """Return the hammer command index of a Satellite
+
+    The index is read from ``directory`` when it was already built for the Satellite and hammer
+    plugin versions of ``hostname``. It is crawled and saved there otherwise, or when ``refresh``
+    is set.
+    """
+    key = command_tree_key(hostname)
+    index = None if refresh else HammerCommandIndex.load(key, directory)
+    if index is None:
+        logger.info(f'Building hammer command index for {key}')
+        tree = crawl_command_tree(hostname=hostname, max_workers=max_workers)
+        index = HammerCommandIndex.from_tree(tree, key=key)
+        index.save(directory)
+    return index
+
+
+_command_indexes = {}
+_command_indexes_lock = threading.Lock()
+
+
+def cached_command_index(hostname):
+    """Return the command index of ``hostname``, fetched once per process
+
+    ``None`` is returned, and kept for the rest of the process, when the index can't be built.
+    """
+    with _command_indexes_lock:
+        if hostname not in _command_indexes:
+            try:
+                _command_indexes[hostname] = get_command_index(hostname)
+            except Exception as err:
+                logger.warning(f'Unable to get the hammer command index of {hostname}: {err}')
+                _command_indexes[hostname] = None
+        return _command_indexes[hostname]
+
+
 def get_line_indentation_spaces(line, tab_spaces=4):
     """Return the number of spaces chars the line begin with
 
@@ -133,16 +559,8 @@ def get_line_indentation_spaces(line, tab_spaces=4):
     """
     if not line or len(line) < tab_spaces:
         return 0
-    spaces = 0
-    for char in line:
-        if char not in (' ', '\t'):
-            break
-        if char == '\t':
-            spaces += tab_spaces
-        else:
-            spaces += 1
-
-    return spaces
+    indentation = line[: len(line) - len(line.lstrip(' \t'))]
+    return len(indentation) + indentation.count('\t') * (tab_spaces - 1)
 
 
 def get_line_indentation_level(line, tab_spaces=4, indentation_spaces=4):
@@ -169,8 +587,20 @@ def get_line_indentation_level(line, tab_spaces=4, indentation_spaces=4):
     return spaces // indentation_spaces + (1 if spaces % indentation_spaces > 0 else 0)
 
 
+# value of a numbered list, e.g. ' 1) template1'
+_INFO_NUMBERED_VALUE_REGEX = re.compile(r'\d+\)\s+(.+)$')
+# key of a numbered list of dicts, e.g. ' 1) Repo Name: repo1'
+_INFO_NUMBERED_KEY_REGEX = re.compile(r'(\d+)\)')
+_INFO_NUMBER_REGEX = re.compile(r'\d+\)')
+
+
 def parse_info(output):
-    """Parse the info output and returns a dict mapping the values."""
+    """Parse the info output and returns a dict mapping the values.
+
+    The output is parsed in a single pass, every line is either a top level property, a
+    ``key: value`` (or ``key => value``) sub-property or a value of a list sub-property. The
+    position in the output is tracked by ``sub_prop``, ``sub_num`` and ``second_level_key``.
+    """
     # info dictionary
     contents = {}
     sub_prop = None  # stores name of the last group of sub-properties
@@ -181,111 +611,115 @@ def parse_info(output):
         # skip empty lines and dividers
         if line == '' or line == '---':
             continue
-        current_indent_level = get_line_indentation_level(line)
-        if current_indent_level <= 1:
+        stripped = line.lstrip()
+        first_char = line[0]
+        if first_char != ' ' and first_char != '\t':
+            indent_level = 0
+        elif len(line) < 4:
+            # same as get_line_indentation_level, inlined as it runs for every line
+            indent_level = 0
+        else:
+            indentation = line[: len(line) - len(line.lstrip(' \t'))]
+            indent_level = (len(indentation) + indentation.count('\t') * 3 + 3) // 4
+        if indent_level <= 1:
             # we are entering or leaving a second level from lower/upper levels
             # clear the second level key
             second_level_key = None
-        if line.startswith(' '):  # sub-properties are indented
-            # values are separated by ':' or '=>', but not by '::' which can be
-            # entity name like 'test::params::keys'
-            if line.find(':') != -1 and line.find('::') == -1:
-                key, value = line.lstrip().split(":", 1)
-            elif line.find('=>') != -1 and len(line.lstrip().split(" =>", 1)) == 2:
-                key, value = line.lstrip().split(" =>", 1)
-            else:
-                key = value = None
-
-            if key is None and value is None:
-                # Parse single attribute collection properties
-                # Template
-                #  1) template1
-                #  2) template2
-                #
-                # or
-                # Template
-                #  template1
-                #  template2
-                match = re.match(r'\d+\)\s+(.+)$', line.lstrip())
-
-                if match is None:
-                    match = re.match(r'(.*)$', line.lstrip())
 
-                value = match.group(1)
+        if first_char != ' ':
+            sub_num = None  # new property implies no sub property
+            key, value = stripped.split(':', 1)
+            key = key.replace(' ', '-').lower()
+            value = value.lstrip()
+            if value:  # 'key: value' line
+                contents[key] = value
+            else:  # 'key:' no value, new sub-property
+                sub_prop = key
+                contents[sub_prop] = {}
+            continue
 
+        # sub-properties are indented, values are separated by ':' or '=>', but not by '::'
+        # which can be entity name like 'test::params::keys'
+        if ':' in line and '::' not in line:
+            key, value = stripped.split(':', 1)
+        elif ' =>' in stripped:
+            key, value = stripped.split(' =>', 1)
+        else:
+            # Parse single attribute collection properties
+            # Template
+            #  1) template1
+            #  2) template2
+            #
+            # or
+            # Template
+            #  template1
+            #  template2
+            match = _INFO_NUMBERED_VALUE_REGEX.match(stripped)
+            value = stripped if match is None else match.group(1)
+            group = contents[sub_prop]
+            if isinstance(group, dict) and not group:
                 # adding list to 1 level, for example:
                 # {'template': ['template1', 'template2']}
-                if isinstance(contents[sub_prop], dict) and not contents[sub_prop]:
-                    contents[sub_prop] = []
-                    contents[sub_prop].append(value)
-                elif isinstance(contents[sub_prop], list):
-                    contents[sub_prop].append(value)
-                else:
-                    # adding list to 2 level, for example:
-                    # {'subscription-information':
-                    #      {'registered-by-activation-keys': ['ak1', 'ak2']}
-                    #  }
-                    last_key = list(contents[sub_prop].keys())[-1]
-                    if not contents[sub_prop][last_key]:
-                        contents[sub_prop][last_key] = [value]
-                    else:
-                        contents[sub_prop][last_key].append(value)
+                contents[sub_prop] = [value]
+            elif isinstance(group, list):
+                group.append(value)
             else:
-                # some properties have many numbered values
-                # Example:
-                # Content:
-                #  1) Repo Name: repo1
-                #     URL:       /custom/4f84fc90-9ffa-...
-                #  2) Repo Name: puppet1
-                #     URL:       /custom/4f84fc90-9ffa-...
-                starts_with_number = re.match(r'(\d+)\)', key)
-                if starts_with_number:
-                    # if this is a numbered list on level 2, do nothing - this script doesn't support it
-                    if current_indent_level >= 2:
-                        continue
-                    sub_num = int(starts_with_number.group(1))
-                    # no. 1) we need to change dict() to list()
-                    if sub_num == 1:
-                        contents[sub_prop] = []
-                    # remove number from key
-                    key = re.sub(r'\d+\)', '', key)
-                    # append empty dict to array
-                    contents[sub_prop].append({})
-
-                key = key.lstrip().replace(' ', '-').lower()
-                value = value.lstrip()
-                # add value to dictionary
-                if sub_num is not None:
-                    contents[sub_prop][-1][key] = value
+                # adding list to 2 level, for example:
+                # {'subscription-information':
+                #      {'registered-by-activation-keys': ['ak1', 'ak2']}
+                #  }
+                last_key = next(reversed(group.keys()))
+                if not group[last_key]:
+                    group[last_key] = [value]
                 else:
-                    # a third level is always represented as a dictionary and
-                    # we need to detect if we are at third level
-                    # example:
-                    # Content Information:
-                    #     Content View:
-                    #         ID:   10
-                    #         Name: Default Organization View
-                    # the "ID" and "Name" are located at third indent level
-                    # "content view" is located at second indent level
-                    if current_indent_level == 2 and second_level_key:
-                        # we are at third level indentation
-                        if not contents[sub_prop][second_level_key]:
-                            contents[sub_prop][second_level_key] = {}
-                        contents[sub_prop][second_level_key][key] = value
-                    else:
-                        contents[sub_prop][key] = value
-                    if current_indent_level == 1 and not value:
-                        # always set the last possible second level key
-                        # that can form a third level
-                        second_level_key = key
+                    group[last_key].append(value)
+            continue
+
+        # some properties have many numbered values
+        # Example:
+        # Content:
+        #  1) Repo Name: repo1
+        #     URL:       /custom/4f84fc90-9ffa-...
+        #  2) Repo Name: puppet1
+        #     URL:       /custom/4f84fc90-9ffa-...
+        starts_with_number = _INFO_NUMBERED_KEY_REGEX.match(key)
+        if starts_with_number:
+            # if this is a numbered list on level 2, do nothing - this script doesn't support it
+            if indent_level >= 2:
+                continue
+            sub_num = int(starts_with_number.group(1))
+            # no. 1) we need to change dict() to list()
+            if sub_num == 1:
+                contents[sub_prop] = []
+            # remove number from key
+            key = _INFO_NUMBER_REGEX.sub('', key)
+            # append empty dict to array
+            contents[sub_prop].append({})
+
+        key = key.lstrip().replace(' ', '-').lower()
+        value = value.lstrip()
+        # add value to dictionary
+        if sub_num is not None:
+            contents[sub_prop][-1][key] = value
+        elif indent_level == 2 and second_level_key:
+            # a third level is always represented as a dictionary and
+            # we need to detect if we are at third level
+            # example:
+            # Content Information:
+            #     Content View:
+            #         ID:   10
+            #         Name: Default Organization View
+            # the "ID" and "Name" are located at third indent level
+            # "content view" is located at second indent level
+            group = contents[sub_prop]
+            if not group[second_level_key]:
+                group[second_level_key] = {}
+            group[second_level_key][key] = value
         else:
-            sub_num = None  # new property implies no sub property
-            key, value = line.lstrip().split(":", 1)
-            key = key.lstrip().replace(' ', '-').lower()
-            if value.lstrip() == '':  # 'key:' no value, new sub-property
-                sub_prop = key
-                contents[sub_prop] = {}
-            else:  # 'key: value' line
-                contents[key] = value.lstrip()
+            contents[sub_prop][key] = value
+            if indent_level == 1 and not value:
+                # always set the last possible second level key
+                # that can form a third level
+                second_level_key = key
 
     return contents
@@ -0,0 +1,243 @@
+"""Long-lived hammer sessions used as an opt-in backend of :meth:`robottelo.cli.base.Base.execute`
+
+Starting hammer means booting Ruby and loading every hammer plugin, which takes seconds for
+each command. When ``settings.performance.hammer_shell`` is enabled, one hammer process per
+(Satellite, user) is kept running behind a persistent ssh channel, and commands are pushed to it
+one at a time.
+
+The remote side is a small Ruby driver which loads hammer once and then reads one JSON request
+per line from stdin, runs it through ``HammerCLI::MainCommand`` and writes back one JSON line with
+the stdout, stderr and exit status of that command.
+"""
+
+import atexit
+import contextlib
+import itertools
+import json
+import os
+import re
+import shlex
+import threading
+
+from broker.helpers import Result, translate_timeout
+
+from robottelo import ssh
+from robottelo.cli import hammer
+from robottelo.exceptions import HammerShellError
+from robottelo.logging import logger
+
+DRIVER_PATH = '/tmp/robottelo_hammer_shell.rb'
+DRIVER_LOG_PATH = '/tmp/robottelo_hammer_shell.log'
+DRIVER = r"""
+require 'json'
+require 'stringio'
+
+real_stdout = $stdout
+begin
+  # let the hammer executable load settings and plugins, it exits after printing the version
+  ARGV.replace(['--version'])
+  $stdout = StringIO.new
+  load Gem.bin_path('hammer_cli', 'hammer')
+rescue SystemExit
+ensure
+  $stdout = real_stdout
+end
+
+STDOUT.sync = true
+STDOUT.puts({ready: true}.to_json)
+while (line = STDIN.gets)
+  request = JSON.parse(line)
+  out, err = StringIO.new, StringIO.new
+  $stdout, $stderr = out, err
+  begin
+    status = HammerCLI::MainCommand.run('hammer', request['args'], {}) || 0
+  rescue SystemExit => e
+    status = e.status
+  rescue Exception => e
+    err.puts("#{e.class}: #{e.message}")
+    status = 70
+  ensure
+    $stdout, $stderr = STDOUT, STDERR
+  end
+  STDOUT.puts({id: request['id'], status: status, stdout: out.string, stderr: err.string}.to_json)
+end
+"""
+# commands relying on the remote shell can't be passed to hammer as a list of arguments
+_SHELL_SYNTAX_REGEX = re.compile(r'[|;&<>`$]')
+
+
+class HammerShell:
+    """A hammer process kept alive on a Satellite for a single user
+
+    :param str hostname: The Satellite running hammer.
+    :param str user: hammer username, ``None`` to use the hammer configuration.
+    :param str password: hammer password.
+    :param str locale: value of ``LANG`` for the hammer process.
+    """
+
+    def __init__(self, hostname, user, password, locale):
+        self.hostname = hostname
+        self.user = user
+        self.password = password
+        self.locale = locale
+        self.lock = threading.Lock()
+        self._client = None
+        self._shell = None
+        self._buffer = ''
+        self._ids = itertools.count(1)
+
+    @property
+    def alive(self):
+        return self._shell is not None
+
+    def start(self):
+        """Upload the driver and start the hammer process behind an interactive channel"""
+        from robottelo.hosts import ContentHost
+
+        # the channel is held open between commands, so it gets a dedicated connection
+        # rather than one shared through robottelo.ssh.connection_pool
+        self._client = ContentHost(**ssh.client_kwargs(self.hostname))
+        result = self._client.execute(f"cat > {DRIVER_PATH} << 'EOF'\n{DRIVER}\nEOF")
+        if result.status != 0:
+            raise HammerShellError(f'Failed to upload hammer shell driver: {result.stderr}')
+        shell = self._client.session.shell()
+        if not hasattr(shell, 'stdout'):
+            raise HammerShellError('The ssh backend does not support reading interactive shells')
+        self._shell = shell
+        self._shell.send(f'exec env LANG={self.locale} ruby {DRIVER_PATH} 2>>{DRIVER_LOG_PATH}')
+        # discard anything the login shell printed before the driver is ready
+        while self._read_response().get('ready') is not True:
+            pass
+        logger.debug(f'Started hammer shell for {self.user} on {self.hostname}')
+
+    def run(self, args, timeout=None):
+        """Run a single hammer command in the session
+
+        :param list args: hammer arguments, credentials included.
+        :param timeout: Time to wait for the command, in the format accepted by broker.
+        :return: a result object with ``status``, ``stdout`` and ``stderr``, or ``None`` when the
+            session was found dead before the command was sent.
+        :raises robottelo.exceptions.HammerShellError: if the session died while running the
+            command, the session is closed then.
+        """
+        request_id = next(self._ids)
+        try:
+            with contextlib.suppress(AttributeError):  # not every ssh backend supports it
+                self._client.session.session.set_timeout(translate_timeout(timeout or 0))
+            self._shell.send(json.dumps({'id': request_id, 'args': args}))
+        except Exception as err:
+            logger.debug(f'hammer shell on {self.hostname} is dead: {err}')
+            self.close()
+            return None
+        try:
+            while (response := self._read_response()).get('id') != request_id:
+                pass
+        except Exception as err:
+            self.close()
+            raise HammerShellError(f'hammer shell on {self.hostname} died: {err}') from err
+        return Result(
+            status=response['status'],
+            stdout=response['stdout'],
+            stderr=response['stderr'],
+        )
+
+    def close(self):
+        """Terminate the hammer process and close the connection"""
+        if self._shell is not None:
+            with contextlib.suppress(Exception):
+                self._shell.close()
+        if self._client is not None:
+            with contextlib.suppress(Exception):
+                self._client.close()
+        self._shell = self._client = None
+        self._buffer = ''
+
+    def _read_response(self):
+        """Read the next line written by the driver, lines which are not JSON are skipped"""
+        while '\n' not in self._buffer:
+            chunk = self._shell.stdout()
+            if not chunk:
+                raise HammerShellError('hammer shell channel was closed')
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split('\n', 1)
+        try:
+            response = json.loads(line)
+        except json.JSONDecodeError:
+            return {}
+        return response if isinstance(response, dict) else {}
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+_sessions_pid = os.getpid()
+
+
+def _get_session(hostname, user, password, locale):
+    """Return the session for (hostname, user), creating it when needed
+
+    ``None`` is returned when the credentials of the user changed since the session was created,
+    the session is closed then.
+    """
+    global _sessions_pid
+    key = (hostname, user)
+    with _sessions_lock:
+        if (pid := os.getpid()) != _sessions_pid:
+            _sessions.clear()
+            _sessions_pid = pid
+        session = _sessions.get(key)
+        if session is not None and (session.password, session.locale) != (password, locale):
+            # credentials changed under the session, e.g. through Base.with_user
+            _sessions.pop(key).close()
+            return None
+        if session is None:
+            session = _sessions[key] = HammerShell(hostname, user, password, locale)
+    return session
+
+
+def close_sessions():
+    """Close all hammer sessions of this process"""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_sessions)
+
+
+def execute(
+    command, hostname, user, password, locale, output_format=None, timeout=None, parse_output=True
+):
+    """Run ``command`` in a long-lived hammer session
+
+    :param str command: hammer command line, without the ``hammer`` executable and credentials.
+    :param bool parse_output: parse ``stdout`` according to ``output_format``.
+    :return: a result object like :func:`robottelo.ssh.command`, or ``None`` when the command
+        must be run in one-shot mode instead.
+    """
+    if _SHELL_SYNTAX_REGEX.search(command):
+        return None
+    session = _get_session(hostname, user, password, locale)
+    # a session serves one command at a time, concurrent callers go one-shot
+    if session is None or not session.lock.acquire(blocking=False):
+        return None
+    try:
+        if not session.alive:
+            try:
+                session.start()
+            except Exception as err:
+                logger.warning(f'Unable to start hammer shell on {hostname}: {err}')
+                session.close()
+                return None
+        args = ['-v', *(['-u', user, '-p', password] if user else ['--interactive', 'no'])]
+        if output_format:
+            args.append(f'--output={hammer.output_option(output_format)}')
+        result = session.run([*args, *shlex.split(command)], timeout=timeout)
+    finally:
+        session.lock.release()
+    if result is None:
+        return None
+    if output_format and parse_output and result.status == 0:
+        result.stdout = hammer.parse_output(result.stdout, output_format)
+    return result
@@ -0,0 +1,164 @@
+"""Collect the timings of hammer commands run with ``settings.performance.time_hammer``
+
+When ``time_hammer`` is enabled, :class:`robottelo.cli.base.Base` runs every hammer command
+through ``time -p``, which appends the real, user and sys times of the command to its stderr.
+Those lines are stripped from stderr and recorded in :data:`collector` for the command and the
+test it ran in. The ``pytest_plugins.hammer_timings`` plugin reports them at the end of the
+session.
+"""
+
+import csv
+from dataclasses import asdict, dataclass
+import io
+import math
+import re
+import threading
+
+# lines appended to stderr by `time -p`, and by GNU time when the command failed
+_TIME_OUTPUT_REGEX = re.compile(
+    r'(?:^Command exited with non-zero status \d+\n)?'
+    r'^real (?P<real>[\d.]+)\nuser (?P<user>[\d.]+)\nsys (?P<sys>[\d.]+)\n?\Z',
+    re.M,
+)
+PERCENTILES = (50, 90, 95, 99)
+TIMES = ('real', 'user', 'sys')
+
+
+@dataclass
+class HammerTiming:
+    """Times of a single hammer command, in seconds"""
+
+    command: str
+    real: float
+    user: float
+    sys: float
+    test: str | None = None
+
+
+def strip_time_output(stderr):
+    """Split the output of ``time -p`` from the stderr of a command
+
+    :return: a tuple with stderr without the timing lines, and a dictionary with the ``real``,
+        ``user`` and ``sys`` times, which is ``None`` when stderr has no timing.
+    """
+    if not isinstance(stderr, str):
+        return stderr, None
+    match = _TIME_OUTPUT_REGEX.search(stderr)
+    if match is None:
+        return stderr, None
+    return stderr[: match.start()], {name: float(match.group(name)) for name in TIMES}
+
+
+def percentile(values, percent):
+    """Return the nearest-rank ``percent`` percentile of ``values``"""
+    values = sorted(values)
+    return values[max(math.ceil(percent / 100 * len(values)) - 1, 0)]
+
+
+def summarize(timings):
+    """Aggregate ``timings`` per command
+
+    :return: a dictionary mapping every command to its ``count`` and, for each of ``real``,
+        ``user`` and ``sys``, the mean, max and :data:`PERCENTILES` of its times.
+    """
+    by_command = {}
+    for timing in timings:
+        by_command.setdefault(timing.command, []).append(timing)
+    summary = {}
+    for command, command_timings in sorted(by_command.items()):
+        summary[command] = {'count': len(command_timings)}
+        for name in TIMES:
+            values = [getattr(timing, name) for timing in command_timings]
+            summary[command][name] = {
+                'mean': round(sum(values) / len(values), 3),
+                'max': max(values),
+                **{f'p{percent}': percentile(values, percent) for percent in PERCENTILES},
+            }
+    return summary
+
+
+class HammerTimingCollector:
+    """Thread-safe record of the hammer timings of this process
+
+    ``test`` is the id of the running test, every timing recorded meanwhile is attributed to it.
+    """
+
+    def __init__(self):
+        self.test = None
+        self.timings = []
+        self._lock = threading.Lock()
+
+    def record(self, command, times):
+        """Record the ``times`` returned by :func:`strip_time_output` for ``command``"""
+        timing = HammerTiming(command=command, test=self.test, **times)
+        with self._lock:
+            self.timings.append(timing)
+        return timing
+
+    def extend(self, timings):
+        """Add timings recorded elsewhere, e.g. the dictionaries sent by xdist workers"""
+        with self._lock:
+            self.timings.extend(
+                timing if isinstance(timing, HammerTiming) else HammerTiming(**timing)
+                for timing in timings
+            )
+
+    def for_test(self, test):
+        """Return the timings recorded while ``test`` was running"""
+        with self._lock:
+            return [timing for timing in self.timings if timing.test == test]
+
+    def clear(self):
+        with self._lock:
+            self.timings.clear()
+
+    def to_dicts(self):
+        with self._lock:
+            return [asdict(timing) for timing in self.timings]
+
+    def report(self, metadata=None):
+        """Return the JSON report: session and per test summaries, along with ``metadata``"""
+        with self._lock:
+            timings = list(self.timings)
+        tests = {}
+        for timing in timings:
+            tests.setdefault(timing.test, []).append(timing)
+        return {
+            'metadata': metadata or {},
+            'session': summarize(timings),
+            'tests': {
+                test: summarize(test_timings)
+                for test, test_timings in tests.items()
+                if test is not None
+            },
+        }
+
+    def to_csv(self):
+        """Return the session summary as CSV, one row per command"""
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(
+            [
+                'command',
+                'count',
+                *(
+                    f'{name}_{stat}'
+                    for name in TIMES
+                    for stat in ('mean', 'max', *(f'p{percent}' for percent in PERCENTILES))
+                ),
+            ]
+        )
+        with self._lock:
+            timings = list(self.timings)
+        for command, stats in summarize(timings).items():
+            writer.writerow(
+                [
+                    command,
+                    stats['count'],
+                    *(value for name in TIMES for value in stats[name].values()),
+                ]
+            )
+        return output.getvalue()
+
+
+collector = HammerTimingCollector()
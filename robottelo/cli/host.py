@@ -51,44 +51,47 @@ class Host(Base):
     @classmethod
     def ansible_roles_play(cls, options):
         """Plays the associated ansible-roles"""
-        cls.command_sub = 'ansible-roles play'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('ansible-roles play', options), output_format='csv'
+        )
 
     @classmethod
     def ansible_roles_assign(cls, options):
         """Assigns the associated ansible-roles"""
-        cls.command_sub = 'ansible-roles assign'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('ansible-roles assign', options), output_format='csv'
+        )
 
     @classmethod
     def ansible_roles_add(cls, options):
         """Associate an Ansible role"""
-        cls.command_sub = 'ansible-roles add'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('ansible-roles add', options), output_format='csv'
+        )
 
     @classmethod
     def ansible_roles_remove(cls, options=None):
         """Remove ansible roles"""
-        cls.command_sub = 'ansible-roles remove'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('ansible-roles remove', options), output_format='csv'
+        )
 
     @classmethod
     def ansible_roles_list(cls, options=None):
         """Remove ansible list"""
-        cls.command_sub = 'ansible-roles list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('ansible-roles list', options), output_format='csv'
+        )
 
     @classmethod
     def bootc_images(cls, options=None):
         """List booted bootc container images for hosts"""
-        cls.command_sub = 'bootc images'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('bootc images', options), output_format='csv')
 
     @classmethod
     def disassociate(cls, options):
         """Disassociate the host from a CR."""
-        cls.command_sub = 'disassociate'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('disassociate', options), output_format='csv')
 
     @classmethod
     def enc_dump(cls, options):
@@ -111,32 +114,27 @@ class Host(Base):
              --organization-title ORGANIZATION_TITLE Organization title
              -h, --help                              Print help
         """
-        cls.command_sub = 'enc-dump'
-        return cls.execute(cls._construct_command(options), output_format='yaml')
+        return cls.execute(cls._construct_command('enc-dump', options), output_format='yaml')
 
     @classmethod
     def errata_apply(cls, options):
         """Schedule errata for installation"""
-        cls.command_sub = 'errata apply'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('errata apply', options), output_format='csv')
 
     @classmethod
     def errata_info(cls, options):
         """Retrieve a single errata for a system"""
-        cls.command_sub = 'errata info'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('errata info', options), output_format='csv')
 
     @classmethod
     def errata_list(cls, options):
         """List errata available for the content host."""
-        cls.command_sub = 'errata list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('errata list', options), output_format='csv')
 
     @classmethod
     def errata_recalculate(cls, options):
         """Recalculate errata on a content host"""
-        cls.command_sub = 'errata recalculate'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('errata recalculate', options))
 
     @classmethod
     def facts(cls, options=None):
@@ -157,9 +155,8 @@ class Host(Base):
             --search SEARCH               filter results
             -h, --help                    print help
         """
-        cls.command_sub = 'facts'
 
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(cls._construct_command('facts', options), output_format='csv')
 
         facts = []
 
@@ -171,9 +168,8 @@ class Host(Base):
     @classmethod
     def info(cls, options=None, output_format='json', return_raw_response=None):
         """Show host info"""
-        cls.command_sub = 'info'
         return cls.execute(
-            cls._construct_command(options),
+            cls._construct_command('info', options),
             output_format=output_format,
             return_raw_response=return_raw_response,
         )
@@ -181,44 +177,43 @@ class Host(Base):
     @classmethod
     def package_install(cls, options):
         """Install packages remotely."""
-        cls.command_sub = 'package install'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('package install', options), output_format='csv')
 
     @classmethod
     def package_list(cls, options):
         """List packages installed on the host."""
-        cls.command_sub = 'package list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('package list', options), output_format='csv')
 
     @classmethod
     def package_remove(cls, options):
         """Uninstall packages remotely."""
-        cls.command_sub = 'package remove'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('package remove', options), output_format='csv')
 
     @classmethod
     def package_upgrade(cls, options):
         """Update packages remotely."""
-        cls.command_sub = 'package upgrade'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('package upgrade', options), output_format='csv')
 
     @classmethod
     def package_upgrade_all(cls, options):
         """Update all packages remotely."""
-        cls.command_sub = 'package upgrade-all'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('package upgrade-all', options), output_format='csv'
+        )
 
     @classmethod
     def package_group_install(cls, options):
         """Install package groups remotely."""
-        cls.command_sub = 'package-group install'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('package-group install', options), output_format='csv'
+        )
 
     @classmethod
     def package_group_remove(cls, options):
         """Uninstall package groups remotely."""
-        cls.command_sub = 'package-group remove'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('package-group remove', options), output_format='csv'
+        )
 
     @classmethod
     def reboot(cls, options=None):
@@ -236,9 +231,7 @@ class Host(Base):
             -h, --help                    print help
         """
 
-        cls.command_sub = 'reboot'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('reboot', options))
 
     @classmethod
     def reports(cls, options=None):
@@ -260,9 +253,7 @@ class Host(Base):
             -h, --help                    print help
         """
 
-        cls.command_sub = 'reports'
-
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(cls._construct_command('reports', options), output_format='csv')
 
         reports = []
 
@@ -287,9 +278,7 @@ class Host(Base):
             -h, --help                    print help
         """
 
-        cls.command_sub = 'start'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('start', options))
 
     @classmethod
     def status(cls, options=None):
@@ -307,9 +296,7 @@ class Host(Base):
             -h, --help                    print help
         """
 
-        cls.command_sub = 'status'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('status', options))
 
     @classmethod
     def stop(cls, options=None):
@@ -328,9 +315,7 @@ class Host(Base):
             -h, --help                    print help
         """
 
-        cls.command_sub = 'stop'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('stop', options))
 
     @classmethod
     def subscription_register(cls, options=None):
@@ -385,8 +370,9 @@ class Host(Base):
                                                                 generated if
                                                                 not provided
         """
-        cls.command_sub = 'subscription register'
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(
+            cls._construct_command('subscription register', options), output_format='csv'
+        )
         if isinstance(result, list):
             result = result[0]
         return result
@@ -404,8 +390,7 @@ class Host(Base):
             --host HOST_NAME              Name to search by
             --host-id HOST_ID             Host ID
         """
-        cls.command_sub = 'subscription unregister'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('subscription unregister', options))
 
     @classmethod
     def subscription_attach(cls, options=None):
@@ -423,8 +408,7 @@ class Host(Base):
                                               add. Defaults to 1
             --subscription-id SUBSCRIPTION_ID ID of subscription
         """
-        cls.command_sub = 'subscription attach'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('subscription attach', options))
 
     @classmethod
     def subscription_remove(cls, options=None):
@@ -443,8 +427,7 @@ class Host(Base):
                                                 and quantity
             --subscription-id SUBSCRIPTION_ID   ID of subscription
         """
-        cls.command_sub = 'subscription remove'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('subscription remove', options))
 
     @classmethod
     def subscription_auto_attach(cls, options=None):
@@ -460,8 +443,7 @@ class Host(Base):
             --host-id HOST_ID
             -h, --help                    print help
         """
-        cls.command_sub = 'subscription auto-attach'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('subscription auto-attach', options))
 
     @classmethod
     def sc_params(cls, options=None):
@@ -480,8 +462,7 @@ class Host(Base):
             --per-page PER_PAGE           number of entries per request
             --search SEARCH               filter results
         """
-        cls.command_sub = 'sc-params'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('sc-params', options), output_format='csv')
 
 
 class HostInterface(Base):
@@ -503,8 +484,7 @@ class HostInterface(Base):
     @classmethod
     def create(cls, options=None, timeout=None):
         """Create new network interface for host"""
-        cls.command_sub = 'create'
-        cls.execute(cls._construct_command(options), output_format='csv', timeout=timeout)
+        cls.execute(cls._construct_command('create', options), output_format='csv', timeout=timeout)
 
 
 class HostTraces(Base):
@@ -537,8 +517,7 @@ class HostTraces(Base):
                                        JSON is acceptable and preferred way for complex parameters
             --host[-id]                   Name/id of the host
         """
-        cls.command_sub = 'list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('list', options), output_format='csv')
 
     @classmethod
     def resolve(cls, options=None):
@@ -558,5 +537,4 @@ class HostTraces(Base):
                                        escaped with backslash.
                                        JSON is acceptable and preferred way for complex parameters
         """
-        cls.command_sub = 'resolve'
-        cls.execute(cls._construct_command(options))
+        cls.execute(cls._construct_command('resolve', options))
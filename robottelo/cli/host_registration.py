@@ -25,5 +25,4 @@ class HostRegistration(Base):
     @classmethod
     def generate_command(cls, options):
         """Generate global registration command"""
-        cls.command_sub = 'generate-command'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('generate-command', options))
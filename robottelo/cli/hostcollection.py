@@ -35,14 +35,12 @@ class HostCollection(Base):
     @classmethod
     def add_host(cls, options=None):
         """Add host to the host collection"""
-        cls.command_sub = 'add-host'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-host', options))
 
     @classmethod
     def remove_host(cls, options=None):
         """Remove hosts from the host collection"""
-        cls.command_sub = 'remove-host'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-host', options))
 
     @classmethod
     def hosts(cls, options=None):
@@ -75,23 +73,19 @@ class HostCollection(Base):
              --search SEARCH                         filter results
              -h, --help                              print help
         """
-        cls.command_sub = 'hosts'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('hosts', options), output_format='csv')
 
     @classmethod
     def erratum_install(cls, options):
         """Schedule errata for installation"""
-        cls.command_sub = 'erratum install'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('erratum install', options), output_format='csv')
 
     @classmethod
     def package_install(cls, options):
         """Schedule package for installation"""
-        cls.command_sub = 'package install'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('package install', options), output_format='csv')
 
     @classmethod
     def copy(cls, options):
         """Clone existing host collection"""
-        cls.command_sub = 'copy'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('copy', options), output_format='csv')
@@ -34,20 +34,23 @@ class HostGroup(Base):
     @classmethod
     def ansible_roles_assign(cls, options):
         """Assigns Ansible roles to a hostgroup"""
-        cls.command_sub = 'ansible-roles assign'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('ansible-roles assign', options), output_format='csv'
+        )
 
     @classmethod
     def ansible_roles_remove(cls, options=None):
         """Disassociate an Ansible role"""
-        cls.command_sub = 'ansible-roles remove'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('ansible-roles remove', options), output_format='csv'
+        )
 
     @classmethod
     def ansible_roles_add(cls, options):
         """Associate an Ansible role"""
-        cls.command_sub = 'ansible-roles add'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('ansible-roles add', options), output_format='csv'
+        )
 
     @classmethod
     def sc_params(cls, options=None):
@@ -67,5 +70,4 @@ class HostGroup(Base):
             --per-page PER_PAGE               number of entries per request
             --search SEARCH                   filter results
         """
-        cls.command_sub = 'sc-params'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('sc-params', options), output_format='csv')
@@ -31,29 +31,25 @@ class Insights(Base):
         """
         Start inventory status sync
         """
-        cls.command_sub = 'inventory sync'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('inventory sync', options))
 
     @classmethod
     def inventory_generate_report(cls, options):
         """
         Start new report generation
         """
-        cls.command_sub = 'inventory generate-report'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('inventory generate-report', options))
 
     @classmethod
     def inventory_download_report(cls, options):
         """
         Download the last generated report
         """
-        cls.command_sub = 'inventory download-report'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('inventory download-report', options))
 
     @classmethod
     def cloud_connector_enable(cls, options=None):
         """
         Enable cloud connector
         """
-        cls.command_sub = 'cloud-connector enable'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('cloud-connector enable', options))
@@ -32,13 +32,11 @@ class JobTemplate(Base):
         """Export a job template
         Specify at least --name or --id
         """
-        cls.command_sub = 'export'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('export', options))
 
     @classmethod
     def import_template(cls, options, timeout=None):
         """Import a job template
         Specify at least  --file
         """
-        cls.command_sub = 'import'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('import', options))
@@ -27,6 +27,7 @@ class LifecycleEnvironment(Base):
 
     command_base = 'lifecycle-environment'
     command_requires_org = True
+    command_paginated = False
 
     @classmethod
     def list(cls, options=None, per_page=False):
@@ -34,5 +35,4 @@ class LifecycleEnvironment(Base):
 
     @classmethod
     def paths(cls, options=None):
-        cls.command_sub = 'paths'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('paths', options))
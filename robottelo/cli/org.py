@@ -52,125 +52,104 @@ class Org(Base):
     @classmethod
     def add_compute_resource(cls, options=None):
         """Adds a computeresource to an org"""
-        cls.command_sub = 'add-compute-resource'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-compute-resource', options))
 
     @classmethod
     def remove_compute_resource(cls, options=None):
         """Removes a computeresource from an org"""
-        cls.command_sub = 'remove-compute-resource'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-compute-resource', options))
 
     @classmethod
     def add_domain(cls, options=None):
         """Adds a domain to an org"""
-        cls.command_sub = 'add-domain'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-domain', options))
 
     @classmethod
     def remove_domain(cls, options=None):
         """Removes a domain from an org"""
-        cls.command_sub = 'remove-domain'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-domain', options))
 
     @classmethod
     def add_environment(cls, options=None):
         """Adds an environment to an org"""
-        cls.command_sub = 'add-environment'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-environment', options))
 
     @classmethod
     def remove_environment(cls, options=None):
         """Removes an environment from an org"""
-        cls.command_sub = 'remove-environment'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-environment', options))
 
     @classmethod
     def add_hostgroup(cls, options=None):
         """Adds a hostgroup to an org"""
-        cls.command_sub = 'add-hostgroup'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-hostgroup', options))
 
     @classmethod
     def remove_hostgroup(cls, options=None):
         """Removes a hostgroup from an org"""
-        cls.command_sub = 'remove-hostgroup'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-hostgroup', options))
 
     @classmethod
     def add_location(cls, options=None):
         """Adds a location to an org"""
-        cls.command_sub = 'add-location'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-location', options))
 
     @classmethod
     def remove_location(cls, options=None):
         """Removes a location from an org"""
-        cls.command_sub = 'remove-location'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-location', options))
 
     @classmethod
     def add_medium(cls, options=None):
         """Adds a medium to an org"""
-        cls.command_sub = 'add-medium'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-medium', options))
 
     @classmethod
     def remove_medium(cls, options=None):
         """Removes a medium from an org"""
-        cls.command_sub = 'remove-medium'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-medium', options))
 
     @classmethod
     def add_provisioning_template(cls, options=None):
         """Adds a provisioning template to an org"""
-        cls.command_sub = 'add-provisioning-template'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-provisioning-template', options))
 
     @classmethod
     def remove_provisioning_template(cls, options=None):
         """Removes a provisioning template from an org"""
-        cls.command_sub = 'remove-provisioning-template'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-provisioning-template', options))
 
     @classmethod
     def add_smart_proxy(cls, options=None):
         """Adds a smartproxy to an org"""
-        cls.command_sub = 'add-smart-proxy'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-smart-proxy', options))
 
     @classmethod
     def remove_smart_proxy(cls, options=None):
         """Removes a smartproxy from an org"""
-        cls.command_sub = 'remove-smart-proxy'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-smart-proxy', options))
 
     @classmethod
     def add_subnet(cls, options=None):
         """Adds existing subnet to an org"""
-        cls.command_sub = 'add-subnet'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-subnet', options))
 
     @classmethod
     def remove_subnet(cls, options=None):
         """Removes a subnet from an org"""
-        cls.command_sub = 'remove-subnet'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-subnet', options))
 
     @classmethod
     def add_user(cls, options=None):
         """Adds an user to an org"""
-        cls.command_sub = 'add-user'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('add-user', options))
 
     @classmethod
     def remove_user(cls, options=None):
         """Removes an user from an org"""
-        cls.command_sub = 'remove-user'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('remove-user', options))
 
     @classmethod
     def configure_cdn(cls, options=None):
         """Update the CDN configuration"""
-        cls.command_sub = 'configure-cdn'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('configure-cdn', options))
@@ -0,0 +1,209 @@
+"""Lazy namespaces of the robottelo CLI entities of a Satellite or Capsule
+
+``Satellite.cli`` and ``Capsule.cli`` expose the :class:`robottelo.cli.base.Base` subclasses of
+``robottelo.cli`` as subclasses bound to the hostname of the host. :data:`CLI_ENTITIES` maps every
+entity to the module defining it, so a module is only imported, and its entity subclassed, the
+first time the entity is looked up. Namespaces are shared per hostname for the whole process,
+while :meth:`CLINamespace.omit_credentials` only applies to the thread using it.
+
+:data:`CLI_ENTITIES` has to be updated along with the CLI entities, which
+``tests/robottelo/test_cli_registry.py`` checks.
+"""
+
+from contextlib import contextmanager
+from functools import partial
+import importlib
+import threading
+
+from robottelo.cli.base import CLIBatch
+
+# entity name -> module of robottelo.cli defining it
+CLI_ENTITIES = {
+    'ACS': 'acs',
+    'ACSBulk': 'acs',
+    'ActivationKey': 'activationkey',
+    'Admin': 'admin',
+    'Advanced': 'sm_advanced',
+    'AdvancedByTag': 'sm_advanced_by_tag',
+    'Ansible': 'ansible',
+    'Architecture': 'architecture',
+    'Arfreport': 'arfreport',
+    'Auth': 'auth',
+    'AuthLogin': 'auth',
+    'Backup': 'sm_backup',
+    'Base': 'base',
+    'Bootdisk': 'bootdisk',
+    'Capsule': 'capsule',
+    'ComputeProfile': 'computeprofile',
+    'ComputeResource': 'computeresource',
+    'ConfigReport': 'report',
+    'ContentCredential': 'content_credentials',
+    'ContentExport': 'content_export',
+    'ContentImport': 'content_import',
+    'ContentView': 'contentview',
+    'ContentViewFilter': 'contentview',
+    'ContentViewFilterRule': 'contentview',
+    'Defaults': 'defaults',
+    'DiscoveredHost': 'discoveredhost',
+    'DiscoveryRule': 'discoveryrule',
+    'Docker': 'docker',
+    'DockerManifest': 'docker',
+    'DockerTag': 'docker',
+    'Domain': 'domain',
+    'Environment': 'environment',
+    'Erratum': 'erratum',
+    'ExternalAuthSource': 'ldapauthsource',
+    'Fact': 'fact',
+    'File': 'file',
+    'Filter': 'filter',
+    'FlatpakRemote': 'flatpak_remote',
+    'GPGKey': 'gpgkey',
+    'GlobalParameter': 'globalparam',
+    'Health': 'sm_health',
+    'Host': 'host',
+    'HostCollection': 'hostcollection',
+    'HostGroup': 'hostgroup',
+    'HostInterface': 'host',
+    'HostRegistration': 'host_registration',
+    'HostTraces': 'host',
+    'HttpProxy': 'http_proxy',
+    'Insights': 'insights',
+    'JobInvocation': 'job_invocation',
+    'JobTemplate': 'job_template',
+    'LDAPAuthSource': 'ldapauthsource',
+    'LifecycleEnvironment': 'lifecycleenvironment',
+    'Location': 'location',
+    'MaintenanceMode': 'sm_maintenance_mode',
+    'Medium': 'medium',
+    'Model': 'model',
+    'ModuleStream': 'module_stream',
+    'OperatingSys': 'operatingsys',
+    'Org': 'org',
+    'OstreeBranch': 'ostreebranch',
+    'Package': 'package',
+    'Packages': 'sm_packages',
+    'PartitionTable': 'partitiontable',
+    'Product': 'product',
+    'Proxy': 'proxy',
+    'Puppet': 'puppet',
+    'Realm': 'realm',
+    'RecurringLogic': 'recurring_logic',
+    'RemoteExecutionFeature': 'rex_feature',
+    'ReportTemplate': 'report_template',
+    'Repository': 'repository',
+    'RepositorySet': 'repository_set',
+    'Restore': 'sm_restore',
+    'Role': 'role',
+    'SatelliteMaintainReport': 'sm_report',
+    'Scapcontent': 'scapcontent',
+    'Scappolicy': 'scap_policy',
+    'Service': 'sm_service',
+    'Settings': 'settings',
+    'SimpleContentAccess': 'simple_content_access',
+    'SmartClassParameter': 'scparams',
+    'Srpm': 'srpm',
+    'Subnet': 'subnet',
+    'Subscription': 'subscription',
+    'SyncPlan': 'syncplan',
+    'TailoringFiles': 'scap_tailoring_files',
+    'Task': 'task',
+    'Template': 'template',
+    'TemplateInput': 'template_input',
+    'TemplateSync': 'template_sync',
+    'Update': 'sm_update',
+    'Upgrade': 'sm_upgrade',
+    'User': 'user',
+    'UserGroup': 'usergroup',
+    'UserGroupExternal': 'usergroup',
+    'VirtWhoConfig': 'virt_who_config',
+    'Webhook': 'webhook',
+}
+# entities of the satellite-maintain commands, the only ones available on a Capsule
+SATELLITE_MAINTAIN_ENTITIES = {
+    name: module
+    for name, module in CLI_ENTITIES.items()
+    if module.startswith('sm_') or module == 'base'
+}
+
+_namespaces = {}
+_lock = threading.Lock()
+
+
+class _OmittingCredentials:
+    """``omitting_credentials`` of the entities of a namespace, which the namespace holds"""
+
+    def __get__(self, instance, owner):
+        return owner._cli_namespace.omitting_credentials
+
+
+class CLINamespace:
+    """Namespace of the CLI entities in ``entities``, bound to ``hostname``
+
+    Use :func:`get_cli` rather than creating namespaces directly, so they are shared.
+    """
+
+    def __init__(self, hostname, entities):
+        self.hostname = hostname
+        self._entities = entities
+        self._local = threading.local()
+
+    @property
+    def omitting_credentials(self):
+        """Whether the commands run by the current thread omit the hammer credentials"""
+        return getattr(self._local, 'omitting_credentials', False)
+
+    def __getattr__(self, name):
+        # only called when the entity was not looked up yet
+        if name.startswith('_') or (module := self._entities.get(name)) is None:
+            raise AttributeError(f'robottelo.cli has no entity named {name!r}')
+        cls = getattr(importlib.import_module(f'robottelo.cli.{module}'), name)
+        with _lock:
+            if (entity := self.__dict__.get(name)) is None:
+                entity = type(
+                    name,
+                    (cls,),
+                    {
+                        'hostname': self.hostname,
+                        'omitting_credentials': _OmittingCredentials(),
+                        '_cli_namespace': self,
+                        '__module__': cls.__module__,
+                    },
+                )
+                setattr(self, name, entity)
+        return entity
+
+    def __dir__(self):
+        return sorted({*super().__dir__(), *self._entities})
+
+    @contextmanager
+    def omit_credentials(self):
+        """Run the commands of every entity of the namespace without hammer credentials
+
+        Only the commands run by the current thread omit them, other threads sharing the
+        namespace keep passing their credentials.
+        """
+        previous = self.omitting_credentials
+        self._local.omitting_credentials = True
+        try:
+            yield
+        finally:
+            self._local.omitting_credentials = previous
+
+
+def get_cli(hostname, satellite_maintain_only=False):
+    """Return the namespace of CLI entities of ``hostname``
+
+    :param bool satellite_maintain_only: Only expose :data:`SATELLITE_MAINTAIN_ENTITIES`, as on
+        a Capsule.
+    """
+    key = (hostname, satellite_maintain_only)
+    with _lock:
+        if (cli := _namespaces.get(key)) is None:
+            if satellite_maintain_only:
+                cli = CLINamespace(hostname, SATELLITE_MAINTAIN_ENTITIES)
+            else:
+                cli = CLINamespace(hostname, CLI_ENTITIES)
+                # collect several commands to run them in a single ssh round-trip
+                cli.batch = partial(CLIBatch, hostname=hostname, namespace=cli)
+            _namespaces[key] = cli
+    return cli
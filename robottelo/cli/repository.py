@@ -59,9 +59,8 @@ class Repository(Base):
     @classmethod
     def synchronize(cls, options, return_raw_response=None, timeout=3600000):
         """Synchronizes a repository."""
-        cls.command_sub = 'synchronize'
         return cls.execute(
-            cls._construct_command(options),
+            cls._construct_command('synchronize', options),
             output_format='csv',
             ignore_stderr=True,
             return_raw_response=return_raw_response,
@@ -71,23 +70,31 @@ class Repository(Base):
     @classmethod
     def remove_content(cls, options):
         """Remove content from a repository"""
-        cls.command_sub = 'remove-content'
-        return cls.execute(cls._construct_command(options), output_format='csv', ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command('remove-content', options),
+            output_format='csv',
+            ignore_stderr=True,
+        )
 
     @classmethod
     def upload_content(cls, options):
         """Upload content to repository."""
-        cls.command_sub = 'upload-content'
-        return cls.execute(cls._construct_command(options), output_format='csv', ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command('upload-content', options),
+            output_format='csv',
+            ignore_stderr=True,
+        )
 
     @classmethod
     def reclaim_space(cls, options):
         """Remove disk space from a synced repository"""
-        cls.command_sub = 'reclaim-space'
-        return cls.execute(cls._construct_command(options), output_format='csv', ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command('reclaim-space', options),
+            output_format='csv',
+            ignore_stderr=True,
+        )
 
     @classmethod
     def verify_checksum(cls, options):
         """Verify checksum of repository contents."""
-        cls.command_sub = 'verify-checksum'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True)
+        return cls.execute(cls._construct_command('verify-checksum', options), ignore_stderr=True)
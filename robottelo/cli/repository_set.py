@@ -33,14 +33,12 @@ class RepositorySet(Base):
     @classmethod
     def enable(cls, options):
         """Enables a repository."""
-        cls.command_sub = 'enable'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('enable', options), output_format='csv')
 
     @classmethod
     def disable(cls, options):
         """Disables a repository."""
-        cls.command_sub = 'disable'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('disable', options), output_format='csv')
 
     @classmethod
     def available_repositories(cls, options):
@@ -68,5 +66,6 @@ class RepositorySet(Base):
             -h, --help                              print help
 
         """
-        cls.command_sub = 'available-repositories'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('available-repositories', options), output_format='csv'
+        )
@@ -29,14 +29,12 @@ class Role(Base):
     @classmethod
     def filters(cls, options=None):
         """List all filters"""
-        cls.command_sub = 'filters'
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(cls._construct_command('filters', options), output_format='json')
 
     @classmethod
     def clone(cls, options):
         """Clone a role"""
-        cls.command_sub = 'clone'
-        result = cls.execute(cls._construct_command(options), output_format='csv')
+        result = cls.execute(cls._construct_command('clone', options), output_format='csv')
         # Fetch new role
         if len(result) > 0 and 'id' in result[0]:
             new_role = cls.info({'id': result[0]['id']})
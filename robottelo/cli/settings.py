@@ -26,6 +26,5 @@ class Settings(Base):
     @classmethod
     def set(cls, options=None):
         """Update a setting"""
-        cls.command_sub = 'set'
 
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('set', options))
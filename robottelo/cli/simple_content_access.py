@@ -30,17 +30,20 @@ class SimpleContentAccess(Base):
     @classmethod
     def disable(cls, options=None, timeout=None):
         """Disable simple content access for a manifest"""
-        cls.command_sub = 'disable'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command('disable', options), ignore_stderr=True, timeout=timeout
+        )
 
     @classmethod
     def enable(cls, options=None, timeout=None):
         """Enable simple content access for a manifest"""
-        cls.command_sub = 'enable'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command('enable', options), ignore_stderr=True, timeout=timeout
+        )
 
     @classmethod
     def status(cls, options=None, timeout=None):
         """Check if the specified organization has Simple Content Access enabled"""
-        cls.command_sub = 'status'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command('status', options), ignore_stderr=True, timeout=timeout
+        )
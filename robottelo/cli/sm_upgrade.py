@@ -25,13 +25,11 @@ class Upgrade(Base):
     @classmethod
     def check(cls, options=None, env_var=None):
         """Build satellite-maintain upgrade check"""
-        cls.command_sub = 'check'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(cls._construct_command('check', options), env_var=env_var)
 
     @classmethod
     def run(cls, options=None, env_var=None):
         """Build satellite-maintain upgrade run"""
-        cls.command_sub = 'run'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(cls._construct_command('run', options), env_var=env_var)
@@ -36,8 +36,9 @@ class Task(Base):
             --id ID                       UUID of the task
             --name NAME                   Name to search by
         """
-        cls.command_sub = 'progress'
-        return cls.execute(cls._construct_command(options), return_raw_response=return_raw_response)
+        return cls.execute(
+            cls._construct_command('progress', options), return_raw_response=return_raw_response
+        )
 
     @classmethod
     def resume(cls, options=None):
@@ -51,8 +52,7 @@ class Task(Base):
             --task-ids TASK_IDS           Comma separated list of values.
             --tasks TASK_NAMES            Comma separated list of values.
         """
-        cls.command_sub = 'resume'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('resume', options))
 
     @classmethod
     def list_tasks(cls, options=None):
@@ -64,5 +64,4 @@ class Task(Base):
         Options:
             --search SEARCH               List tasks matching search string
         """
-        cls.command_sub = 'list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('list', options), output_format='csv')
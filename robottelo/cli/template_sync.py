@@ -51,11 +51,11 @@ class TemplateSync(Base):
         """Export Satellite Templates to Git/Local Directory."""
         cls.command_base = 'export-templates'
 
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(None, options))
 
     @classmethod
     def imports(cls, options=None):
         """Import Satellite Templates to Git/Local Directory."""
         cls.command_base = 'import-templates'
 
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(None, options))
@@ -34,14 +34,12 @@ class User(Base):
     @classmethod
     def add_role(cls, options=None):
         """Add a role to a user."""
-        cls.command_sub = 'add-role'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('add-role', options), output_format='csv')
 
     @classmethod
     def remove_role(cls, options=None):
         """Remove a role from user."""
-        cls.command_sub = 'remove-role'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('remove-role', options), output_format='csv')
 
     @classmethod
     def ssh_keys_add(cls, options=None):
@@ -63,8 +61,7 @@ class User(Base):
         --user-id USER_ID
 
         """
-        cls.command_sub = 'ssh-keys add'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('ssh-keys add', options), output_format='csv')
 
     @classmethod
     def ssh_keys_delete(cls, options=None):
@@ -73,8 +70,7 @@ class User(Base):
         hammer user ssh-keys delete [OPTIONS]
 
         """
-        cls.command_sub = 'ssh-keys delete'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('ssh-keys delete', options), output_format='csv')
 
     @classmethod
     def ssh_keys_list(cls, options=None):
@@ -83,8 +79,7 @@ class User(Base):
         hammer user ssh-keys list [OPTIONS]
 
         """
-        cls.command_sub = 'ssh-keys list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('ssh-keys list', options), output_format='csv')
 
     @classmethod
     def ssh_keys_info(cls, options=None):
@@ -93,8 +88,7 @@ class User(Base):
         hammer user ssh-keys info [OPTIONS]
 
         """
-        cls.command_sub = 'ssh-keys info'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('ssh-keys info', options), output_format='csv')
 
     @classmethod
     def access_token(cls, action=None, options=None):
@@ -104,8 +98,9 @@ class User(Base):
 
         action: create | revoke
         """
-        cls.command_sub = f'access-token {action}'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(f'access-token {action}', options), output_format='csv'
+        )
 
     @classmethod
     def mail_notification_add(cls, options=None):
@@ -130,17 +125,18 @@ class User(Base):
             --user[-id] VALUE
 
         """
-        cls.command_sub = 'mail-notification add'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('mail-notification add', options), output_format='csv'
+        )
 
     @classmethod
     def invalidate(cls, options=None):
         """Invalidate JWTs for a single user"""
-        cls.command_sub = 'registration-tokens invalidate'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('registration-tokens invalidate', options))
 
     @classmethod
     def invalidate_multiple(cls, options=None):
         """Invalidate JWTs for multiple users"""
-        cls.command_sub = 'registration-tokens invalidate-multiple'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command('registration-tokens invalidate-multiple', options)
+        )
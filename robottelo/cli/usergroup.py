@@ -42,8 +42,7 @@ class UserGroup(Base):
             --role ROLE_NAME              User role name
             --role-id ROLE_ID
         """
-        cls.command_sub = 'add-role'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('add-role', options), output_format='csv')
 
     @classmethod
     def add_user(cls, options=None):
@@ -58,8 +57,7 @@ class UserGroup(Base):
             --user USER_LOGIN             User's login to search by
             --user-id USER_ID
         """
-        cls.command_sub = 'add-user'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('add-user', options), output_format='csv')
 
     @classmethod
     def add_user_group(cls, options=None):
@@ -74,8 +72,7 @@ class UserGroup(Base):
             --user-group USER_GROUP_NAME                  Name to search by
             --user-group-id USER_GROUP_ID
         """
-        cls.command_sub = 'add-user-group'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('add-user-group', options), output_format='csv')
 
     @classmethod
     def remove_role(cls, options=None):
@@ -90,8 +87,7 @@ class UserGroup(Base):
             --role ROLE_NAME              User role name
             --role-id ROLE_ID
         """
-        cls.command_sub = 'remove-role'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('remove-role', options), output_format='csv')
 
     @classmethod
     def remove_user(cls, options=None):
@@ -106,8 +102,7 @@ class UserGroup(Base):
             --user USER_LOGIN             User's login to search by
             --user-id USER_ID
         """
-        cls.command_sub = 'remove-user'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('remove-user', options), output_format='csv')
 
     @classmethod
     def remove_user_group(cls, options=None):
@@ -122,8 +117,9 @@ class UserGroup(Base):
             --user-group USER_GROUP_NAME                  Name to search by
             --user-group-id USER_GROUP_ID
         """
-        cls.command_sub = 'remove-user-group'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command('remove-user-group', options), output_format='csv'
+        )
 
 
 class UserGroupExternal(Base):
@@ -145,14 +141,14 @@ class UserGroupExternal(Base):
 
     @classmethod
     def refresh(cls, options=None):
-        cls.command_sub = 'refresh'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command('refresh', options), output_format='csv')
 
     @classmethod
     def create(cls, options=None, timeout=None):
         """Create external user group"""
-        cls.command_sub = 'create'
-        result = cls.execute(cls._construct_command(options), output_format='csv', timeout=timeout)
+        result = cls.execute(
+            cls._construct_command('create', options), output_format='csv', timeout=timeout
+        )
         # External user group can only be fetched by specifying both id and
         # user group id it is linked to
         if len(result) > 0 and 'id' in result[0]:
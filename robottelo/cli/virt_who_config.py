@@ -31,8 +31,7 @@ class VirtWhoConfig(Base):
     @classmethod
     def fetch(cls, options=None, output_format=None):
         """Renders a deploy script for the specified virt-who configuration"""
-        cls.command_sub = 'fetch'
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(cls._construct_command('fetch', options), output_format=output_format)
 
     @classmethod
     def deploy(cls, options=None):
@@ -42,5 +41,4 @@ class VirtWhoConfig(Base):
         :param options: `id` required
         :return: Results of the command
         """
-        cls.command_sub = 'deploy'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command('deploy', options))
@@ -146,10 +146,15 @@ def configure_nailgun():
         ``robottelo.entity_mixins.Entity`` for more information on the effects
         of this.
     * Set a default value for ``nailgun.entities.GPGKey.content``.
+    * Send the requests of ``nailgun.client`` through the pooled HTTP connections of
+        :mod:`robottelo.http_sessions`.
     """
-    from nailgun import entities, entity_mixins
+    from nailgun import client, entities, entity_mixins
     from nailgun.config import ServerConfig
 
+    from robottelo.http_sessions import pooled_requests
+
+    client.requests = pooled_requests
     entity_mixins.CREATE_MISSING = True
     entity_mixins.DEFAULT_SERVER_CONFIG = ServerConfig(
         get_url(), get_credentials(), verify=settings.server.verify_ca
@@ -17,9 +17,13 @@ VALIDATORS = dict(
         Validator('server.version.source', default='internal', is_in=['internal', 'ga', 'nightly']),
         Validator('server.version.rhel_version', must_exist=True, cast=str),
         Validator(
-            'server.xdist_behavior', must_exist=True, is_in=['run-on-one', 'balance', 'on-demand']
+            'server.xdist_behavior',
+            must_exist=True,
+            is_in=['run-on-one', 'balance', 'on-demand', 'least-loaded'],
         ),
+        Validator('server.xdist_sample_load', default=False, is_type_of=bool),
         Validator('server.auto_checkin', default=False, is_type_of=bool),
+        Validator('server.preprovision', default=0, is_type_of=int, gte=0),
         (
             Validator('server.ssh_key', must_exist=True)
             | Validator('server.ssh_password', must_exist=True)
@@ -42,6 +46,13 @@ VALIDATORS = dict(
             default=NetworkType.IPV4.value,
         ),
         Validator('server.is_ipv6', is_type_of=bool, must_exist=False),
+        Validator('server.ssh_client.pool', default=True, is_type_of=bool),
+        Validator('server.ssh_client.pool_max_idle', default=300, is_type_of=int),
+        Validator('server.ssh_client.keepalive_interval', default=60, is_type_of=int),
+        Validator('server.http_client.pool', default=True, is_type_of=bool),
+        Validator('server.http_client.pool_size', default=10, is_type_of=int),
+        Validator('server.http_client.retries', default=3, is_type_of=int),
+        Validator('server.http_client.backoff_factor', default=0.5, is_type_of=(int, float)),
     ],
     content_host=[
         Validator('content_host.default_rhel_version', must_exist=True),
@@ -50,6 +61,9 @@ VALIDATORS = dict(
             cast=NetworkType,
             default=NetworkType.IPV4.value,
         ),
+        Validator('content_host.pool.enabled', default=False, is_type_of=bool),
+        Validator('content_host.pool.depth', default=1, is_type_of=int, gte=1),
+        Validator('content_host.pool.max_workers', default=4, is_type_of=int, gte=1),
     ],
     subscription=[
         Validator('subscription.rhn_username', must_exist=True),
@@ -90,7 +104,13 @@ VALIDATORS = dict(
         ),
         Validator('azurerm.azure_region', is_in=AZURERM_VALID_REGIONS),
     ],
-    broker=[Validator('broker.broker_directory', default='.')],
+    broker=[
+        Validator('broker.broker_directory', default='.'),
+        Validator('broker.async_checkin.enabled', default=False, is_type_of=bool),
+        Validator('broker.async_checkin.max_workers', default=4, is_type_of=int, gte=1),
+        Validator('broker.async_checkin.retries', default=2, is_type_of=int, gte=0),
+        Validator('broker.async_checkin.retry_delay', default=30, is_type_of=(int, float)),
+    ],
     capsule=[
         Validator('capsule.version.release', must_exist=True),
         Validator(
@@ -100,6 +120,7 @@ VALIDATORS = dict(
         Validator('capsule.deploy_workflows.product', must_exist=True),
         Validator('capsule.deploy_workflows.os', must_exist=True),
         Validator('capsule.deploy_arguments', must_exist=True, is_type_of=dict, default={}),
+        Validator('capsule.preprovision', default=0, is_type_of=int, gte=0),
     ],
     libvirt=[
         Validator('libvirt.libvirt_hostname', must_exist=True),
@@ -269,6 +290,11 @@ VALIDATORS = dict(
             must_exist=True,
         ),
     ],
+    manifest=[
+        Validator('manifest.pool.enabled', default=False, is_type_of=bool),
+        Validator('manifest.pool.depth', default=2, is_type_of=int, gte=1),
+        Validator('manifest.pool.max_workers', default=2, is_type_of=int, gte=1),
+    ],
     mcp=[
         Validator(
             'foreman_mcp.username',
@@ -320,7 +346,11 @@ VALIDATORS = dict(
             must_exist=True,
         ),
     ],
-    performance=[Validator('performance.time_hammer', default=False)],
+    performance=[
+        Validator('performance.time_hammer', default=False),
+        Validator('performance.hammer_shell', default=False, is_type_of=bool),
+        Validator('performance.validate_hammer_options', default=False, is_type_of=bool),
+    ],
     report_portal=[
         Validator(
             'report_portal.portal_url',
@@ -424,6 +454,13 @@ VALIDATORS = dict(
             cast=lambda x: list(map(str, x)),
         ),
         Validator('robottelo.shared_resource_wait', default=60, cast=float),
+        Validator('robottelo.repository_pipeline.enabled', default=False, is_type_of=bool),
+        Validator(
+            'robottelo.repository_pipeline.max_concurrent_syncs',
+            default=4,
+            is_type_of=int,
+            gte=1,
+        ),
     ],
     shared_function=[
         Validator('shared_function.storage', is_in=('file', 'redis'), default='file'),
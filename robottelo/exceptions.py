@@ -1,5 +1,7 @@
 """Custom Errors for Robottelo"""
 
+from nailgun.entity_mixins import TaskFailedError
+
 
 class APIResponseError(Exception):
     """Indicates wrong API response"""
@@ -134,5 +136,27 @@ class CLIDataBaseError(CLIBaseError):
     """
 
 
+class CLIOptionError(CLIReturnCodeError):
+    """Error to be raised when a hammer command uses an unknown subcommand or
+    option, found before the command is run.
+    """
+
+
 class NoManifestProvidedError(Exception):
     """Raised when a manifest is not provided to a helper function that expects one"""
+
+
+class HammerShellError(Exception):
+    """Indicates a long-lived hammer session could not be used"""
+
+
+class EntityDependencyError(Exception):
+    """Raised when an entity is not created because an entity it depends on failed to be"""
+
+
+class ForemanTaskError(ExceptionGroup, TaskFailedError):
+    """Holds the failures of the ForemanTasks waited on together
+
+    It is a ``TaskFailedError`` as well, like the error of a single task waited on, even when the
+    tasks timed out.
+    """
@@ -0,0 +1,187 @@
+"""Release the hosts checked out from Broker without blocking the tests
+
+Tearing a host down and checking it in takes a while, and the next test used to wait for it.
+When ``settings.broker.async_checkin.enabled`` is set, :func:`release_hosts` hands the hosts to
+:data:`checkin_queue` instead, which unregisters, tears down and checks them in from a few
+background threads, retrying failed check-ins. ``pytest_plugins/async_checkin.py`` waits for the
+queue at the end of the session and reports the hosts which could not be checked in.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+import os
+import threading
+import time
+
+from broker import Broker
+
+from robottelo.config import settings
+from robottelo.logging import logger
+
+
+@dataclass
+class CheckinFailure:
+    hostnames: list
+    error: str
+
+
+class CheckinQueue:
+    """Tear down and check in hosts in background threads
+
+    :param int max_workers: Maximum number of hosts released at once.
+    :param int retries: Retries of a failed check-in.
+    :param float retry_delay: Delay before the first retry, doubled for each following retry.
+    """
+
+    def __init__(self, max_workers=4, retries=2, retry_delay=30):
+        self.max_workers = max_workers
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.failures = []
+        self._lock = threading.Lock()
+        self._executor = None
+        self._futures = set()
+        self._pid = os.getpid()
+
+    def enqueue(self, hosts, teardown=True, unregister=False, in_context=False):
+        """Release ``hosts`` in the background, see :func:`release_hosts`
+
+        :return: The future of the release.
+        """
+        with self._lock:
+            if (pid := os.getpid()) != self._pid:
+                # the threads of the parent process don't survive a fork
+                self._executor = None
+                self._futures.clear()
+                self._pid = pid
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='host-checkin'
+                )
+            future = self._executor.submit(
+                self._release, list(hosts), teardown, unregister, in_context
+            )
+            self._futures.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def drain(self, timeout=None):
+        """Wait for every enqueued host to be released
+
+        :return: The failures of all the releases so far.
+        """
+        with self._lock:
+            futures = set(self._futures)
+        if futures:
+            logger.info(f'Waiting for {len(futures)} host check-ins')
+            wait(futures, timeout=timeout)
+        return list(self.failures)
+
+    def _release(self, hosts, teardown, unregister, in_context):
+        # tearing down is best effort, the hosts are checked in anyway
+        for host in hosts:
+            if (error := _try_teardown(host, teardown, unregister)) is not None:
+                logger.warning(f'Failed to tear {host.hostname} down: {error}')
+        if not (hosts := _checkin_hosts(hosts, in_context)):
+            return
+        for attempt in range(self.retries + 1):
+            try:
+                Broker(hosts=hosts).checkin()
+                return
+            except Exception as err:
+                if attempt == self.retries:
+                    # recorded before the future is done, so drain() doesn't miss it
+                    logger.error(f'Failed to check in {", ".join(_hostnames(hosts))}: {err}')
+                    self.failures.append(
+                        CheckinFailure(hostnames=_hostnames(hosts), error=str(err))
+                    )
+                    return
+                delay = self.retry_delay * 2**attempt
+                logger.warning(
+                    f'Failed to check in {", ".join(_hostnames(hosts))}, retrying in {delay}s: '
+                    f'{err}'
+                )
+                time.sleep(delay)
+
+    def _done(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+
+checkin_queue = CheckinQueue()
+
+
+def _hostnames(hosts):
+    return [host.hostname or host.name for host in hosts]
+
+
+def _try_teardown(host, teardown, unregister):
+    """Unregister and tear ``host`` down, returning the error instead of raising it"""
+    try:
+        if unregister:
+            host.unregister()
+        if teardown:
+            host.teardown()
+    except Exception as err:
+        return err
+    return None
+
+
+def _checkin_hosts(hosts, in_context):
+    """Return the hosts to check in, like ``Broker.checkin`` does"""
+    if in_context:
+        return [host for host in hosts if not getattr(host, '_skip_context_checkin', False)]
+    return hosts
+
+
+def release_hosts(hosts, teardown=True, unregister=False, in_context=False):
+    """Unregister, tear down and check in ``hosts``
+
+    The hosts are released by :data:`checkin_queue` when ``settings.broker.async_checkin`` is
+    enabled, and right away otherwise.
+
+    :param list hosts: Hosts checked out from Broker.
+    :param bool teardown: Tear the hosts down before checking them in.
+    :param bool unregister: Unregister the hosts before checking them in.
+    :param bool in_context: Skip the check-in of the hosts with ``_skip_context_checkin`` set,
+        like leaving the context of Broker does.
+    :raises Exception: The last error tearing a host down, once the hosts are checked in, when
+        they are released right away.
+    """
+    async_checkin = settings.broker.async_checkin
+    if async_checkin.enabled:
+        checkin_queue.max_workers = async_checkin.max_workers
+        checkin_queue.retries = async_checkin.retries
+        checkin_queue.retry_delay = async_checkin.retry_delay
+        checkin_queue.enqueue(
+            hosts, teardown=teardown, unregister=unregister, in_context=in_context
+        )
+        return
+    last_error = None
+    for host in hosts:
+        if (error := _try_teardown(host, teardown, unregister)) is not None:
+            logger.warning(f'Failed to tear {host.hostname} down: {error}')
+            last_error = error
+    if checkin_hosts := _checkin_hosts(hosts, in_context):
+        Broker(hosts=checkin_hosts).checkin()
+    if last_error is not None:
+        raise last_error
+
+
+@contextmanager
+def setup_hosts(hosts):
+    """Set ``hosts`` up and release them when leaving the context
+
+    This does what using Broker as a context manager does after the checkout, but releases the
+    hosts with :func:`release_hosts`.
+
+    :param hosts: A host, or a list of hosts, checked out from Broker.
+    """
+    host_list = hosts if isinstance(hosts, list) else [hosts]
+    try:
+        for host in host_list:
+            host.setup()
+        yield hosts
+    finally:
+        release_hosts(host_list, in_context=True)
@@ -3,12 +3,16 @@ It is not meant to be used directly, but as part of a robottelo.hosts.Satellite
 example: my_satellite.api_factory.api_method()
 """
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
+from graphlib import TopologicalSorter
 import time
 
 from fauxfactory import gen_ipaddr, gen_mac, gen_string
 from nailgun.client import request
+from nailgun.entity_fields import OneToManyField, OneToOneField
 from nailgun.entity_mixins import call_entity_method_with_timeout
 from requests import HTTPError
 
@@ -17,10 +21,40 @@ from robottelo.constants import (
     DEFAULT_ARCHITECTURE,
     REPO_TYPE,
 )
-from robottelo.exceptions import APIResponseError
+from robottelo.exceptions import APIResponseError, EntityDependencyError
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
 
 
+@dataclass
+class BulkCreateResult:
+    """Outcome of the creation of a single entity by :meth:`APIFactory.bulk_create`
+
+    ``entity`` is the created entity, ``error`` the exception raised when it could not be.
+    """
+
+    entity: object = None
+    error: Exception | None = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _related_entities(entity):
+    """Yield ``(field name, entity)`` for the entities referenced by the fields of ``entity``
+
+    Those are the values of its ``OneToOneField`` and ``OneToManyField`` fields, which are the
+    relationships ``scripts/graph_entities.py`` draws.
+    """
+    for name, field in entity.get_fields().items():
+        value = getattr(entity, name, None)
+        if isinstance(field, OneToOneField) and value is not None:
+            yield name, value
+        elif isinstance(field, OneToManyField):
+            for related in value or ():
+                yield name, related
+
+
 class APIFactory:
     """This class is part of a mixin and not to be used directly. See robottelo.hosts.Satellite"""
 
@@ -28,6 +62,123 @@ class APIFactory:
         self._satellite = satellite
         self.__dict__.update(initiate_repo_helpers(self._satellite))
 
+    def bulk_create(self, entity_cls, specs, max_workers=None):
+        """Create an entity of ``entity_cls`` for each dictionary of field values of ``specs``
+
+        The entities are independent, so they are created concurrently, see
+        :meth:`bulk_create_related`.
+
+        :param entity_cls: A nailgun entity class, or the name of an entity of ``Satellite.api``.
+        :param list specs: Field values of each entity.
+        :param int max_workers: Entities created at once, defaults to
+            ``settings.server.http_client.pool_size``.
+        :return: A list of :class:`BulkCreateResult`, in the order of ``specs``.
+        """
+        if isinstance(entity_cls, str):
+            entity_cls = getattr(self._satellite.api, entity_cls)
+        entities, results = [], []
+        for spec in specs:
+            try:
+                entities.append(entity_cls(**spec))
+                results.append(None)
+            except Exception as err:
+                results.append(BulkCreateResult(error=err))
+        created = iter(self.bulk_create_related(entities, max_workers=max_workers))
+        return [result or next(created) for result in results]
+
+    def bulk_create_related(self, entities, max_workers=None):
+        """Create ``entities``, which may reference each other, concurrently
+
+        An entity referencing another entity of ``entities`` through a ``OneToOneField`` or a
+        ``OneToManyField`` is created once the referenced entity is, and refers to the created
+        entity then. Entities which don't depend on each other are created at once, e.g.::
+
+            org = sat.api.Organization()
+            location = sat.api.Location(organization=[org])
+            users = [sat.api.User(organization=[org], location=[location]) for _ in range(100)]
+            results = sat.api_factory.bulk_create_related([org, location, *users])
+
+        An entity is not created when an entity it depends on failed to be, its result holds an
+        :class:`robottelo.exceptions.EntityDependencyError` then.
+
+        :param list entities: Entities which are not created yet.
+        :param int max_workers: Entities created at once, defaults to
+            ``settings.server.http_client.pool_size``.
+        :return: A list of :class:`BulkCreateResult`, in the order of ``entities``.
+        :raises graphlib.CycleError: If the entities depend on each other.
+        """
+        indexes = {id(entity): index for index, entity in enumerate(entities)}
+        graph = TopologicalSorter()
+        for index, entity in enumerate(entities):
+            graph.add(
+                index,
+                *{
+                    indexes[id(related)]
+                    for _, related in _related_entities(entity)
+                    if id(related) in indexes and related is not entity
+                },
+            )
+        graph.prepare()
+        results = [None] * len(entities)
+        with ThreadPoolExecutor(
+            max_workers=max_workers or settings.server.http_client.pool_size
+        ) as executor:
+            futures = {}
+            while graph.is_active():
+                for index in graph.get_ready():
+                    entity = entities[index]
+                    failed = [
+                        related
+                        for _, related in _related_entities(entity)
+                        if id(related) in indexes
+                        and related is not entity
+                        and not results[indexes[id(related)]].ok
+                    ]
+                    if failed:
+                        results[index] = BulkCreateResult(
+                            error=EntityDependencyError(
+                                f'{type(entity).__name__} depends on '
+                                f'{type(failed[0]).__name__} which failed to be created'
+                            )
+                        )
+                        graph.done(index)
+                        continue
+                    self._refer_to_created(entity, indexes, results)
+                    futures[executor.submit(entity.create)] = index
+                if not futures:
+                    continue
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures.pop(future)
+                    try:
+                        results[index] = BulkCreateResult(entity=future.result())
+                    except Exception as err:
+                        results[index] = BulkCreateResult(error=err)
+                    graph.done(index)
+        return results
+
+    @staticmethod
+    def _refer_to_created(entity, indexes, results):
+        """Replace the entities referenced by ``entity`` by the created ones
+
+        References of ``entity`` to itself are kept, it isn't created yet.
+        """
+        for name, field in entity.get_fields().items():
+            value = getattr(entity, name, None)
+            if isinstance(field, OneToOneField) and id(value) in indexes and value is not entity:
+                setattr(entity, name, results[indexes[id(value)]].entity)
+            elif isinstance(field, OneToManyField) and value:
+                setattr(
+                    entity,
+                    name,
+                    [
+                        results[indexes[id(related)]].entity
+                        if id(related) in indexes and related is not entity
+                        else related
+                        for related in value
+                    ],
+                )
+
     def make_http_proxy(self, org, http_proxy_type):
         """
         Creates HTTP proxy.
@@ -424,13 +575,14 @@ class APIFactory:
         :param int from_when: Epoch Time (seconds in UTC) to limit number of returned tasks to investigate.
         :param int search_rate: Delay between searches.
         :param int max_tries: How many times search should be executed.
-        :param int poll_rate: Delay between the end of one task check-up and
-                the start of the next check-up. Parameter for
-                ``nailgun.entities.ForemanTask.poll()`` method.
+        :param int poll_rate: Maximum delay between two check-ups of the tasks, see
+                ``sat.task_watcher``.
         :param int poll_timeout: Maximum number of seconds to wait until timing out.
-                Parameter for ``nailgun.entities.ForemanTask.poll()`` method.
         :return: Relevant errata applicability task.
         :raises: ``AssertionError``. If not tasks were found for given host until timeout.
+        :raises: ``nailgun.entity_mixins.TaskFailedError``. If a task failed, a
+            ``robottelo.exceptions.ForemanTaskError`` when several tasks failed or timed out.
+        :raises: ``nailgun.entity_mixins.TaskTimedOutError``. If the only task timed out.
         """
         assert isinstance(host_id, int), 'Param host_id have to be int'
         assert isinstance(from_when, int), 'Param from_when have to be int'
@@ -450,20 +602,24 @@ class APIFactory:
                 f' started_at >= "{long_format}" '
             )
             tasks = self._satellite.api.ForemanTask().search(query={'search': search_query})
-            tasks_finished = 0
-            for task in tasks:
+            host_tasks = [
+                task.id
+                for task in tasks
                 if (
                     task.label == 'Actions::Katello::Applicability::Hosts::BulkGenerate'
                     and 'host_ids' in task.input
                     and host_id in task.input['host_ids']
-                ) or (
+                )
+                or (
                     task.label == 'Actions::Katello::Host::UploadPackageProfile'
                     and 'host' in task.input
                     and host_id == task.input['host']['id']
-                ):
-                    task.poll(poll_rate=poll_rate, timeout=poll_timeout)
-                    tasks_finished += 1
-            if tasks_finished > 0:
+                )
+            ]
+            if host_tasks:
+                self._satellite.task_watcher.wait(
+                    host_tasks, timeout=poll_timeout, max_interval=poll_rate
+                )
                 break
             time.sleep(search_rate)
         else:
@@ -51,19 +51,25 @@ class CapsuleInfo:
         :param search_query: Search query that will be passed to API call.
         :param search_rate: Delay between searches.
         :param max_tries: How many times search should be executed.
-        :param poll_rate: Delay between the end of one task check-up and
-            the start of the next check-up. Parameter for ``sat.api.ForemanTask.poll()`` method.
+        :param poll_rate: Maximum delay between two check-ups of the tasks, see
+            ``sat.task_watcher``.
         :param poll_timeout: Maximum number of seconds to wait until timing out.
-            Parameter for ``sat.api.ForemanTask.poll()`` method.
         :param must_succeed: Assert success result on finished task.
         :return: List of ``sat.api.ForemanTask`` entities.
         :raises: ``AssertionError``. If not tasks were found until timeout.
+        :raises: ``nailgun.entity_mixins.TaskFailedError``. If a task failed, a
+            ``robottelo.exceptions.ForemanTaskError`` when several tasks failed or timed out.
+        :raises: ``nailgun.entity_mixins.TaskTimedOutError``. If the only task timed out.
         """
         for _ in range(max_tries):
             tasks = self.satellite.api.ForemanTask().search(query={'search': search_query})
             if tasks:
-                for task in tasks:
-                    task.poll(poll_rate=poll_rate, timeout=poll_timeout, must_succeed=must_succeed)
+                self.satellite.task_watcher.wait(
+                    [task.id for task in tasks],
+                    timeout=poll_timeout,
+                    must_succeed=must_succeed,
+                    max_interval=poll_rate,
+                )
                 break
             time.sleep(search_rate)
         else:
@@ -111,12 +117,12 @@ class CapsuleInfo:
             f" and the `last_sync_time`: {sync_status['last_sync_time']},"
             f" was prior to the `start_time`: {start_time}."
         )
-        sync_tasks = []
         # Poll and verify succeeds, any active sync task from initial status.
         logger.info(f"Active tasks: {sync_status['active_sync_tasks']}")
-        for task in sync_status['active_sync_tasks']:
-            sync_tasks.append(self.satellite.api.ForemanTask(id=task['id']).poll(timeout=timeout))
-            logger.info(f"Active sync task :id {task['id']} succeeded.")
+        sync_tasks = self.satellite.task_watcher.wait(
+            [task['id'] for task in sync_status['active_sync_tasks']], timeout=timeout
+        )
+        logger.info(f"Active sync tasks {[task['id'] for task in sync_tasks]} succeeded.")
 
         # Fetch updated capsule status (expect no ongoing sync)
         logger.info(f"Querying updated sync status from capsule {self.hostname}.")
@@ -5,7 +5,7 @@ example: my_satellite.cli_factory.make_org()
 """
 
 import datetime
-from functools import lru_cache, partial
+from functools import partial
 import inspect
 import os
 from os import chmod
@@ -28,6 +28,7 @@ from fauxfactory import (
 
 from robottelo import constants
 from robottelo.cli.proxy import CapsuleTunnelError
+from robottelo.cli.registry import CLI_ENTITIES
 from robottelo.config import settings
 from robottelo.exceptions import CLIFactoryError, CLIReturnCodeError
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
@@ -296,12 +297,12 @@ class CLIFactory:
             }
         return None
 
-    @lru_cache
     def _find_entity_class(self, entity_name):
         entity_name = entity_name.replace('_', '').lower()
-        for name, class_obj in self._satellite.cli.__dict__.items():
-            if entity_name == name.lower():
-                return class_obj
+        for name in CLI_ENTITIES:
+            if entity_name == name.replace('_', '').lower():
+                # the namespace caches the entity once it is looked up
+                return getattr(self._satellite.cli, name, None)
         return None
 
     def make_content_credential(self, options=None):
@@ -810,24 +811,24 @@ class CLIFactory:
             )
         except CLIReturnCodeError as err:
             raise CLIFactoryError(f'Failed to synchronize repository\n{err.msg}') from err
-        # Create CV if needed and associate repo with it
+        # Create CV if needed
         if options.get('content-view-id') is None:
             cv_id = self.make_content_view({'organization-id': org_id})['id']
         else:
             cv_id = options['content-view-id']
+        # Associate repo with the CV and publish a new version of CV in a single round-trip
         try:
-            self._satellite.cli.ContentView.add_repository(
-                {'id': cv_id, 'organization-id': org_id, 'repository-id': rhel_repo['id']}
-            )
-        except CLIReturnCodeError as err:
-            raise CLIFactoryError(f'Failed to add repository to content view\n{err.msg}') from err
-        # Publish a new version of CV
-        try:
-            self._satellite.cli.ContentView.publish({'id': cv_id})
+            with self._satellite.cli.batch() as batch:
+                batch.ContentView.add_repository(
+                    {'id': cv_id, 'organization-id': org_id, 'repository-id': rhel_repo['id']}
+                )
+                batch.ContentView.publish({'id': cv_id})
         except CLIReturnCodeError as err:
-            raise CLIFactoryError(
-                f'Failed to publish new version of content view\n{err.msg}'
-            ) from err
+            error = (
+                'Failed to add repository to content view',
+                'Failed to publish new version of content view',
+            )[batch.failed]
+            raise CLIFactoryError(f'{error}\n{err.msg}') from err
         # Get the version id
         try:
             cvv = self._satellite.cli.ContentView.info({'id': cv_id})['versions'][-1]
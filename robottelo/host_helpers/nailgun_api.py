@@ -0,0 +1,85 @@
+"""Namespaces of nailgun entities bound to the server config of a Satellite
+
+:attr:`robottelo.hosts.Satellite.api` exposes every nailgun entity as a subclass whose
+``__init__`` defaults to the server config of that Satellite. Building a subclass for each of the
+hundreds of nailgun entities is too costly to be done for every ``Satellite`` object, so a
+subclass is only built the first time it is looked up. The namespaces, and the subclasses they
+built, are cached for the whole process per server config, which every ``Satellite`` pointing to
+the same server shares.
+"""
+
+import functools
+import threading
+
+_namespaces = {}
+_lock = threading.Lock()
+
+
+def bind_server_config(cls, server_config):
+    """Return a subclass of the nailgun entity ``cls`` using ``server_config`` by default"""
+    return type(
+        cls.__name__,
+        (cls,),
+        {
+            '__init__': functools.partialmethod(cls.__init__, server_config=server_config),
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+        },
+    )
+
+
+def _is_entity(obj):
+    from nailgun.entity_mixins import Entity
+
+    return isinstance(obj, type) and issubclass(obj, Entity)
+
+
+class NailgunAPI:
+    """Namespace of the nailgun entities bound to ``server_config``
+
+    Use :func:`get_api` rather than creating namespaces directly, so they are shared.
+    """
+
+    def __init__(self, server_config):
+        self.server_config = server_config
+
+    def __getattr__(self, name):
+        # only called when the entity was not looked up yet
+        from nailgun import entities
+
+        if name.startswith('__') or not _is_entity(obj := getattr(entities, name, None)):
+            raise AttributeError(f'nailgun has no entity named {name!r}')
+        with _lock:
+            if (entity := self.__dict__.get(name)) is None:
+                entity = bind_server_config(obj, self.server_config)
+                setattr(self, name, entity)
+        return entity
+
+    def __dir__(self):
+        from nailgun import entities
+
+        return sorted(
+            {*super().__dir__(), *(name for name, obj in vars(entities).items() if _is_entity(obj))}
+        )
+
+
+def get_api(url, auth, verify):
+    """Return the namespace of nailgun entities for the given server config
+
+    :param str url: URL of the Satellite.
+    :param tuple auth: Credentials used by the entities.
+    :param verify: ``verify`` argument of the requests sent by the entities.
+    """
+    key = (url, tuple(auth) if auth else auth, verify)
+    with _lock:
+        if (api := _namespaces.get(key)) is None:
+            from nailgun.config import ServerConfig
+
+            api = _namespaces[key] = NailgunAPI(ServerConfig(url=url, auth=auth, verify=verify))
+    return api
+
+
+def clear_cache():
+    """Forget every namespace, e.g. after another version of nailgun was installed"""
+    with _lock:
+        _namespaces.clear()
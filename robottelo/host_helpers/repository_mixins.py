@@ -3,12 +3,17 @@ All the Repository classes in this module are supposed to use from sat_object.cl
 The direct import of the repo classes in this module is prohibited !!!!!
 """
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import inspect
 import sys
 
+from nailgun.entity_mixins import TaskFailedError, TaskTimedOutError
+
 from robottelo import constants
 from robottelo.config import settings
 from robottelo.exceptions import (
+    CLIReturnCodeError,
     DistroNotSupportedError,
     OnlyOneOSRepositoryAllowed,
     ReposContentSetupWasNotPerformed,
@@ -16,6 +21,12 @@ from robottelo.exceptions import (
     RepositoryAlreadyDefinedError,
     RepositoryDataNotFound,
 )
+from robottelo.logging import logger
+
+# seconds to wait for the sync of a repository, as for ``hammer repository synchronize``
+REPOSITORY_SYNC_TIMEOUT = 4800
+# status of ``hammer repository synchronize`` when the sync task failed or timed out
+REPOSITORY_SYNC_ERROR_STATUS = 70
 
 
 def initiate_repo_helpers(satellite):
@@ -26,6 +37,19 @@ def initiate_repo_helpers(satellite):
     }
 
 
+def _sync_error(repo, error):
+    """Return the error of the failed sync task of ``repo`` as hammer would raise it"""
+    if not isinstance(error, TaskFailedError | TaskTimedOutError):
+        return error
+    msg = (
+        f'Command "repository synchronize" finished with status {REPOSITORY_SYNC_ERROR_STATUS}\n'
+        f'stderr contains:\n{error}'
+    )
+    sync_error = CLIReturnCodeError(REPOSITORY_SYNC_ERROR_STATUS, str(error), msg)
+    sync_error.__cause__ = error
+    return sync_error
+
+
 class BaseRepository:
     """Base repository class for custom and RH repositories"""
 
@@ -105,7 +129,13 @@ class BaseRepository:
 
     def synchronize(self):
         """Synchronize the repository"""
-        self.satellite.cli.Repository.synchronize({'id': self.repo_info['id']}, timeout=4800000)
+        self.satellite.cli.Repository.synchronize(
+            {'id': self.repo_info['id']}, timeout=REPOSITORY_SYNC_TIMEOUT * 1000
+        )
+
+    def start_synchronize(self):
+        """Start synchronizing the repository and return the ID of the sync task"""
+        return self.satellite.api.Repository(id=self.repo_info['id']).sync(synchronous=False)['id']
 
     def add_to_content_view(self, organization_id, content_view_id):
         """Associate repository content to content-view"""
@@ -625,29 +655,56 @@ class RepositoryCollection:
     def __iter__(self):
         yield from self._items
 
-    def setup(self, org_id, download_policy='on_demand', synchronize=True):
+    def setup(
+        self,
+        org_id,
+        download_policy='on_demand',
+        synchronize=True,
+        pipelined=None,
+        max_concurrent_syncs=None,
+    ):
         """Setup the repositories on server.
 
         Recommended usage: repository only setup, for full content setup see
             setup_content.
+
+        In the pipelined mode, the repositories are created concurrently, then their syncs are
+        started asynchronously and waited on with the task watcher of the Satellite, instead of
+        creating and syncing the repositories one after another.
+
+        :param bool pipelined: Use the pipelined mode, defaults to
+            ``settings.robottelo.repository_pipeline.enabled``.
+        :param int max_concurrent_syncs: Maximum number of repositories synced at once in the
+            pipelined mode, defaults to
+            ``settings.robottelo.repository_pipeline.max_concurrent_syncs``.
         """
         if self._repos_info:
             raise RepositoryAlreadyCreated('Repositories already created')
+        if pipelined is None:
+            pipelined = settings.robottelo.repository_pipeline.enabled
         custom_product = None
-        repos_info = []
         if any(not repo.cdn for repo in self):
             custom_product = self.satellite.cli_factory.make_product_wait(
                 {'organization-id': org_id}
             )
         custom_product_id = custom_product['id'] if custom_product else None
-        for repo in self:
-            repo_info = repo.create(
-                org_id,
-                custom_product_id,
-                download_policy=download_policy,
-                synchronize=synchronize,
-            )
-            repos_info.append(repo_info)
+        if pipelined:
+            repos_info = self._create_concurrently(org_id, custom_product_id, download_policy)
+            if synchronize:
+                self._synchronize_concurrently(
+                    max_concurrent_syncs
+                    or settings.robottelo.repository_pipeline.max_concurrent_syncs
+                )
+        else:
+            repos_info = [
+                repo.create(
+                    org_id,
+                    custom_product_id,
+                    download_policy=download_policy,
+                    synchronize=synchronize,
+                )
+                for repo in self
+            ]
         self._custom_product_info = custom_product
         self._repos_info = repos_info
         # Wait for metadata generation for repository creation for specific org
@@ -659,6 +716,61 @@ class RepositoryCollection:
         )
         return custom_product, repos_info
 
+    def _create_concurrently(self, org_id, product_id, download_policy):
+        """Create all the repositories at once, without syncing them
+
+        :return: The information about each repository, in the order of the collection.
+        :raises: The error of the first repository in the collection that failed to be created.
+        """
+        repos = list(self)
+        with ThreadPoolExecutor(max_workers=max(len(repos), 1)) as executor:
+            futures = [
+                executor.submit(
+                    repo.create,
+                    org_id,
+                    product_id,
+                    download_policy=download_policy,
+                    synchronize=False,
+                )
+                for repo in repos
+            ]
+        return [future.result() for future in futures]
+
+    def _synchronize_concurrently(self, max_concurrent_syncs):
+        """Sync the created repositories, ``max_concurrent_syncs`` at most at once
+
+        No sync is started anymore once a sync failed, the running ones are waited on. A failed or
+        timed out sync task raises a ``CLIReturnCodeError``, as ``hammer repository synchronize``
+        does in the sequential mode.
+
+        :raises: The error of the first repository in the collection whose sync failed.
+        """
+        task_watcher = self.satellite.task_watcher
+        pending = deque(self)
+        running = {}
+        errors = {}
+        while running or (pending and not errors):
+            while pending and not errors and len(running) < max_concurrent_syncs:
+                repo = pending.popleft()
+                try:
+                    task_id = repo.start_synchronize()
+                except Exception as err:
+                    errors[repo] = err
+                    break
+                running[task_watcher.watch(task_id, timeout=REPOSITORY_SYNC_TIMEOUT)] = repo
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                repo = running.pop(future)
+                if (error := future.exception()) is not None:
+                    errors[repo] = _sync_error(repo, error)
+        if errors:
+            failed = [repo for repo in self if repo in errors]
+            for repo in failed[1:]:
+                logger.error(f'Failed to sync {repo}: {errors[repo]}')
+            raise errors[failed[0]]
+
     def setup_content_view(self, org_id, lce_id=None):
         """Setup organization content view by adding all the repositories, publishing and promoting
         to lce if needed.
@@ -670,11 +782,17 @@ class RepositoryCollection:
                 {'id': lce_id, 'organization-id': org_id}
             )
         content_view = self.satellite.cli_factory.make_content_view({'organization-id': org_id})
-        # Add repositories to content view
-        for repo in self:
-            repo.add_to_content_view(org_id, content_view['id'])
-        # Publish the content view
-        self.satellite.cli.ContentView.publish({'id': content_view['id']})
+        # Add repositories to content view and publish it in a single round-trip
+        with self.satellite.cli.batch() as batch:
+            for repo in self:
+                batch.ContentView.add_repository(
+                    {
+                        'id': content_view['id'],
+                        'organization-id': org_id,
+                        'repository-id': repo.repo_info['id'],
+                    }
+                )
+            batch.ContentView.publish({'id': content_view['id']})
         if lce['name'] != constants.ENVIRONMENT:
             # Get the latest content view version id
             content_view_version = self.satellite.cli.ContentView.info({'id': content_view['id']})[
@@ -706,16 +824,19 @@ class RepositoryCollection:
             }
         )
         if override is not None:
-            for repo in self.satellite.cli.ActivationKey.product_content(
-                {'id': activation_key['id'], 'content-access-mode-all': 1}
-            ):
-                self.satellite.cli.ActivationKey.content_override(
-                    {
-                        'id': activation_key['id'],
-                        'content-label': repo['label'],
-                        'value': int(override),
-                    }
-                )
+            # the overrides of an activation key are applied one after the other, as concurrent
+            # updates of the same activation key conflict
+            with self.satellite.cli.batch(max_parallel=1) as batch:
+                for repo in self.satellite.cli.ActivationKey.product_content(
+                    {'id': activation_key['id'], 'content-access-mode-all': 1}
+                ):
+                    batch.ActivationKey.content_override(
+                        {
+                            'id': activation_key['id'],
+                            'content-label': repo['label'],
+                            'value': int(override),
+                        }
+                    )
         if self.satellite.is_sca_mode_enabled(org_id):
             return activation_key
         # Add subscriptions to activation-key
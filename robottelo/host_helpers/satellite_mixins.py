@@ -1,13 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from functools import lru_cache
 import json
 import os
 import random
 import re
+import time
 from urllib.parse import urljoin
 from urllib.request import urlopen
 
 from broker.hosts import Host
+from dateutil.parser import parse
 from fauxfactory import gen_string
 import requests
 from wait_for import TimedOutError, wait_for
@@ -25,6 +30,7 @@ from robottelo.exceptions import CLIReturnCodeError, NoManifestProvidedError
 from robottelo.host_helpers.api_factory import APIFactory
 from robottelo.host_helpers.cli_factory import CLIFactory
 from robottelo.host_helpers.ui_factory import UIFactory
+from robottelo.http_sessions import pooled_requests
 from robottelo.logging import logger
 from robottelo.utils.installer import InstallerCommand
 
@@ -44,9 +50,121 @@ class EnablePluginsSatellite:
         return self
 
 
+@dataclass
+class CapsuleSyncResult:
+    """Sync of a single capsule by :meth:`ContentInfo.sync_capsules`
+
+    ``duration`` is the number of seconds the sync task ran.
+    """
+
+    capsule: object
+    task: dict
+    duration: float
+    last_sync_time: str
+
+
+@dataclass
+class CapsuleSyncReport:
+    """Syncs of :meth:`ContentInfo.sync_capsules`
+
+    ``duration`` is the number of seconds until every capsule was synced and verified.
+    """
+
+    results: list
+    duration: float
+
+    @property
+    def throughput(self):
+        """Capsules synced per hour"""
+        return len(self.results) * 3600 / self.duration if self.duration else 0.0
+
+    @property
+    def speedup(self):
+        """Time the syncs would have taken one after another, relative to ``duration``"""
+        return (
+            sum(result.duration for result in self.results) / self.duration
+            if self.duration
+            else 0.0
+        )
+
+
 class ContentInfo:
     """Miscellaneous content helper methods"""
 
+    def sync_capsules(self, capsules, lce=None, timeout=3600, max_workers=None):
+        """Sync ``capsules`` at once and verify every one of them is synced
+
+        The syncs are started concurrently and their tasks are waited on together through
+        ``sat.task_watcher``, so the topology is synced in about the time the slowest capsule
+        takes. Each capsule is verified like :meth:`CapsuleInfo.wait_for_sync` does.
+
+        :param capsules: Capsules to sync, which are assigned to this satellite.
+        :param lce: Only sync this lifecycle environment, an entity or an ID.
+        :param int timeout: Maximum number of seconds to wait for each sync.
+        :param int max_workers: Capsules handled at once, defaults to all of them.
+        :return: A :class:`CapsuleSyncReport`.
+        :raises nailgun.entity_mixins.TaskFailedError: If a sync task failed, a
+            ``robottelo.exceptions.ForemanTaskError`` when several of them failed or timed out.
+        :raises nailgun.entity_mixins.TaskTimedOutError: If the only sync task timed out.
+        :raises AssertionError: If any capsule is not synced afterwards.
+        """
+        if not capsules:
+            return CapsuleSyncReport(results=[], duration=0.0)
+        data = {} if lce is None else {'environment_id': getattr(lce, 'id', lce)}
+        # 1s margin of safety for rounding, as last_sync_time has no microseconds
+        start_time = datetime.now(UTC).replace(microsecond=0) - timedelta(seconds=1)
+        started = time.monotonic()
+
+        def start_sync(capsule):
+            nailgun_capsule = self.api.Capsule().search(
+                query={'search': f'name={capsule.hostname}'}
+            )[0]
+            return nailgun_capsule, nailgun_capsule.content_sync(synchronous=False, data=data)
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(capsules)) as executor:
+            nailgun_capsules, tasks = zip(*executor.map(start_sync, capsules), strict=True)
+            logger.info(
+                f'Waiting for the sync of capsules {[capsule.hostname for capsule in capsules]}'
+            )
+            tasks = self.task_watcher.wait([task['id'] for task in tasks], timeout=timeout)
+            statuses = list(
+                executor.map(
+                    lambda nailgun_capsule: nailgun_capsule.content_get_sync(
+                        timeout=timeout, synchronous=True
+                    ),
+                    nailgun_capsules,
+                )
+            )
+        report = CapsuleSyncReport(results=[], duration=time.monotonic() - started)
+        failures = []
+        for capsule, task, status in zip(capsules, tasks, statuses, strict=True):
+            if status['active_sync_tasks'] or status['last_failed_sync_tasks']:
+                failures.append(
+                    f'{capsule.hostname}: active sync tasks {status["active_sync_tasks"]},'
+                    f' failed sync tasks {status["last_failed_sync_tasks"]}'
+                )
+            elif not status['last_sync_time'] or parse(status['last_sync_time']) < start_time:
+                failures.append(
+                    f'{capsule.hostname}: `last_sync_time` {status["last_sync_time"]}'
+                    f' is prior to the start of the sync {start_time}'
+                )
+            duration = (parse(task['ended_at']) - parse(task['started_at'])).total_seconds()
+            report.results.append(
+                CapsuleSyncResult(
+                    capsule=capsule,
+                    task=task,
+                    duration=duration,
+                    last_sync_time=status['last_sync_time'],
+                )
+            )
+            logger.info(f'Capsule {capsule.hostname} synced in {duration:.0f}s')
+        logger.info(
+            f'{len(capsules)} capsules synced in {report.duration:.0f}s,'
+            f' {report.speedup:.1f}x faster than one after another'
+        )
+        assert not failures, f'Capsules are not synced: {"; ".join(failures)}'
+        return report
+
     def get_repo_files(self, repo_path, extension='rpm'):
         """Returns a list of repo files (for example rpms) in specific repository
         directory.
@@ -79,7 +197,7 @@ class ContentInfo:
         if not url.endswith('/'):
             url += '/'
 
-        result = requests.get(url, verify=False)
+        result = pooled_requests.get(url, verify=False)
         if result.status_code != 200:
             raise requests.HTTPError(f'{url} is not accessible')
 
@@ -102,7 +220,7 @@ class ContentInfo:
         :return: string with repomd content
         """
         repomd_path = 'repodata/repomd.xml'
-        result = requests.get(f'{repo_url}/{repomd_path}', verify=False)
+        result = pooled_requests.get(f'{repo_url}/{repomd_path}', verify=False)
         if result.status_code != 200:
             raise requests.HTTPError(f'{repo_url}/{repomd_path} is not accessible')
 
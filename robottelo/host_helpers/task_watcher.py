@@ -0,0 +1,205 @@
+"""Batched polling of the ForemanTasks of a Satellite
+
+``ForemanTask.poll`` checks a single task at a fixed rate, so waiting on 20 tasks one after
+another means 20 polling loops. A :class:`TaskWatcher` checks every task it watches with a single
+search per polling interval instead. The interval starts short, grows exponentially with jitter
+while no task finishes, and is reset when a task finishes or a new one is watched. A task watched
+by several callers is searched once, each caller keeping its own timeout and ``must_succeed``.
+
+Get the watcher of a Satellite through ``Satellite.task_watcher``.
+"""
+
+from concurrent.futures import Future
+from dataclasses import dataclass
+import os
+import random
+import threading
+import time
+
+from nailgun import entity_mixins
+from nailgun.entity_mixins import TaskFailedError, TaskTimedOutError
+
+from robottelo.exceptions import ForemanTaskError
+from robottelo.logging import logger
+
+# states of a task which is not running anymore
+FINISHED_STATES = ('paused', 'stopped')
+
+
+@dataclass
+class _Waiter:
+    future: Future
+    deadline: float
+    must_succeed: bool
+    max_interval: float
+
+
+class TaskWatcher:
+    """Wait for the ForemanTasks of ``satellite``, polling all of them at once
+
+    :param satellite: The Satellite running the tasks.
+    :param float min_interval: Initial delay between two searches, in seconds.
+    :param float max_interval: Maximum delay between two searches, in seconds, defaults to
+        ``nailgun.entity_mixins.TASK_POLL_RATE`` as ``ForemanTask.poll`` uses. Callers waiting on
+        long tasks may pass a longer one to :meth:`watch`.
+    :param float backoff: Factor applied to the delay after a search in which no task finished.
+    :param float jitter: Relative amount of randomness added to each delay.
+    """
+
+    def __init__(self, satellite, min_interval=1, max_interval=None, backoff=1.5, jitter=0.1):
+        self.satellite = satellite
+        self.min_interval = min_interval
+        self.max_interval = max_interval or entity_mixins.TASK_POLL_RATE
+        self.backoff = backoff
+        self.jitter = jitter
+        self._watches = {}
+        self._condition = threading.Condition()
+        self._thread = None
+        self._woken = False
+
+    def watch(self, task_id, timeout=None, must_succeed=True, max_interval=None, callback=None):
+        """Start watching the task ``task_id``
+
+        :param task_id: ID of the task.
+        :param int timeout: Maximum number of seconds to wait for the task, defaults to
+            ``nailgun.entity_mixins.TASK_TIMEOUT``.
+        :param bool must_succeed: Fail when the task finishes with a result other than success.
+        :param float max_interval: Maximum delay between two check-ups of this task, defaults to
+            the one of the watcher.
+        :param callback: Called with the future of the task once it is finished.
+        :return: A :class:`concurrent.futures.Future` of the task information, the same as
+            returned by ``ForemanTask.poll``. Its exception is a ``TaskFailedError`` or a
+            ``TaskTimedOutError`` when the task failed or timed out.
+        """
+        timeout = entity_mixins.TASK_TIMEOUT if timeout is None else timeout
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        waiter = _Waiter(
+            future=future,
+            deadline=time.monotonic() + timeout,
+            must_succeed=must_succeed,
+            max_interval=max_interval or self.max_interval,
+        )
+        with self._condition:
+            # a task watched already is searched once for all its waiters
+            self._watches.setdefault(task_id, []).append(waiter)
+            self._woken = True
+            self._condition.notify()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f'task-watcher-{self.satellite.hostname}', daemon=True
+                )
+                self._thread.start()
+        return future
+
+    def wait(self, task_ids, timeout=None, must_succeed=True, max_interval=None):
+        """Wait for all tasks of ``task_ids`` to finish
+
+        :return: The information about each task, in the order of ``task_ids``.
+        :raises nailgun.entity_mixins.TaskFailedError: If the only task failed.
+        :raises nailgun.entity_mixins.TaskTimedOutError: If the only task timed out.
+        :raises robottelo.exceptions.ForemanTaskError: If any of several tasks failed or timed
+            out, it holds the error of every such task.
+        """
+        futures = [self.watch(task_id, timeout, must_succeed, max_interval) for task_id in task_ids]
+        errors = [future.exception() for future in futures]
+        if failed := [error for error in errors if error is not None]:
+            if len(futures) == 1:
+                raise failed[0]
+            raise ForemanTaskError(f'{len(failed)} of {len(futures)} tasks failed', failed)
+        return [future.result() for future in futures]
+
+    def _run(self):
+        interval = self.min_interval
+        while True:
+            with self._condition:
+                if not self._watches:
+                    self._thread = None
+                    return
+                if not self._woken:
+                    self._condition.wait(
+                        interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+                    )
+                if self._woken:
+                    self._woken = False
+                    interval = self.min_interval
+                # only _poll removes watches, so there are still some
+                task_ids = list(self._watches)
+                max_interval = min(
+                    waiter.max_interval
+                    for waiters in self._watches.values()
+                    for waiter in waiters
+                )
+            if self._poll(task_ids):
+                interval = self.min_interval
+            else:
+                interval = min(interval * self.backoff, max_interval)
+
+    def _poll(self, task_ids):
+        """Search ``task_ids`` once, resolve the finished waiters and return whether any were"""
+        try:
+            tasks = {
+                task['id']: task
+                for task in self.satellite.api.ForemanTask()
+                .search_json(
+                    query={
+                        'search': f'id ^ ({", ".join(str(task_id) for task_id in task_ids)})',
+                        'per_page': len(task_ids),
+                    }
+                )
+                .get('results', [])
+            }
+        except Exception as err:
+            # the search is retried with the next interval, the tasks time out meanwhile
+            logger.warning(f'Failed to search tasks on {self.satellite.hostname}: {err}')
+            tasks = {}
+        now = time.monotonic()
+        finished = []
+        with self._condition:
+            # waiters added since the search are resolved with it too
+            for task_id in task_ids:
+                task = tasks.get(task_id)
+                waiters = self._watches[task_id]
+                for waiter in list(waiters):
+                    if task is not None and task['state'] in FINISHED_STATES:
+                        if waiter.must_succeed and task['result'] != 'success':
+                            outcome = TaskFailedError(
+                                f'Task {task_id} did not succeed. Task information: {task}'
+                            )
+                        else:
+                            outcome = task
+                    elif now > waiter.deadline:
+                        outcome = TaskTimedOutError(
+                            f'Timed out polling task {task_id}. Task information: {task}'
+                        )
+                    else:
+                        continue
+                    waiters.remove(waiter)
+                    finished.append((waiter.future, outcome))
+                if not waiters:
+                    del self._watches[task_id]
+        for future, outcome in finished:
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+        return bool(finished)
+
+
+_watchers = {}
+_watchers_lock = threading.Lock()
+_watchers_pid = os.getpid()
+
+
+def get_task_watcher(satellite):
+    """Return the task watcher of ``satellite``, shared by the process per hostname"""
+    global _watchers_pid
+    with _watchers_lock:
+        if (pid := os.getpid()) != _watchers_pid:
+            # the polling threads don't survive a fork
+            _watchers.clear()
+            _watchers_pid = pid
+        if (watcher := _watchers.get(satellite.hostname)) is None:
+            watcher = _watchers[satellite.hostname] = TaskWatcher(satellite)
+    return watcher
@@ -0,0 +1,156 @@
+"""Pool of hosts checked out from Broker ahead of the tests needing them
+
+Checking a host out of Broker means waiting minutes for a VM or a container to be provisioned.
+A :class:`HostPool` is told up front which flavors of hosts (i.e. which Broker arguments) the
+tests of the session are going to need, and how many of them. It checks out up to ``depth`` hosts
+of each flavor in background threads, hands them out as the tests ask for them and checks out
+new ones to replace them, as long as some more tests need that flavor. Hosts left over at the end
+of the session are checked in by :meth:`HostPool.close`.
+
+Hosts can also be planned after :meth:`HostPool.start`, which suits processes learning which tests
+they run as they go, like xdist workers: the checkouts of those hosts start right away.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import json
+import threading
+
+from broker import Broker
+
+from robottelo.host_checkin import setup_hosts
+from robottelo.logging import logger
+
+
+def flavor_key(conf):
+    """Return a hashable key of the Broker arguments ``conf``"""
+    return json.dumps(conf, sort_keys=True, default=str)
+
+
+@dataclass
+class _Flavor:
+    conf: dict
+    # hosts still needed by the tests of the session
+    demand: int = 0
+    # futures of the hosts checked out, or being checked out, for the coming tests
+    ready: deque = field(default_factory=deque)
+
+
+class HostPool:
+    """Check out hosts of several flavors ahead of time
+
+    :param host_class: Class of the hosts checked out.
+    :param int depth: Maximum number of hosts checked out ahead of time per flavor.
+    :param int max_workers: Maximum number of concurrent checkouts.
+    """
+
+    def __init__(self, host_class, depth=1, max_workers=4):
+        self.host_class = host_class
+        self.depth = depth
+        self._flavors = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='host-pool')
+        self._started = False
+        self._closed = False
+
+    def __len__(self):
+        return len(self._flavors)
+
+    def plan(self, conf, count=1):
+        """Expect the tests to need ``count`` more hosts deployed with the Broker args ``conf``
+
+        Once the pool is started, hosts of ``conf`` are checked out right away.
+        """
+        with self._lock:
+            key = flavor_key(conf)
+            flavor = self._flavors.setdefault(key, _Flavor(conf=dict(conf)))
+            flavor.demand += count
+            self._refill(flavor)
+
+    def start(self):
+        """Start checking out the hosts of every planned flavor"""
+        with self._lock:
+            self._started = True
+            for flavor in self._flavors.values():
+                self._refill(flavor)
+
+    def take(self, conf, count=1):
+        """Return up to ``count`` hosts deployed with the Broker args ``conf`` ahead of time
+
+        Waits for the hosts still being provisioned. Fewer hosts are returned when not enough were
+        checked out ahead of time, e.g. for a flavor which was not planned or whose checkout
+        failed.
+
+        :return: The list of hosts, which the caller must check in.
+        """
+        with self._lock:
+            flavor = self._flavors.setdefault(flavor_key(conf), _Flavor(conf=dict(conf)))
+            futures = [flavor.ready.popleft() for _ in range(min(count, len(flavor.ready)))]
+            flavor.demand = max(flavor.demand - count, 0)
+            self._refill(flavor)
+        hosts = []
+        for future in futures:
+            try:
+                hosts.extend(future.result())
+            except Exception as err:
+                logger.warning(f'Failed to check out a host ahead of time with {conf}: {err}')
+        return hosts
+
+    def checkout(self, conf, count=1):
+        """Return ``count`` hosts deployed with the Broker args ``conf``
+
+        Hosts checked out ahead of time are used first, the missing ones are checked out right
+        away.
+
+        :return: The list of hosts, which the caller must check in.
+        """
+        hosts = self.take(conf, count)
+        if missing := count - len(hosts):
+            hosts.extend(self._checkout(conf, missing))
+        return hosts
+
+    @contextmanager
+    def hosts(self, conf, count=1):
+        """Set ``count`` hosts up, like ``Broker(**conf, _count=count)`` used as a context manager
+
+        The hosts are released by :func:`robottelo.host_checkin.release_hosts` when leaving the
+        context.
+
+        :return: The host, or the list of hosts when ``count`` is more than 1.
+        """
+        hosts = self.checkout(conf, count)
+        with setup_hosts(hosts):
+            yield hosts[0] if count == 1 else hosts
+
+    def close(self):
+        """Stop checking hosts out and check in the ones left over"""
+        with self._lock:
+            self._closed = True
+            futures = [future for flavor in self._flavors.values() for future in flavor.ready]
+            for flavor in self._flavors.values():
+                flavor.ready.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        leftovers = [
+            host
+            for future in futures
+            if not future.cancelled() and future.exception() is None
+            for host in future.result()
+        ]
+        if leftovers:
+            logger.info(f'Checking in {len(leftovers)} hosts left over in the host pool')
+            Broker(hosts=leftovers).checkin()
+
+    def _refill(self, flavor):
+        """Check out hosts of ``flavor`` up to the pool depth, must hold the lock"""
+        if self._closed or not self._started:
+            return
+        while len(flavor.ready) < min(self.depth, flavor.demand):
+            flavor.ready.append(self._executor.submit(self._checkout, flavor.conf, 1))
+
+    def _checkout(self, conf, count):
+        if count > 1:
+            conf = {**conf, '_count': count}
+        hosts = Broker(**conf, host_class=self.host_class).checkout()
+        return hosts if isinstance(hosts, list) else [hosts]
@@ -4,7 +4,6 @@ import contextlib
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from functools import cached_property, lru_cache
-import importlib
 import io
 import json
 from pathlib import Path, PurePath
@@ -23,14 +22,13 @@ from fauxfactory import gen_alpha, gen_string
 from nailgun import entities
 from packaging.version import Version
 import pytest
-import requests
 from ssh2.exceptions import AuthenticationError
 from wait_for import TimedOutError, wait_for
 from wrapanapi.entities.vm import VmState
 import yaml
 
 from robottelo import constants
-from robottelo.cli.base import Base
+from robottelo.cli import registry as cli_registry
 from robottelo.config import (
     configure_airgun,
     configure_nailgun,
@@ -66,7 +64,10 @@ from robottelo.host_helpers import (
     CapsuleMixins,
     ContentHostMixins,
     SatelliteMixins,
+    nailgun_api,
+    task_watcher,
 )
+from robottelo.http_sessions import pooled_requests, session_pool
 from robottelo.logging import logger
 from robottelo.utils import validate_ssh_pub_key
 from robottelo.utils.datafactory import valid_emails_list
@@ -1836,7 +1837,7 @@ class Capsule(ContentHost, CapsuleMixins):
 
     def get_features(self):
         """Get capsule features"""
-        return requests.get(f'https://{self.hostname}:9090/features', verify=False).text
+        return pooled_requests.get(f'https://{self.hostname}:9090/features', verify=False).text
 
     def capsule_setup(self, sat_host=None, capsule_cert_opts=None, **installer_kwargs):
         """Prepare the host and run the capsule installer"""
@@ -1929,29 +1930,11 @@ class Capsule(ContentHost, CapsuleMixins):
 
     @property
     def cli(self):
-        """Import only satellite-maintain robottelo cli entities and wrap them under self.cli"""
-        self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
+        """satellite-maintain robottelo cli entities bound to this capsule
 
-        for file in Path('robottelo/cli/').iterdir():
-            if (
-                file.suffix == '.py'
-                and not file.name.startswith('_')
-                and file.name.startswith('sm_')
-            ):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(name, (obj,), {'hostname': self.hostname})
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
-        return self._cli
+        See :mod:`robottelo.cli.registry`.
+        """
+        return cli_registry.get_cli(self.hostname, satellite_maintain_only=True)
 
     def enable_satellite_or_capsule_module_for_rhel8(self):
         """Enable Satellite/Capsule module for RHEL8.
@@ -1979,13 +1962,11 @@ class Satellite(Capsule, SatelliteMixins):
 
     def __init__(self, hostname=None, **kwargs):
         hostname = hostname or settings.server.hostname  # instance attr set by broker.Host
-        self.omitting_credentials = False
         self.port = kwargs.get('port', settings.server.port)
         kwargs.setdefault('net_type', settings.server.network_type)
         super().__init__(hostname=hostname, **kwargs)
-        # create dummy classes for later population
-        self._api = type('api', (), {'_configured': False})
-        self._cli = type('cli', (), {'_configured': False})
+        # populated on first access
+        self._api = None
         self._apidoc = None
         self.record_property = None
 
@@ -1997,49 +1978,29 @@ class Satellite(Capsule, SatelliteMixins):
 
         pip_main(['uninstall', '-y', 'nailgun'])
         pip_main(['install', f'https://github.com/SatelliteQE/nailgun/archive/{new_version}.zip'])
-        self._api = type('api', (), {'_configured': False})
+        self._api = None
+        nailgun_api.clear_cache()
         to_clear = [k for k in sys.modules if 'nailgun' in k]
         [sys.modules.pop(k) for k in to_clear]
 
     @property
     def api(self):
-        """Import all nailgun entities and wrap them under self.api"""
-        if not self._api:
-            self._api = type('api', (), {'_configured': False})
-        if self._api._configured:
-            return self._api
-        from nailgun import entities as _entities  # use a private import
-        from nailgun.config import ServerConfig
-        from nailgun.entity_mixins import Entity
-
-        def inject_config(cls, server_config):
-            """inject a nailgun server config into the init of nailgun entity classes"""
-            import functools
-
-            class DecClass(cls):
-                __init__ = functools.partialmethod(cls.__init__, server_config=server_config)
-
-            return DecClass
-
-        # set the server configuration to point to this satellite
-        self.nailgun_cfg = ServerConfig(
-            auth=(settings.server.admin_username, settings.server.admin_password),
-            url=f'{self.url}',
-            verify=settings.server.verify_ca,
-        )
-        # add each nailgun entity to self.api, injecting our server config
-        for name, obj in _entities.__dict__.items():
-            try:
-                if Entity in obj.mro():
-                    #  create a copy of the class and inject our server config into the __init__
-                    new_cls = type(name, (obj,), {})
-                    setattr(self._api, name, inject_config(new_cls, self.nailgun_cfg))
-            except AttributeError:
-                # not everything has an mro method, we don't care about them
-                pass
-        self._api._configured = True
+        """nailgun entities bound to this satellite, see :mod:`robottelo.host_helpers.nailgun_api`"""
+        if self._api is None:
+            self._api = nailgun_api.get_api(
+                url=f'{self.url}',
+                auth=(settings.server.admin_username, settings.server.admin_password),
+                verify=settings.server.verify_ca,
+            )
+            self.nailgun_cfg = self._api.server_config
         return self._api
 
+    @property
+    def task_watcher(self):
+        """Polls the ForemanTasks of this satellite in batches, see
+        :mod:`robottelo.host_helpers.task_watcher`"""
+        return task_watcher.get_task_watcher(self)
+
     @property
     def apidoc(self):
         """Provide Satellite's apidoc via apypie"""
@@ -2050,62 +2011,25 @@ class Satellite(Capsule, SatelliteMixins):
                 password=settings.server.admin_password,
                 api_version=2,
                 verify_ssl=settings.server.verify_ca,
+                session=session_pool.new_session(self.url)
+                if settings.server.http_client.pool
+                else None,
             ).apidoc
         return self._apidoc
 
     @property
     def cli(self):
-        """Import all robottelo cli entities and wrap them under self.cli"""
-        if not self._cli:
-            self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
-
-        for file in Path('robottelo/cli/').iterdir():
-            if file.suffix == '.py' and not file.name.startswith('_'):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(
-                                name,
-                                (obj,),
-                                {
-                                    'hostname': self.hostname,
-                                    'omitting_credentials': self.omitting_credentials,
-                                },
-                            )
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
-        return self._cli
+        """robottelo cli entities bound to this satellite, see :mod:`robottelo.cli.registry`"""
+        return cli_registry.get_cli(self.hostname)
+
+    @property
+    def omitting_credentials(self):
+        return self.cli.omitting_credentials
 
     @contextmanager
     def omit_credentials(self):
-        change = not self.omitting_credentials  # if not already set to omit
-        if change:
-            self.omitting_credentials = True
-            # if CLI is already created
-            if self._cli._configured:
-                for name, obj in self._cli.__dict__.items():
-                    with contextlib.suppress(
-                        AttributeError
-                    ):  # not everything has an mro method, we don't care about them
-                        if Base in obj.mro():
-                            getattr(self._cli, name).omitting_credentials = True
-        yield
-        if change:
-            self.omitting_credentials = False
-            if self._cli._configured:
-                for name, obj in self._cli.__dict__.items():
-                    with contextlib.suppress(
-                        AttributeError
-                    ):  # not everything has an mro method, we don't care about them
-                        if Base in obj.mro():
-                            getattr(self._cli, name).omitting_credentials = False
+        with self.cli.omit_credentials():
+            yield
 
     @contextmanager
     def ui_session(self, testname=None, user=None, password=None, url=None, login=True):
@@ -0,0 +1,175 @@
+"""Pooled HTTP connections to the Satellites and the external services used by tests
+
+The module-level functions of requests (``requests.get`` etc.) open a new connection, with a new
+TLS handshake, for every call. :data:`session_pool` keeps an adapter per (scheme, host, port)
+instead, whose connections are kept alive between requests. Connections which could not be
+established are retried with exponential backoff, and so are the ``502``/``503``/``504`` responses
+to ``GET``, ``HEAD`` and ``OPTIONS`` requests. Requests which may have reached the server are never
+sent again otherwise, as they may not be idempotent. It is configured by
+``settings.server.http_client``.
+
+:data:`pooled_requests` is a drop-in replacement for the requests module which sends requests
+through the pool. :func:`robottelo.config.configure_nailgun` makes nailgun use it, stateful
+clients like apypie get a session of their own from :meth:`HTTPSessionPool.new_session`.
+"""
+
+import atexit
+from http.cookiejar import DefaultCookiePolicy
+import os
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (502, 503, 504)
+# methods retried after an error response, which have no side effect
+RETRY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+class HTTPSessionPool:
+    """Process-wide pool of HTTP adapters keyed by (scheme, host, port)
+
+    Every xdist worker is its own process, so every worker gets its own pool. The pool is also
+    reset when the process forks, since connections can't be shared with a child process.
+
+    :param int pool_size: Connections kept alive per host.
+    :param int retries: Retries of a failed connection, or of a ``502``/``503``/``504`` response
+        to a request of :data:`RETRY_METHODS`.
+    :param float backoff_factor: Backoff factor between retries, see
+        :class:`urllib3.util.retry.Retry`.
+    """
+
+    def __init__(self, pool_size=10, retries=3, backoff_factor=0.5):
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._lock = threading.Lock()
+        self._adapters = {}
+        self._sessions = {}
+        self._pid = os.getpid()
+
+    def __len__(self):
+        return len(self._adapters)
+
+    def adapter(self, url):
+        """Return the adapter holding the connections to the host of ``url``"""
+        key = self._key(url)
+        with self._lock:
+            self._check_pid()
+            if (adapter := self._adapters.get(key)) is None:
+                adapter = self._adapters[key] = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.pool_size,
+                    max_retries=Retry(
+                        total=self.retries,
+                        # the request may have been processed when reading the response failed
+                        read=0,
+                        backoff_factor=self.backoff_factor,
+                        status_forcelist=RETRY_STATUSES,
+                        allowed_methods=RETRY_METHODS,
+                        raise_on_status=False,
+                    ),
+                )
+        return adapter
+
+    def new_session(self, url):
+        """Return a new session sending its requests through the pooled connections to ``url``
+
+        The session is the caller's own, its headers, auth and cookies are not shared.
+        """
+        session = requests.Session()
+        adapter = self.adapter(url)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def session(self, url):
+        """Return the session shared by the requests to the host of ``url``
+
+        Like the module-level functions of requests, the shared session keeps no state between
+        requests: cookies are not stored.
+        """
+        key = self._key(url)
+        with self._lock:
+            self._check_pid()
+            session = self._sessions.get(key)
+        if session is None:
+            session = self.new_session(url)
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            with self._lock:
+                session = self._sessions.setdefault(key, session)
+        return session
+
+    def clear(self):
+        """Close every pooled connection"""
+        with self._lock:
+            adapters = list(self._adapters.values())
+            self._adapters.clear()
+            self._sessions.clear()
+        for adapter in adapters:
+            adapter.close()
+
+    def _check_pid(self):
+        """Forget the connections inherited from a parent process, must hold the lock"""
+        if (pid := os.getpid()) != self._pid:
+            self._adapters.clear()
+            self._sessions.clear()
+            self._pid = pid
+
+    @staticmethod
+    def _key(url):
+        parts = urlsplit(url)
+        return parts.scheme.lower(), parts.hostname, parts.port
+
+
+session_pool = HTTPSessionPool()
+atexit.register(session_pool.clear)
+
+
+class PooledRequests:
+    """Stand-in for the requests module sending requests through :data:`session_pool`
+
+    Unless ``settings.server.http_client.pool`` is disabled, the request functions use the
+    shared session of the host, everything else is taken from the requests module.
+    """
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+    def request(self, method, url, **kwargs):
+        from robottelo.config import settings
+
+        http_client = settings.server.http_client
+        if not http_client.pool:
+            return requests.request(method, url, **kwargs)
+        session_pool.pool_size = http_client.pool_size
+        session_pool.retries = http_client.retries
+        session_pool.backoff_factor = http_client.backoff_factor
+        return session_pool.session(url).request(method, url, **kwargs)
+
+    def get(self, url, params=None, **kwargs):
+        return self.request('get', url, params=params, **kwargs)
+
+    def options(self, url, **kwargs):
+        return self.request('options', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('head', url, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('post', url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('put', url, data=data, **kwargs)
+
+    def patch(self, url, data=None, **kwargs):
+        return self.request('patch', url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('delete', url, **kwargs)
+
+
+pooled_requests = PooledRequests()
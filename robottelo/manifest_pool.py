@@ -0,0 +1,223 @@
+"""Generate the manifests of Manifester ahead of the fixtures, and reuse them
+
+Generating a manifest takes a subscription allocation, entitlements and an export job on the Red
+Hat Customer Portal, which is slow and rate-limited. When ``settings.manifest.pool.enabled`` is
+set, a :class:`ManifestPool` generates the manifests of each ``settings.manifest`` category in the
+background, and leases them to the manifest fixtures. The pool is a JSON store next to the
+manifest files, protected by a lock so that all the xdist workers share it.
+
+A manifest can be imported in a single organization of a Satellite. Leases record the Satellite
+the worker is aligned to, and a manifest returned to the pool at the end of a lease is leased
+again only to the workers of other Satellites. Manifests whose allocation may be altered, by a
+refresh or a deletion, are leased with ``reusable=False`` or passed to :meth:`ManifestPool.consume`
+so that they aren't leased again, their allocation is deleted at the end of the lease. The
+allocations of the other manifests are deleted at the end of the session by
+:meth:`ManifestPool.close`.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import threading
+
+from manifester import Manifester
+from pytest_services.locks import file_lock
+
+from robottelo.config import settings
+from robottelo.logging import logger
+
+STORE_FILE = 'pool.json'
+LOCK_FILE = 'pool.lock'
+AVAILABLE, LEASED, CONSUMED = 'available', 'leased', 'consumed'
+
+
+@dataclass
+class PooledManifest:
+    """A manifest of the pool, with the attributes of a manifest from Manifester
+
+    :param str uuid: UUID of the subscription allocation of the manifest.
+    :param str category: Name of the ``settings.manifest`` category of the manifest.
+    :param str path: Path of the manifest file.
+    :param str name: File name of the manifest.
+    """
+
+    uuid: str
+    category: str
+    path: str
+    name: str
+
+    @property
+    def content(self):
+        return Path(self.path).read_bytes()
+
+
+class ManifestPool:
+    """Manifests generated ahead of time, shared by the processes using ``store_dir``
+
+    :param store_dir: Directory of the store of the pool, shared by the xdist workers.
+    :param int depth: Manifests of each category generated ahead of time.
+    :param int max_workers: Maximum number of manifests generated at once by a process.
+    """
+
+    def __init__(self, store_dir, depth=1, max_workers=2):
+        self.store_dir = Path(store_dir)
+        self.depth = depth
+        self.max_workers = max_workers
+        self._targets = {}
+        self._executor = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _store(self):
+        """Yield the entries of the store by allocation uuid, written back on exit"""
+        path = self.store_dir / STORE_FILE
+        with self._lock, file_lock(self.store_dir / LOCK_FILE, remove=False, timeout=60):
+            store = json.loads(path.read_text()) if path.exists() else {}
+            store.setdefault('manifests', {})
+            store.setdefault('generating', {})
+            yield store
+            path.write_text(json.dumps(store, indent=2))
+
+    def plan(self, category, count=1):
+        """Generate up to ``depth`` manifests of ``category`` ahead, ``count`` being needed"""
+        self._targets[category] = min(self._targets.get(category, 0) + count, self.depth)
+
+    def start(self):
+        """Start generating the planned manifests in the background"""
+        if not self._targets:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='manifest-pool'
+        )
+        for category in self._targets:
+            self._refill(category)
+
+    def _refill(self, category):
+        """Generate manifests of ``category`` until the pool has its target, in the background"""
+        if self._executor is None or self._closed:
+            return
+        with self._store() as store:
+            available = sum(
+                1
+                for entry in store['manifests'].values()
+                if entry['category'] == category and entry['state'] == AVAILABLE
+            )
+            missing = (
+                self._targets.get(category, 0) - available - store['generating'].get(category, 0)
+            )
+            if missing > 0:
+                store['generating'][category] = store['generating'].get(category, 0) + missing
+        for _ in range(max(missing, 0)):
+            self._executor.submit(self._generate_ahead, category)
+
+    def _generate_ahead(self, category):
+        try:
+            manifest = self._generate(category)
+        except Exception as err:
+            logger.warning(f'Failed to generate a {category} manifest ahead of time: {err}')
+            manifest = None
+        with self._store() as store:
+            store['generating'][category] -= 1
+            if manifest:
+                store['manifests'][manifest.uuid] = _entry(manifest, AVAILABLE)
+
+    def _generate(self, category):
+        manifest = Manifester(manifest_category=getattr(settings.manifest, category)).get_manifest()
+        logger.info(f'Generated {category} manifest {manifest.name}')
+        return PooledManifest(
+            uuid=manifest.uuid, category=category, path=str(manifest.path), name=str(manifest.name)
+        )
+
+    @contextmanager
+    def lease(self, category, hostname=None, reusable=True):
+        """Yield a manifest of ``category``, returned to the pool on exit
+
+        :param str category: Name of the ``settings.manifest`` category of the manifest.
+        :param str hostname: The Satellite the manifest is meant to be imported into, by default
+            the one the worker is aligned to.
+        :param bool reusable: Return the manifest to the pool on exit, unless it was consumed.
+            Leases whose allocation may be altered pass ``False``, the allocation is deleted on
+            exit then.
+        """
+        hostname = hostname or settings.server.hostname
+        manifest = None
+        with self._store() as store:
+            for uuid, entry in store['manifests'].items():
+                if (
+                    entry['category'] == category
+                    and entry['state'] == AVAILABLE
+                    and hostname not in entry['hostnames']
+                ):
+                    entry['state'] = LEASED
+                    entry['hostnames'].append(hostname)
+                    manifest = PooledManifest(uuid=uuid, category=category, **entry['file'])
+                    break
+        if manifest is None:
+            logger.info(f'No {category} manifest ready for {hostname}, generating one')
+            manifest = self._generate(category)
+            with self._store() as store:
+                store['manifests'][manifest.uuid] = _entry(manifest, LEASED, [hostname])
+        self._refill(category)
+        try:
+            yield manifest
+        finally:
+            with self._store() as store:
+                entry = store['manifests'][manifest.uuid]
+                if consumed := not reusable or entry['state'] == CONSUMED:
+                    del store['manifests'][manifest.uuid]
+                else:
+                    entry['state'] = AVAILABLE
+            if consumed:
+                self._delete_allocation(manifest.uuid, category)
+
+    def consume(self, manifest):
+        """Keep ``manifest`` from being leased again, its allocation was altered
+
+        The allocation is deleted at the end of the lease of ``manifest``, or right away when it
+        isn't leased.
+        """
+        with self._store() as store:
+            if (entry := store['manifests'].get(manifest.uuid)) is None:
+                return
+            if leased := entry['state'] == LEASED:
+                entry['state'] = CONSUMED
+            else:
+                del store['manifests'][manifest.uuid]
+        if not leased:
+            self._delete_allocation(manifest.uuid, manifest.category)
+
+    def _delete_allocation(self, uuid, category):
+        try:
+            Manifester(
+                manifest_category=getattr(settings.manifest, category)
+            ).delete_subscription_allocation(uuid=uuid)
+        except Exception as err:
+            logger.warning(f'Failed to delete the allocation of manifest {uuid}: {err}')
+
+    def close(self, delete=True):
+        """Stop generating manifests, and delete the allocations of all of them
+
+        :param bool delete: Delete the allocations, which only the last process using the store
+            does.
+        """
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        if not delete:
+            return
+        with self._store() as store:
+            for uuid, entry in store['manifests'].items():
+                self._delete_allocation(uuid, entry['category'])
+            store['manifests'].clear()
+
+
+def _entry(manifest, state, hostnames=None):
+    return {
+        'category': manifest.category,
+        'state': state,
+        'hostnames': hostnames or [],
+        'file': {'path': manifest.path, 'name': manifest.name},
+    }
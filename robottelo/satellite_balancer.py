@@ -0,0 +1,119 @@
+"""Assign the xdist workers to the least loaded of ``settings.server.hostnames``
+
+With ``settings.server.xdist_behavior`` set to ``least-loaded``, the xdist controller publishes
+the estimated duration of the tests queued on each worker once it scheduled the first tests, see
+``pytest_plugins/satellite_balancing.py``. When a worker starts, ``align_to_satellite`` waits for
+that work to be published, picks the Satellite whose workers have the least queued work,
+optionally weighted by the load average sampled on each Satellite, and records its choice for the
+next workers.
+"""
+
+import json
+from pathlib import Path
+import time
+
+from pytest_services.locks import file_lock
+
+from robottelo.logging import logger
+
+PENDING_FILE = 'pending.json'
+ASSIGNMENTS_FILE = 'assignments.json'
+LOCK_FILE = 'assignments.lock'
+# key of the workerinput of the xdist workers giving the directory shared with the controller
+STATE_DIR_KEY = 'satellite_balancer_dir'
+
+
+class SatelliteBalancer:
+    """Queued work of the xdist workers and their Satellites, shared through ``state_dir``
+
+    :param state_dir: Directory created by the xdist controller for the session.
+    """
+
+    def __init__(self, state_dir):
+        self.state_dir = Path(state_dir)
+
+    @classmethod
+    def from_config(cls, config):
+        """Return the balancer of an xdist worker, ``None`` when not run by xdist"""
+        if state_dir := getattr(config, 'workerinput', {}).get(STATE_DIR_KEY):
+            return cls(state_dir)
+        return None
+
+    def _read(self, name):
+        try:
+            return json.loads((self.state_dir / name).read_text())
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, name, data):
+        # the workers may read the file any time, write it atomically
+        tmp_path = self.state_dir / f'{name}.tmp'
+        tmp_path.write_text(json.dumps(data))
+        tmp_path.replace(self.state_dir / name)
+
+    def publish_pending(self, pending):
+        """Publish the estimated duration of the tests queued on each worker, by worker id"""
+        self._write(PENDING_FILE, pending)
+
+    def wait_for_pending(self, timeout):
+        """Wait up to ``timeout`` seconds for the queued work to be published
+
+        :return: Whether the queued work was published.
+        """
+        deadline = time.monotonic() + timeout
+        while not (self.state_dir / PENDING_FILE).exists():
+            if time.monotonic() > deadline:
+                logger.warning(f'The queued work was not published within {timeout}s')
+                return False
+            time.sleep(0.1)
+        return True
+
+    def loads(self, hostnames):
+        """Return the queued work of the workers of each of ``hostnames``, and their number
+
+        Workers not known to the controller yet count for the mean of the others.
+        """
+        pending = self._read(PENDING_FILE)
+        default = sum(pending.values()) / len(pending) if pending else 1.0
+        loads = {hostname: [0.0, 0] for hostname in hostnames}
+        for worker_id, hostname in self._read(ASSIGNMENTS_FILE).items():
+            if hostname in loads:
+                loads[hostname][0] += pending.get(worker_id, default)
+                loads[hostname][1] += 1
+        return loads
+
+    def choose(self, worker_id, hostnames, sample=None, wait=0):
+        """Assign ``worker_id`` to the least loaded of ``hostnames``
+
+        :param sample: Optional function returning the load of a Satellite by hostname, its load
+            average per CPU for instance, scaling the queued work of its workers.
+        :param float wait: Seconds to wait for the queued work to be published, the workers are
+            only spread evenly over ``hostnames`` without it.
+        :return: The hostname assigned to the worker.
+        """
+        if wait:
+            self.wait_for_pending(wait)
+        samples = {}
+        if sample:
+            for hostname in hostnames:
+                try:
+                    samples[hostname] = sample(hostname)
+                except Exception as err:
+                    logger.warning(f'Failed to sample the load of {hostname}: {err}')
+                    samples[hostname] = float('inf')
+        with file_lock(self.state_dir / LOCK_FILE, remove=False, timeout=60):
+            loads = self.loads(hostnames)
+
+            def key(hostname):
+                (work, workers), load = loads[hostname], samples.get(hostname, 0)
+                # a Satellite which couldn't be sampled comes after the others with as much work
+                return (work * (1 + load) if work else 0, workers, load)
+
+            hostname = min(hostnames, key=key)
+            assignments = self._read(ASSIGNMENTS_FILE)
+            assignments[worker_id] = hostname
+            self._write(ASSIGNMENTS_FILE, assignments)
+        logger.info(
+            f'{worker_id=}: Satellite loads {loads}, load samples {samples}, chose {hostname}'
+        )
+        return hostname
@@ -1,6 +1,148 @@
 """Utility module to handle the shared ssh connection."""
 
+import atexit
+import contextlib
+from dataclasses import dataclass
+import os
+import threading
+import time
+
 from robottelo.cli import hammer
+from robottelo.logging import logger
+
+
+@dataclass
+class _PooledClient:
+    """A pooled ssh client along with the bookkeeping needed to reuse it"""
+
+    client: object
+    password: str
+    last_used: float
+
+
+class SSHConnectionPool:
+    """Process-wide pool of ssh clients keyed by (hostname, username, port, net_type)
+
+    Every xdist worker is its own process, so every worker gets its own pool. The pool is also
+    reset when the process forks, since an ssh session can't be shared with a child process.
+    broker sessions are not safe to be used by several threads at once, so each thread gets its
+    own client for a given key.
+
+    :param int max_idle: Seconds a client may stay unused before it is closed and evicted.
+    :param int keepalive_interval: Seconds a client may stay unused before it is health-checked
+        on its next use.
+    """
+
+    def __init__(self, max_idle=300, keepalive_interval=60):
+        self.max_idle = max_idle
+        self.keepalive_interval = keepalive_interval
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._pid = os.getpid()
+
+    def __len__(self):
+        return len(self._clients)
+
+    def get(self, factory, hostname, username, password, port, net_type):
+        """Return a live client for the given connection parameters
+
+        A new client is built with ``factory`` when there is no usable client in the pool.
+        """
+        self._check_pid()
+        key = (threading.get_ident(), hostname, username, port, net_type)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            pooled = self._clients.pop(key, None)
+        if pooled is not None:
+            if pooled.password == password and self._is_alive(pooled, now):
+                pooled.last_used = now
+                with self._lock:
+                    self._clients[key] = pooled
+                return pooled.client
+            self._close(pooled.client)
+        client = factory(
+            hostname=hostname,
+            username=username,
+            password=password,
+            port=port,
+            net_type=net_type,
+        )
+        with self._lock:
+            self._clients[key] = _PooledClient(client=client, password=password, last_used=now)
+        return client
+
+    def discard(self, client):
+        """Close ``client`` and remove it from the pool, e.g. after a connection error"""
+        with self._lock:
+            keys = [key for key, pooled in self._clients.items() if pooled.client is client]
+            for key in keys:
+                del self._clients[key]
+        self._close(client)
+
+    def clear(self):
+        """Close and remove every client in the pool"""
+        with self._lock:
+            pooled_clients = list(self._clients.values())
+            self._clients.clear()
+        for pooled in pooled_clients:
+            self._close(pooled.client)
+
+    def _check_pid(self):
+        """Forget all clients inherited from a parent process without closing them"""
+        if (pid := os.getpid()) != self._pid:
+            with self._lock:
+                self._clients.clear()
+                self._pid = pid
+
+    def _evict_idle(self, now):
+        """Close clients unused for more than ``max_idle`` seconds, must hold the lock"""
+        if not self.max_idle:
+            return
+        alive_threads = {thread.ident for thread in threading.enumerate()}
+        expired = [
+            key
+            for key, pooled in self._clients.items()
+            if now - pooled.last_used > self.max_idle or key[0] not in alive_threads
+        ]
+        for key in expired:
+            self._close(self._clients.pop(key).client)
+
+    def _is_alive(self, pooled, now):
+        """Check a client which has not been used for a while still has a working session"""
+        if getattr(pooled.client, '_session', None) is None:
+            # the connection is established lazily on first use, nothing to check yet
+            return True
+        if now - pooled.last_used < self.keepalive_interval:
+            return True
+        try:
+            return pooled.client.execute('true', timeout=self.keepalive_interval).status == 0
+        except Exception as err:
+            logger.debug(f'Pooled ssh connection to {pooled.client.hostname} is dead: {err}')
+            return False
+
+    @staticmethod
+    def _close(client):
+        with contextlib.suppress(Exception):
+            client.close()
+
+
+connection_pool = SSHConnectionPool()
+atexit.register(connection_pool.clear)
+
+
+def _is_connection_error(err):
+    """Whether ``err`` means the ssh session is broken, rather than the command timing out"""
+    if isinstance(err, TimeoutError):
+        return False
+    if isinstance(err, OSError | EOFError):
+        return True
+    # the ssh backends of broker raise their own exception types
+    err_type = type(err)
+    return (
+        err_type.__module__.split('.')[0] in ('ssh2', 'hussh', 'paramiko')
+        and 'Timeout' not in err_type.__name__
+    )
 
 
 def get_client(
@@ -14,18 +156,33 @@ def get_client(
 
     Processes ssh credentials in the order: password, key_filename, ssh_key
     Config validation enforces one of the three must be set in settings.server
+
+    Unless ``settings.server.ssh_client.pool`` is disabled, the host object is taken from the
+    process-wide :data:`connection_pool`, so its ssh session is reused between calls.
     """
     from robottelo.config import settings
     from robottelo.hosts import ContentHost
 
-    return ContentHost(
-        hostname=hostname or settings.server.hostname,
-        username=username or settings.server.ssh_username,
-        password=password or settings.server.ssh_password,
-        port=port or settings.server.ssh_client.port,
+    kwargs = client_kwargs(hostname, username, password, port, net_type)
+    if not settings.server.ssh_client.pool:
+        return ContentHost(**kwargs)
+    connection_pool.max_idle = settings.server.ssh_client.pool_max_idle
+    connection_pool.keepalive_interval = settings.server.ssh_client.keepalive_interval
+    return connection_pool.get(ContentHost, **kwargs)
+
+
+def client_kwargs(hostname=None, username=None, password=None, port=22, net_type=None):
+    """Return the arguments of the host object of :func:`get_client`, defaults from settings"""
+    from robottelo.config import settings
+
+    return {
+        'hostname': hostname or settings.server.hostname,
+        'username': username or settings.server.ssh_username,
+        'password': password or settings.server.ssh_password,
+        'port': port or settings.server.ssh_client.port,
         # TODO(ogajduse): we better get rid of the ssh module entirely
-        net_type=net_type or settings.server.network_type,
-    )
+        'net_type': net_type or settings.server.network_type,
+    }
 
 
 def command(
@@ -47,18 +204,30 @@ def command(
     :param int timeout: Time to wait for the ssh command to finish.
     :param connection_timeout: Time to wait for establishing the connection.
     """
-    client = get_client(
-        hostname=hostname,
-        username=username,
-        password=password,
-        port=port,
-        net_type=net_type,
-    )
-    result = client.execute(cmd, timeout=timeout)
+    kwargs = {
+        'hostname': hostname,
+        'username': username,
+        'password': password,
+        'port': port,
+        'net_type': net_type,
+    }
+    client = get_client(**kwargs)
+    try:
+        result = client.execute(cmd, timeout=timeout)
+    except Exception as err:
+        # never hand out a connection that just failed
+        connection_pool.discard(client)
+        if not _is_connection_error(err):
+            raise
+        # a pooled session may have died since its last use, e.g. when the host rebooted
+        logger.debug(f'ssh session to {client.hostname} failed, reconnecting: {err}')
+        client = get_client(**kwargs)
+        try:
+            result = client.execute(cmd, timeout=timeout)
+        except Exception:
+            connection_pool.discard(client)
+            raise
 
     if output_format and result.status == 0:
-        if output_format == 'csv':
-            result.stdout = hammer.parse_csv(result.stdout) if result.stdout else {}
-        if output_format == 'json':
-            result.stdout = hammer.parse_json(result.stdout) if result.stdout else None
+        result.stdout = hammer.parse_output(result.stdout, output_format)
     return result
@@ -2,11 +2,11 @@
 
 from box import Box
 from packaging.version import Version
-import requests
 from wait_for import wait_for
 
 from robottelo import constants
 from robottelo.exceptions import InvalidArgumentError, RepositoryDataNotFound
+from robottelo.http_sessions import pooled_requests
 from robottelo.logging import logger
 
 
@@ -47,7 +47,7 @@ def ohsnap_repo_url(ohsnap, request_type, product, release, os_release, snap='')
                 'hooks': {'response': ohsnap_response_hook},
             }
             res, _ = wait_for(
-                lambda: requests.get(**request_query),
+                lambda: pooled_requests.get(**request_query),
                 handle_exception=True,
                 raise_original=True,
                 timeout=ohsnap.request_retry.timeout,
@@ -80,7 +80,7 @@ def dogfood_repository(
     """Returns a repository definition based on the arguments provided"""
     arch = arch or constants.DEFAULT_ARCHITECTURE
     res, _ = wait_for(
-        lambda: requests.get(
+        lambda: pooled_requests.get(
             ohsnap_repo_url(ohsnap, 'repositories', product, release, os_release, snap),
             hooks={'response': ohsnap_response_hook},
         ),
@@ -97,7 +97,7 @@ def dogfood_repository(
         ) from None
     repository['baseurl'] = repository['baseurl'].replace('$basearch', arch)
     # If repo check is enabled, check that the repository actually exists on the remote server
-    dogfood_req = requests.get(repository['baseurl'])
+    dogfood_req = pooled_requests.get(repository['baseurl'])
     if repo_check and not dogfood_req.ok:
         logger.warning(
             f'Unable to locate the repo at the URL: {repository["baseurl"]} ; '
@@ -113,7 +113,7 @@ def ohsnap_snap_rpms(ohsnap, sat_version, snap_version, os_major, is_all=True):
     if is_all:
         url += '?all=true'
     res, _ = wait_for(
-        lambda: requests.get(url, hooks={'response': ohsnap_response_hook}),
+        lambda: pooled_requests.get(url, hooks={'response': ohsnap_response_hook}),
         handle_exception=True,
         raise_original=True,
         timeout=ohsnap.request_retry.timeout,
@@ -1,5 +1,6 @@
 """Utility module to handle the shared ssh connection."""
 
+from robottelo import ssh
 from robottelo.cli import hammer
 
 
@@ -13,15 +14,14 @@ def get_client(
 
     Processes ssh credentials in the order: password, key_filename, ssh_key
     Config validation enforces one of the three must be set in settings.server
+
+    The host object comes from the shared connection pool, see :func:`robottelo.ssh.get_client`.
     """
-    from robottelo.config import settings
-    from robottelo.hosts import ContentHost
-
-    return ContentHost(
-        hostname=hostname or settings.server.hostname,
-        username=username or settings.server.ssh_username,
-        password=password or settings.server.ssh_password,
-        port=port or settings.server.ssh_client.port,
+    return ssh.get_client(
+        hostname=hostname,
+        username=username,
+        password=password,
+        port=port,
     )
 
 
@@ -49,11 +49,12 @@ def command(
         password=password,
         port=port,
     )
-    result = client.execute(cmd, timeout=timeout)
+    try:
+        result = client.execute(cmd, timeout=timeout)
+    except Exception:
+        ssh.connection_pool.discard(client)
+        raise
 
     if output_format and result.status == 0:
-        if output_format == 'csv':
-            result.stdout = hammer.parse_csv(result.stdout) if result.stdout else {}
-        if output_format == 'json':
-            result.stdout = hammer.parse_json(result.stdout) if result.stdout else None
+        result.stdout = hammer.parse_output(result.stdout, output_format)
     return result
@@ -1,27 +1,34 @@
 """Generate hammer command tree in json format by inspecting every command's
 help.
 
+The help pages are fetched concurrently, and the command index of the Satellite is saved
+along with the json file, see :func:`robottelo.cli.hammer.get_command_index`.
+
 """
 
 import json
 
-from robottelo import ssh
+import click
+
 from robottelo.cli import hammer
 from robottelo.config import settings
 
 
-def generate_command_tree(command):
-    """Recursively walk through the hammer commands and subcommands and fetch
-    their help. Return a dictionary with the contents.
-    """
-    output = ssh.command(f'{command} --help', hostname=settings.server.hostnames[0]).stdout
-    contents = hammer.parse_help(output)
-    if len(contents['subcommands']) > 0:
-        for subcommand in contents['subcommands']:
-            subcommand.update(generate_command_tree('{} {}'.format(command, subcommand['name'])))
-    return contents
+@click.command()
+@click.option('--hostname', help='Satellite to inspect, defaults to the first configured one.')
+@click.option('--output', default='hammer_commands.json', show_default=True, type=click.Path())
+@click.option('--workers', default=8, show_default=True, help='Help pages fetched at once.')
+@click.option('--refresh', is_flag=True, help='Crawl again even if the index is cached.')
+def generate_command_tree(hostname, output, workers, refresh):
+    """Write the hammer command tree of a Satellite to a json file"""
+    index = hammer.get_command_index(
+        hostname=hostname or settings.server.hostnames[0],
+        refresh=refresh,
+        max_workers=workers,
+    )
+    with open(output, 'w') as f:
+        f.write(json.dumps(index.to_tree(), indent=2, sort_keys=True))
 
 
-# Generate the json file in the working directory
-with open('hammer_commands.json', 'w') as f:
-    f.write(json.dumps(generate_command_tree('hammer'), indent=2, sort_keys=True))
+if __name__ == '__main__':
+    generate_command_tree()
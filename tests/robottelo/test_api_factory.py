@@ -0,0 +1,157 @@
+"""Tests for module ``robottelo.host_helpers.api_factory``."""
+
+import functools
+from graphlib import CycleError
+import itertools
+import threading
+import time
+from unittest import mock
+
+from nailgun import entities
+from nailgun.config import ServerConfig
+import pytest
+
+from robottelo.exceptions import EntityDependencyError
+from robottelo.host_helpers.api_factory import APIFactory
+
+SERVER_CONFIG = ServerConfig('https://sat.example.com')
+
+
+class FakeServer:
+    """Stands for Entity.create, giving an id to the created entities"""
+
+    def __init__(self, fail=(), delay=0):
+        self.fail = fail
+        self.delay = delay
+        self.created = []
+        self.running = self.max_running = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def create(self, entity, create_missing=None):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        name = getattr(entity, 'name', None) or entity.login
+        if name in self.fail:
+            raise ValueError(f'{name} failed')
+        for field_name in entity.get_fields():
+            # the payload of an entity refers to its related entities by id
+            value = getattr(entity, field_name, None)
+            for related in value if isinstance(value, list) else [value]:
+                if isinstance(related, entities.Entity):
+                    assert related.id
+        created = type(entity)(SERVER_CONFIG, id=next(self._ids))
+        created.name = name
+        with self._lock:
+            self.created.append(name)
+        return created
+
+
+@pytest.fixture
+def server():
+    server = FakeServer()
+    with (
+        mock.patch.object(
+            entities.Organization, 'create', autospec=True, side_effect=server.create
+        ),
+        mock.patch.object(entities.Location, 'create', autospec=True, side_effect=server.create),
+        mock.patch.object(entities.User, 'create', autospec=True, side_effect=server.create),
+    ):
+        yield server
+
+
+@pytest.fixture
+def api_factory():
+    satellite = mock.Mock()
+    satellite.api.Organization = lambda **kwargs: entities.Organization(SERVER_CONFIG, **kwargs)
+    with mock.patch('robottelo.host_helpers.api_factory.settings') as settings:
+        settings.server.http_client.pool_size = 4
+        yield APIFactory(satellite)
+
+
+def test_bulk_create(server, api_factory):
+    server.delay = 0.05
+    specs = [{'name': f'org{index}'} for index in range(8)]
+    results = api_factory.bulk_create('Organization', specs)
+    assert [result.entity.name for result in results] == [spec['name'] for spec in specs]
+    assert all(result.ok and result.entity.id for result in results)
+    assert server.max_running == 4
+
+
+def test_bulk_create_errors(server, api_factory):
+    server.fail = ('org1',)
+    specs = [{'name': 'org0'}, {'name': 'org1'}, {'not_a_field': 'x'}, {'name': 'org3'}]
+    organization = functools.partial(entities.Organization, SERVER_CONFIG)
+    results = api_factory.bulk_create(organization, specs, max_workers=2)
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert str(results[1].error) == 'org1 failed'
+    assert results[3].entity.name == 'org3'
+
+
+def test_bulk_create_related(server, api_factory):
+    org = entities.Organization(SERVER_CONFIG, name='org')
+    location = entities.Location(SERVER_CONFIG, name='location', organization=[org])
+    users = [
+        entities.User(
+            SERVER_CONFIG, login=f'user{index}', organization=[org], default_location=location
+        )
+        for index in range(3)
+    ]
+    existing = entities.Organization(SERVER_CONFIG, id=42)
+    other_user = entities.User(SERVER_CONFIG, login='other', organization=[existing])
+    results = api_factory.bulk_create_related([*users, other_user, location, org])
+    assert all(result.ok for result in results)
+    assert [result.entity.name for result in results] == [
+        'user0',
+        'user1',
+        'user2',
+        'other',
+        'location',
+        'org',
+    ]
+    assert server.created.index('org') < server.created.index('location')
+    assert server.created.index('location') < server.created.index('user0')
+    assert users[0].default_location is results[4].entity
+    assert users[0].organization == [results[5].entity]
+    assert other_user.organization == [existing]
+
+
+def test_bulk_create_related_failed_dependency(server, api_factory):
+    server.fail = ('org',)
+    org = entities.Organization(SERVER_CONFIG, name='org')
+    location = entities.Location(SERVER_CONFIG, name='location', organization=[org])
+    user = entities.User(SERVER_CONFIG, login='user', default_location=location)
+    other = entities.Organization(SERVER_CONFIG, name='other')
+    results = api_factory.bulk_create_related([user, location, org, other])
+    assert [result.ok for result in results] == [False, False, False, True]
+    assert isinstance(results[0].error, EntityDependencyError)
+    assert isinstance(results[1].error, EntityDependencyError)
+    assert isinstance(results[2].error, ValueError)
+    assert server.created == ['other']
+
+
+def test_bulk_create_related_cycle(server, api_factory):
+    location = entities.Location(SERVER_CONFIG, name='location')
+    parent = entities.Location(SERVER_CONFIG, name='parent', parent=location)
+    location.parent = parent
+    with pytest.raises(CycleError):
+        api_factory.bulk_create_related([location, parent])
+    assert not server.created
+
+
+def test_bulk_create_related_self_reference(server, api_factory):
+    location = entities.Location(SERVER_CONFIG, name='location')
+    location.parent = location
+    org = entities.Organization(SERVER_CONFIG, name='org')
+    user = entities.User(SERVER_CONFIG, login='user', default_location=location)
+    results = api_factory.bulk_create_related([location, org, user])
+    # the reference is kept as is, the server rejects the entity without id
+    assert location.parent is location
+    assert isinstance(results[0].error, AssertionError)
+    assert results[1].ok
+    assert isinstance(results[2].error, EntityDependencyError)
+    assert server.created == ['org']
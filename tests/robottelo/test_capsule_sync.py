@@ -0,0 +1,108 @@
+"""Tests for ``robottelo.host_helpers.satellite_mixins.ContentInfo.sync_capsules``."""
+
+from datetime import UTC, datetime, timedelta
+import threading
+from unittest import mock
+
+import pytest
+
+from robottelo.host_helpers.satellite_mixins import ContentInfo
+
+
+def _timestamp(delta=0):
+    return (datetime.now(UTC) + timedelta(seconds=delta)).strftime('%Y-%m-%d %H:%M:%S UTC')
+
+
+class FakeCapsule:
+    """Stands for a nailgun Capsule entity"""
+
+    def __init__(self, name, status=None):
+        self.name = name
+        self.status = status or {
+            'active_sync_tasks': [],
+            'last_failed_sync_tasks': [],
+            'last_sync_time': _timestamp(5),
+        }
+        self.synced = threading.Event()
+        self.sync_data = None
+
+    def content_sync(self, synchronous, data):
+        assert synchronous is False
+        self.sync_data = data
+        self.synced.set()
+        return {'id': f'task-{self.name}'}
+
+    def content_get_sync(self, timeout, synchronous):
+        return self.status
+
+
+class Satellite(ContentInfo):
+    def __init__(self, nailgun_capsules):
+        self.nailgun_capsules = {capsule.name: capsule for capsule in nailgun_capsules}
+        self.api = mock.Mock()
+        self.api.Capsule.return_value.search.side_effect = lambda query: [
+            self.nailgun_capsules[query['search'].removeprefix('name=')]
+        ]
+        self.task_watcher = mock.Mock()
+        self.task_watcher.wait.side_effect = self.wait
+
+    def wait(self, task_ids, timeout):
+        # every sync was started before waiting on any of them
+        assert all(capsule.synced.is_set() for capsule in self.nailgun_capsules.values())
+        return [
+            {'id': task_id, 'started_at': _timestamp(), 'ended_at': _timestamp(duration)}
+            for duration, task_id in enumerate(task_ids, start=10)
+        ]
+
+
+def test_sync_capsules():
+    nailgun_capsules = [FakeCapsule(f'capsule{index}.example.com') for index in range(3)]
+    satellite = Satellite(nailgun_capsules)
+    capsules = [mock.Mock(hostname=capsule.name) for capsule in reversed(nailgun_capsules)]
+    report = satellite.sync_capsules(capsules, lce=mock.Mock(id=7), timeout=60)
+    satellite.task_watcher.wait.assert_called_once_with(
+        ['task-capsule2.example.com', 'task-capsule1.example.com', 'task-capsule0.example.com'],
+        timeout=60,
+    )
+    assert all(capsule.sync_data == {'environment_id': 7} for capsule in nailgun_capsules)
+    assert [result.capsule for result in report.results] == capsules
+    assert [result.duration for result in report.results] == [10, 11, 12]
+    assert report.duration > 0
+    assert report.speedup > 1
+    assert report.throughput > 0
+
+
+def test_sync_capsules_not_synced():
+    nailgun_capsules = [
+        FakeCapsule('synced.example.com'),
+        FakeCapsule(
+            'old.example.com',
+            {
+                'active_sync_tasks': [],
+                'last_failed_sync_tasks': [],
+                'last_sync_time': _timestamp(-3600),
+            },
+        ),
+        FakeCapsule(
+            'failed.example.com',
+            {
+                'active_sync_tasks': [],
+                'last_failed_sync_tasks': [{'id': 'task'}],
+                'last_sync_time': _timestamp(5),
+            },
+        ),
+    ]
+    satellite = Satellite(nailgun_capsules)
+    capsules = [mock.Mock(hostname=capsule.name) for capsule in nailgun_capsules]
+    with pytest.raises(AssertionError) as error:
+        satellite.sync_capsules(capsules)
+    assert 'synced.example.com' not in str(error.value)
+    assert 'old.example.com: `last_sync_time`' in str(error.value)
+    assert 'failed.example.com: active sync tasks' in str(error.value)
+    assert nailgun_capsules[0].sync_data == {}
+
+
+def test_sync_no_capsules():
+    report = Satellite([]).sync_capsules([])
+    assert report.results == []
+    assert report.throughput == 0
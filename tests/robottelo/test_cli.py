@@ -1,15 +1,21 @@
+import base64
 from functools import partial
+import pickle
+import threading
 import unittest
 from unittest import mock
 
 import pytest
 
-from robottelo.cli.base import Base
+from robottelo.cli import hammer
+from robottelo.cli.base import Base, CLIBatch, HammerCommand
 from robottelo.exceptions import (
     CLIBaseError,
     CLIDataBaseError,
     CLIError,
+    CLIOptionError,
     CLIReturnCodeError,
+    HammerShellError,
 )
 
 
@@ -26,9 +32,9 @@ class BaseCliTestCase(unittest.TestCase):
     def test_construct_command(self):
         """_construct_command builds a command using flags and arguments"""
         Base.command_base = 'basecommand'
-        Base.command_sub = 'subcommand'
         command_parts = Base._construct_command(
-            {'flag-one': True, 'flag-two': False, 'argument': 'value', 'ommited-arg': None}
+            'subcommand',
+            {'flag-one': True, 'flag-two': False, 'argument': 'value', 'ommited-arg': None},
         ).split()
 
         assert 'basecommand' in command_parts
@@ -38,6 +44,131 @@ class BaseCliTestCase(unittest.TestCase):
         assert '--flag-two' not in command_parts
         assert len(command_parts) == 4
 
+    def test_construct_command_keeps_parts(self):
+        """_construct_command returns an immutable command carrying its parts"""
+        Base.command_base = 'basecommand'
+        options = {'argument': 'value'}
+        command = Base._construct_command('subcommand', options)
+        options['argument'] = 'changed'
+
+        assert isinstance(command, HammerCommand)
+        assert command.command_sub == 'subcommand'
+        assert command.options == {'argument': 'value'}
+        with pytest.raises(AttributeError):
+            command.command_sub = 'other'
+        assert pickle.loads(pickle.dumps(command)) == command
+
+    @mock.patch('robottelo.cli.base.Base.execute')
+    def test_methods_build_their_own_command(self, execute):
+        """Methods called from several threads at once don't share their subcommand"""
+        barrier = threading.Barrier(2)
+        execute.side_effect = lambda command, **kwargs: barrier.wait(timeout=5) and []
+        threads = [
+            threading.Thread(target=Base.list, args=({'search': 'name=foo'},)),
+            threading.Thread(target=Base.update, args=({'id': 1},)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        commands = {call.args[0].command_sub: call.args[0] for call in execute.call_args_list}
+        assert commands['list'].options['search'] == 'name=foo'
+        assert commands['update'].options == {'id': 1}
+
+    @mock.patch('robottelo.cli.base.Base._handle_response')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_request_uses_command_parts(self, settings, command, handle_resp):
+        """execute names the command from the request, not from the class"""
+        settings.performance.time_hammer = False
+        settings.performance.hammer_shell = False
+        settings.performance.validate_hammer_options = False
+        cmd = Base._construct_command('info', {'id': 1})
+        Base.execute(cmd, user='auser', password='apass', output_format='csv')
+        request = handle_resp.call_args.kwargs['request']
+
+        assert request.command_sub == 'info'
+        assert (request.user, request.password) == ('auser', 'apass')
+        assert request.output_format == 'csv'
+
+    @mock.patch('robottelo.cli.base.hammer_shell.execute')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_dead_hammer_shell_goes_one_shot(self, settings, command, shell_execute):
+        """execute runs the command again in a new hammer process when the session died"""
+        settings.performance.time_hammer = False
+        settings.performance.hammer_shell = True
+        settings.performance.validate_hammer_options = False
+        shell_execute.side_effect = HammerShellError('hammer shell died')
+        command.return_value = mock.Mock(status=0, stderr='', stdout='output')
+
+        assert (
+            Base.execute(Base._construct_command('list'), user='auser', password='apass')
+            == 'output'
+        )
+        shell_execute.assert_called_once()
+        command.assert_called_once()
+
+    @mock.patch('robottelo.cli.base.hammer.cached_command_index')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_validates_options(self, settings, command, command_index):
+        """execute rejects unknown options locally when validation is enabled"""
+        settings.performance.validate_hammer_options = True
+        settings.performance.hammer_shell = False
+        command.return_value = mock.Mock(status=0, stderr='')
+        command_index.return_value = hammer.HammerCommandIndex.from_tree(
+            {
+                'options': [],
+                'subcommands': [
+                    {
+                        'name': 'host',
+                        'description': 'Manipulate hosts',
+                        'options': [],
+                        'subcommands': [
+                            {
+                                'name': 'create',
+                                'description': 'Create a host',
+                                'options': [{'name': 'name'}, {'name': 'organization-id'}],
+                                'subcommands': [],
+                            }
+                        ],
+                    }
+                ],
+            }
+        )
+        with pytest.raises(CLIReturnCodeError) as context:
+            Base.execute(HammerCommand('host', 'create', {'nmae': 'foo', 'build': None}))
+        assert isinstance(context.value, CLIOptionError)
+        assert "Unrecognised option '--nmae' for 'hammer host create'" in context.value.stderr
+        assert "Did you mean '--name'?" in context.value.stderr
+        with pytest.raises(CLIOptionError, match="No such sub-command 'craete'"):
+            Base.execute(HammerCommand('host', 'craete', {'name': 'foo'}))
+        command.assert_not_called()
+
+        Base.execute(HammerCommand('host', 'create', {'name': 'foo', 'organization-id': 0}))
+        command.assert_called_once()
+
+    @mock.patch('robottelo.cli.base.hammer_timing.collector')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_records_timing(self, settings, command, collector):
+        """execute strips the time -p output from stderr and records it"""
+        settings.performance.time_hammer = True
+        settings.performance.validate_hammer_options = False
+        command.return_value = mock.Mock(
+            status=0, stdout='', stderr='Warning\nreal 2.50\nuser 1.00\nsys 0.25\n'
+        )
+        response = Base.execute(
+            HammerCommand('host', 'list'), ignore_stderr=True, return_raw_response=True
+        )
+        assert 'time -p hammer' in command.call_args.args[0]
+        assert response.stderr == 'Warning\n'
+        collector.record.assert_called_once_with(
+            'host list', {'real': 2.5, 'user': 1.0, 'sys': 0.25}
+        )
+
     def test_username_password_parameters_lookup(self):
         """Username and password returned are the parameters"""
         username, password = CLIClass._get_username_password('auser', 'apass')
@@ -144,12 +275,10 @@ class BaseCliTestCase(unittest.TestCase):
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
     def test_add_operating_system(self, construct, execute):
-        """Check command_sub edited when executing add_operating_system"""
+        """Check add_operating_system builds its command"""
         options = {'foo': 'bar'}
-        assert Base.command_sub != 'add-operatingsystem'
         assert execute.return_value == Base.add_operating_system(options)
-        assert Base.command_sub == 'add-operatingsystem'
-        construct.assert_called_once_with(options)
+        construct.assert_called_once_with('add-operatingsystem', options)
         execute.assert_called_once_with(construct.return_value)
 
     @mock.patch('robottelo.cli.base.Base.execute')
@@ -158,8 +287,7 @@ class BaseCliTestCase(unittest.TestCase):
         """Check command create when result is empty"""
         execute.return_value = []
         assert execute.return_value == Base.create()
-        assert Base.command_sub == 'create'
-        construct.assert_called_once_with({})
+        construct.assert_called_once_with('create', {})
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
 
     @mock.patch('robottelo.cli.base.Base.info')
@@ -169,8 +297,7 @@ class BaseCliTestCase(unittest.TestCase):
         """Check command create when result has dct but dct hasn't id key"""
         execute.return_value = [{'not_id': 'foo'}]
         assert execute.return_value == Base.create()
-        assert Base.command_sub == 'create'
-        construct.assert_called_once_with({})
+        construct.assert_called_once_with('create', {})
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
         assert not info.called
 
@@ -184,8 +311,7 @@ class BaseCliTestCase(unittest.TestCase):
         execute.return_value = [{'id': 'foo', 'bar': 'bas'}]
         Base.command_requires_org = False
         assert execute.return_value == Base.create()
-        assert Base.command_sub == 'create'
-        construct.assert_called_once_with({})
+        construct.assert_called_once_with('create', {})
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
         info.assert_called_once_with({'id': 'foo'})
 
@@ -199,8 +325,7 @@ class BaseCliTestCase(unittest.TestCase):
         execute.return_value = [{'id': 'foo', 'bar': 'bas'}]
         Base.command_requires_org = True
         assert execute.return_value == Base.create({'organization-id': 'org-id'})
-        assert Base.command_sub == 'create'
-        construct.assert_called_once_with({'organization-id': 'org-id'})
+        construct.assert_called_once_with('create', {'organization-id': 'org-id'})
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
         info.assert_called_once_with({'id': 'foo', 'organization-id': 'org-id'})
 
@@ -214,8 +339,7 @@ class BaseCliTestCase(unittest.TestCase):
         Base.command_requires_org = True
         with pytest.raises(CLIError):
             Base.create()
-        assert Base.command_sub == 'create'
-        construct.assert_called_once_with({})
+        construct.assert_called_once_with('create', {})
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
 
     def assert_cmd_execution(
@@ -223,8 +347,7 @@ class BaseCliTestCase(unittest.TestCase):
     ):
         """Assert Base class method successfully executed"""
         assert execute.return_value == base_method(**base_method_kwargs)
-        assert cmd_sub == Base.command_sub
-        construct.assert_called_once_with(base_method_kwargs.get('options'))
+        construct.assert_called_once_with(cmd_sub, base_method_kwargs.get('options'))
         execute.assert_called_once_with(
             construct.return_value, ignore_stderr=ignore_stderr, timeout=None
         )
@@ -253,6 +376,8 @@ class BaseCliTestCase(unittest.TestCase):
         """Check executed build ssh method and returns raw response"""
         settings.robottelo.locale = 'en_US'
         settings.performance.time_hammer = False
+        settings.performance.hammer_shell = False
+        settings.performance.validate_hammer_options = False
         settings.server.admin_username = 'admin'
         settings.server.admin_password = 'password'
         response = Base.execute('some_cmd', return_raw_response=True)
@@ -272,6 +397,8 @@ class BaseCliTestCase(unittest.TestCase):
         """Check executed build ssh method and delegate response handling"""
         settings.robottelo.locale = 'en_US'
         settings.performance.timer_hammer = True
+        settings.performance.hammer_shell = False
+        settings.performance.validate_hammer_options = False
         settings.server.admin_username = 'admin'
         settings.server.admin_password = 'password'
         response = Base.execute('some_cmd', hostname=None, output_format='json')
@@ -282,15 +409,142 @@ class BaseCliTestCase(unittest.TestCase):
             output_format='json',
             timeout=None,
         )
-        handle_resp.assert_called_once_with(command.return_value, ignore_stderr=None)
+        handle_resp.assert_called_once_with(
+            command.return_value, ignore_stderr=None, request=mock.ANY
+        )
         assert response is handle_resp.return_value
 
+    @staticmethod
+    def batch_line(index, status, stdout='', stderr=''):
+        """Return the line reported by the remote batch script for a command"""
+        if status is None:
+            return f'@@robottelo-batch@@ {index}   '
+        encode = lambda text: base64.b64encode(text.encode()).decode()  # noqa: E731
+        return f'@@robottelo-batch@@ {index} {status} {encode(stdout)} {encode(stderr)}'
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_batch(self, settings, command):
+        """execute_batch runs all commands in one ssh call and parses their output"""
+        settings.performance.time_hammer = False
+        settings.performance.validate_hammer_options = False
+        command.return_value.stdout = '\n'.join(
+            [self.batch_line(0, 0, 'ID,Name\n1,foo\n'), self.batch_line(1, 0, 'done', 'warn')]
+        )
+        results = Base.execute_batch(
+            [Base._construct_command('list'), 'other command'], hostname='sat', output_format='csv'
+        )
+
+        command.assert_called_once()
+        assert 'other command' in command.call_args.args[0]
+        assert results[0].output == [{'id': '1', 'name': 'foo'}]
+        assert results[0].request.command_sub == 'list'
+        assert (results[1].status, results[1].stderr) == (0, 'warn')
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_batch_raises_first_error(self, settings, command):
+        """execute_batch raises the error of a failed command like execute"""
+        settings.performance.time_hammer = False
+        settings.performance.validate_hammer_options = False
+        command.return_value.stdout = '\n'.join(
+            [
+                self.batch_line(0, 0),
+                self.batch_line(1, 65, stderr='SELECT * FROM'),
+                self.batch_line(2, None),
+            ]
+        )
+        with pytest.raises(CLIDataBaseError):
+            Base.execute_batch(['first', 'second', 'third'], hostname='sat')
+        results = Base.execute_batch(['first', 'second', 'third'], raise_on_error=False)
+        assert [result.status for result in results] == [0, 65, None]
+        assert results[2].skipped
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_batch_incomplete_report(self, settings, command):
+        """execute_batch fails when the remote script did not report every command"""
+        settings.performance.time_hammer = False
+        settings.performance.validate_hammer_options = False
+        command.return_value.stdout = self.batch_line(0, 0)
+        with pytest.raises(CLIError):
+            Base.execute_batch(['first', 'second'], hostname='sat')
+
+    @mock.patch('robottelo.cli.base.Base.logger')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_batch_ignore_stderr_per_command(self, settings, command, logger):
+        """CLIBatch only logs the stderr of the commands which don't ignore it"""
+        settings.performance.time_hammer = False
+        settings.performance.validate_hammer_options = False
+        command.return_value.stdout = '\n'.join(
+            [self.batch_line(0, 0, 'done', 'sync warning'), self.batch_line(1, 0, 'done', 'warn')]
+        )
+        with CLIBatch(hostname='sat') as batch:
+            batch.add(Base, 'synchronize', {'id': 1}, ignore_stderr=True)
+            batch.add(Base, 'info', {'id': 1})
+
+        # the commands don't read the script from the stdin of the batch
+        assert command.call_args.args[0].count('</dev/null') == 2
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.args[0].endswith('\nwarn')
+        assert [result.status for result in batch.results] == [0, 0]
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_batch_records_classmethods(self, settings, command):
+        """CLIBatch records the classmethods with their own output format and timeout"""
+        from robottelo.cli.contentview import ContentView
+        from robottelo.cli.repository import Repository
+
+        settings.performance.time_hammer = False
+        settings.performance.validate_hammer_options = False
+        command.return_value.stdout = '\n'.join(
+            [self.batch_line(0, 0, 'Message\nsynced\n'), self.batch_line(1, 0, 'published')]
+        )
+        with CLIBatch(hostname='sat') as batch:
+            assert batch.record(Repository).synchronize({'id': 1}) == 0
+            assert batch.record(ContentView).publish({'id': 2}) == 1
+
+        assert [request.command_sub for request in batch.requests] == ['synchronize', 'publish']
+        assert batch.requests[0].output_format == 'csv'
+        assert batch.ignore_stderr == [True, True]
+        command.assert_called_once()
+        # the batch may take as long as its commands
+        assert command.call_args.kwargs['timeout'] == 3600000 + 1500000
+        assert batch.results[0].output == [{'message': 'synced'}]
+        assert batch.failed is None
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_batch_raises_error_of_failed_command(self, settings, command):
+        """CLIBatch raises the error of the first failed command like the classmethod"""
+        from robottelo.cli.contentview import ContentView
+
+        settings.performance.time_hammer = False
+        settings.performance.validate_hammer_options = False
+        command.return_value.stdout = '\n'.join(
+            [
+                self.batch_line(0, 0),
+                self.batch_line(1, 65, stderr='SELECT * FROM'),
+                self.batch_line(2, None),
+            ]
+        )
+        with pytest.raises(CLIDataBaseError) as err, CLIBatch(hostname='sat') as batch:
+            batch.record(ContentView).add_repository({'id': 1, 'repository-id': 1})
+            batch.record(ContentView).add_repository({'id': 1, 'repository-id': 2})
+            batch.record(ContentView).publish({'id': 1})
+
+        assert batch.failed == 1
+        assert 'content-view add-repository' in err.value.msg
+        assert [result.status for result in batch.results] == [0, 65, None]
+
     @mock.patch('robottelo.cli.base.Base.list')
     def test_exists_without_option_and_empty_return(self, lst_method):
         """Check exists method without options and empty return"""
         lst_method.return_value = []
         response = Base.exists(search=['id', 1])
-        lst_method.assert_called_once_with({'search': 'id=\\"1\\"'})
+        lst_method.assert_called_once_with({'search': 'id=\\"1\\"', 'per-page': 1})
         assert response == []
 
     @mock.patch('robottelo.cli.base.Base.list')
@@ -299,9 +553,55 @@ class BaseCliTestCase(unittest.TestCase):
         lst_method.return_value = [1, 2]
         my_options = {'search': 'foo=bar'}
         response = Base.exists(my_options, search=['id', 1])
-        lst_method.assert_called_once_with(my_options)
+        lst_method.assert_called_once_with({'search': 'foo=bar', 'per-page': 1})
         assert response == 1
 
+    def test_exists_uses_overridden_list(self):
+        """Check exists lists the entities with the list method of the subclass"""
+
+        class Unpaginated(Base):
+            command_base = 'unpaginated'
+            command_paginated = False
+
+            @classmethod
+            def list(cls, options=None):
+                return [{'id': '1', 'options': options}]
+
+        assert Unpaginated.exists(search=['id', 1]) == {
+            'id': '1',
+            'options': {'search': 'id=\\"1\\"'},
+        }
+
+    @staticmethod
+    def csv_page(*names):
+        return mock.Mock(
+            status=0, stderr='', stdout='\n'.join(['Id,Name', *[f'{n},{n}' for n in names]])
+        )
+
+    @mock.patch('robottelo.cli.base.Base._send_request')
+    def test_list_iter_fetches_pages_lazily(self, send_request):
+        """Check list_iter only fetches the pages which are consumed"""
+        send_request.side_effect = [self.csv_page('a', 'b'), self.csv_page('c')]
+        rows = Base.list_iter({'organization-id': 1}, page_size=2)
+        assert next(rows) == {'id': 'a', 'name': 'a'}
+        assert send_request.call_count == 1
+        assert [row['id'] for row in rows] == ['b', 'c']
+        assert send_request.call_count == 2
+        request = send_request.call_args.args[0]
+        assert request.output_format == 'csv'
+        assert request.command_sub == 'list'
+        assert dict(request.command.options) == {'organization-id': 1, 'page': 2, 'per-page': 2}
+        assert send_request.call_args.kwargs == {'parse_output': False}
+
+    @mock.patch('robottelo.cli.base.Base._send_request')
+    def test_count_with_limit(self, send_request):
+        """Check count stops fetching pages once the limit is reached"""
+        send_request.side_effect = [self.csv_page('a', 'b'), self.csv_page('c', 'd')]
+        assert Base.count(limit=3, page_size=2) == 3
+        assert send_request.call_count == 2
+        send_request.side_effect = [self.csv_page('a', 'b'), self.csv_page()]
+        assert Base.count(page_size=2) == 2
+
     @mock.patch('robottelo.cli.base.Base.command_requires_org')
     def test_info_requires_organization_id(self, _):  # noqa: PT019 - not a fixture
         """Check info raises CLIError with organization-id is not present in
@@ -322,8 +622,7 @@ class BaseCliTestCase(unittest.TestCase):
     ):
         """Assert Base class method successfully executed"""
         assert execute.return_value == base_method(**base_method_kwargs)
-        assert cmd_sub == Base.command_sub
-        construct.assert_called_once_with(base_method_kwargs.get('options'))
+        construct.assert_called_once_with(cmd_sub, base_method_kwargs.get('options'))
         if command_kwarg:
             execute.assert_called_once_with(command=construct.return_value, **call_kwargs)
         else:
@@ -345,6 +644,22 @@ class BaseCliTestCase(unittest.TestCase):
         )
         parse.assert_not_called()
 
+    @mock.patch('robottelo.cli.base.hammer.parse_info')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_info_json_lazy_without_parsing_response(self, construct, execute, parse):
+        """Check info method does not parse lazy json response"""
+        self.assert_alt_cmd_execution(
+            construct,
+            execute,
+            Base.info,
+            'info',
+            call_kwargs={'output_format': 'json-lazy', 'return_raw_response': None},
+            output_format='json-lazy',
+            options={'organization-id': 1},
+        )
+        parse.assert_not_called()
+
     @mock.patch('robottelo.cli.base.hammer.parse_info')
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
@@ -366,8 +681,7 @@ class BaseCliTestCase(unittest.TestCase):
     def test_list_with_default_per_page(self, construct, execute):
         """Check list method set per_page as 1000 by default"""
         assert execute.return_value == Base.list(options={'organization-id': 1})
-        assert Base.command_sub == 'list'
-        construct.assert_called_once_with({'organization-id': 1, 'per-page': 10000})
+        construct.assert_called_once_with('list', {'organization-id': 1, 'per-page': 10000})
         execute.assert_called_once_with(construct.return_value, output_format='csv')
 
     @mock.patch('robottelo.cli.base.Base.execute')
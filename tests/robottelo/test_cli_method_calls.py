@@ -32,43 +32,40 @@ from robottelo.cli.subscription import Subscription
     ],
 )
 def test_cli_org_method_called(mocker, command_sub):
-    """Check Org methods are called and command_sub edited
+    """Check Org methods are called with their command_sub
     This is a parametrized test called by Pytest for each of Org methods
     """
     execute = mocker.patch('robottelo.cli.org.Org.execute')
     construct = mocker.patch('robottelo.cli.org.Org._construct_command')
     options = {'foo': 'bar'}
     assert execute.return_value == getattr(Org, command_sub.replace('-', '_'))(options)
-    assert command_sub == Org.command_sub
-    construct.assert_called_once_with(options)
+    construct.assert_called_once_with(command_sub, options)
     execute.assert_called_once_with(construct.return_value)
 
 
 @pytest.mark.parametrize('command_sub', ['import-classes', 'refresh-features'])
 def test_cli_proxy_method_called(mocker, command_sub):
-    """Check Proxy methods are called and command_sub edited
+    """Check Proxy methods are called with their command_sub
     This is a parametrized test called by Pytest for each of Proxy methods
     """
     execute = mocker.patch('robottelo.cli.proxy.Proxy.execute')
     construct = mocker.patch('robottelo.cli.proxy.Proxy._construct_command')
     options = {'foo': 'bar'}
     assert execute.return_value == getattr(Proxy, command_sub.replace('-', '_'))(options)
-    assert command_sub == Proxy.command_sub
-    construct.assert_called_once_with(options)
+    construct.assert_called_once_with(command_sub, options)
     execute.assert_called_once_with(construct.return_value)
 
 
 @pytest.mark.parametrize('command_sub', ['remove-content', 'upload-content'])
 def test_cli_repository_method_called(mocker, command_sub):
-    """Check Repository methods are called and command_sub edited
+    """Check Repository methods are called with their command_sub
     This is a parametrized test called by Pytest for each of Repository methods
     """
     execute = mocker.patch('robottelo.cli.repository.Repository.execute')
     construct = mocker.patch('robottelo.cli.repository.Repository._construct_command')
     options = {'foo': 'bar'}
     assert execute.return_value == getattr(Repository, command_sub.replace('-', '_'))(options)
-    assert command_sub == Repository.command_sub
-    construct.assert_called_once_with(options)
+    construct.assert_called_once_with(command_sub, options)
     execute.assert_called_once_with(construct.return_value, output_format='csv', ignore_stderr=True)
 
 
@@ -84,7 +81,7 @@ def test_cli_repository_info_and_create(mocker, command_sub):
     'command_sub', ['upload', 'delete-manifest', 'refresh-manifest', 'manifest-history']
 )
 def test_cli_subscription_method_called(mocker, command_sub):
-    """Check Subscription methods are called and command_sub edited
+    """Check Subscription methods are called with their command_sub
     This is a parametrized test called by Pytest for each
     of Subscription methods
     """
@@ -93,6 +90,5 @@ def test_cli_subscription_method_called(mocker, command_sub):
     construct = mocker.patch('robottelo.cli.subscription.Subscription._construct_command')
     options = {'foo': 'bar'}
     assert execute.return_value == getattr(Subscription, command_sub.replace('-', '_'))(options)
-    assert command_sub == Subscription.command_sub
-    construct.assert_called_once_with(options)
+    construct.assert_called_once_with(command_sub, options)
     execute.assert_called_once_with(construct.return_value, ignore_stderr=True, timeout=None)
@@ -0,0 +1,121 @@
+"""Tests for module ``robottelo.cli.registry``."""
+
+import importlib
+from pathlib import Path
+import threading
+from unittest import mock
+
+import robottelo.cli
+from robottelo.cli import registry
+from robottelo.cli.base import Base, CLIBatch
+from robottelo.cli.org import Org
+from robottelo.host_helpers.cli_factory import CLIFactory
+
+
+def test_registry_is_up_to_date():
+    """Every CLI entity of robottelo.cli is in the registry, along with its module"""
+    entities = {}
+    for path in sorted(Path(robottelo.cli.__file__).parent.glob('*.py')):
+        module = importlib.import_module(f'robottelo.cli.{path.stem}')
+        for name, obj in vars(module).items():
+            if isinstance(obj, type) and issubclass(obj, Base):
+                entities[name] = obj.__module__.rsplit('.', 1)[-1]
+    assert entities == registry.CLI_ENTITIES
+
+
+def test_entity_is_bound_to_hostname():
+    cli = registry.get_cli('bound.example.com')
+    assert 'Org' not in vars(cli)
+    assert issubclass(cli.Org, Org)
+    assert cli.Org.__name__ == 'Org'
+    assert cli.Org.hostname == 'bound.example.com'
+    assert vars(cli)['Org'] is cli.Org
+    assert 'Host' not in vars(cli)
+
+
+def test_namespace_is_shared_per_hostname():
+    cli = registry.get_cli('shared.example.com')
+    assert registry.get_cli('shared.example.com') is cli
+    assert registry.get_cli('shared.example.com').Org is cli.Org
+    assert registry.get_cli('other.example.com').Org is not cli.Org
+    assert registry.get_cli('shared.example.com', satellite_maintain_only=True) is not cli
+
+
+def test_satellite_maintain_only():
+    cli = registry.get_cli('capsule.example.com', satellite_maintain_only=True)
+    assert cli.Health.hostname == 'capsule.example.com'
+    assert cli.Base.hostname == 'capsule.example.com'
+    assert not hasattr(cli, 'Org')
+    assert not hasattr(cli, 'batch')
+
+
+def test_unknown_entity():
+    cli = registry.get_cli('sat.example.com')
+    assert not hasattr(cli, 'NotAnEntity')
+    assert not hasattr(cli, '_entities_cache')
+    assert {'Org', 'Host', 'batch'} <= set(dir(cli))
+
+
+def test_batch_is_bound_to_hostname():
+    batch = registry.get_cli('batch.example.com').batch()
+    assert isinstance(batch, CLIBatch)
+    assert batch.hostname == 'batch.example.com'
+    # the entities read from the batch record their commands instead of running them
+    assert issubclass(batch.Org, registry.get_cli('batch.example.com').Org)
+    assert batch.Org.create is not None
+    assert batch.Org is batch.Org
+
+
+def test_omit_credentials():
+    cli = registry.get_cli('omit.example.com')
+    org, host = cli.Org, cli.Host
+    assert not org.omitting_credentials
+    with cli.omit_credentials():
+        assert org.omitting_credentials
+        assert host().omitting_credentials
+        # entities looked up within the block omit credentials too
+        assert cli.User.omitting_credentials
+        with cli.omit_credentials():
+            pass
+        assert org.omitting_credentials
+    assert not org.omitting_credentials
+    assert not cli.User.omitting_credentials
+    assert not Org.omitting_credentials
+    assert not registry.get_cli('other.example.com').Org.omitting_credentials
+
+
+def test_omit_credentials_is_per_thread():
+    cli = registry.get_cli('threads.example.com')
+    omitted = []
+    with cli.omit_credentials():
+        thread = threading.Thread(target=lambda: omitted.append(cli.Org.omitting_credentials))
+        thread.start()
+        thread.join()
+        assert cli.Org.omitting_credentials
+    assert omitted == [False]
+
+
+@mock.patch('robottelo.cli.base.settings')
+def test_omit_credentials_request(settings):
+    settings.performance.validate_hammer_options = False
+    cli = registry.get_cli('request.example.com')
+    with cli.omit_credentials():
+        request = cli.Org._build_request('organization list')
+    assert request.omit_credentials
+    assert request.user is None
+    assert request.hostname == 'request.example.com'
+    assert not cli.Org._build_request('organization list').omit_credentials
+
+
+@mock.patch('robottelo.host_helpers.cli_factory.create_object')
+def test_cli_factory_finds_entities_not_looked_up(create_object):
+    """make_<entity> resolves its entity on a namespace where none was looked up yet"""
+    cli = registry.get_cli('factory.example.com')
+    factory = CLIFactory(mock.Mock(cli=cli))
+    assert 'Org' not in vars(cli)
+    factory.make_org({'name': 'org'})
+    assert create_object.call_args.args[0] is cli.Org
+    assert 'LifecycleEnvironment' not in vars(cli)
+    factory.make_lifecycle_environment({'organization-id': 1})
+    assert create_object.call_args.args[0] is cli.LifecycleEnvironment
+    assert factory._find_entity_class('not_an_entity') is None
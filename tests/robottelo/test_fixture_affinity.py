@@ -0,0 +1,155 @@
+"""Tests for the scheduler of ``pytest_plugins.fixture_affinity``."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from pytest_plugins.fixture_affinity import FixtureAffinityScheduling, affinity_groups
+
+COLLECTION = [
+    'tests/test_cv.py::test_publish[rhel8]',
+    'tests/test_cv.py::test_promote[rhel8]',
+    'tests/test_cv.py::test_publish[rhel9]',
+    'tests/test_cv.py::test_promote[rhel9]',
+    'tests/test_cv.py::test_delete',
+    'tests/test_org.py::test_create',
+    'tests/test_org.py::test_update',
+    'tests/test_org.py::test_delete',
+]
+GROUPS = {
+    **{nodeid: 'tests/test_cv.py{"module_host": "rhel8"}' for nodeid in COLLECTION[:2]},
+    **{nodeid: 'tests/test_cv.py{"module_host": "rhel9"}' for nodeid in COLLECTION[2:4]},
+    COLLECTION[4]: 'tests/test_cv.py{"module_host": "rhel8"}',
+    **{nodeid: 'tests/test_org.py' for nodeid in COLLECTION[5:]},
+}
+
+
+class FakeNode:
+    shutting_down = False
+
+    def __init__(self, id):
+        self.gateway = mock.Mock(id=id)
+        self.sent = []
+
+    def send_runtest_some(self, indexes):
+        self.sent.append([COLLECTION[index] for index in indexes])
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+@pytest.fixture
+def groups_dir(tmp_path):
+    (tmp_path / 'gw0.json').write_text(json.dumps(GROUPS))
+    return tmp_path
+
+
+def _schedule(groups_dir, durations=None, nodes=3):
+    config = mock.Mock(**{'getvalue.return_value': [f'{nodes}*popen']})
+    scheduler = FixtureAffinityScheduling(
+        config, log=mock.MagicMock(), groups_dir=groups_dir, durations=durations
+    )
+    workers = [FakeNode(f'gw{index}') for index in range(nodes)]
+    for worker in workers:
+        scheduler.add_node(worker)
+        scheduler.add_node_collection(worker, COLLECTION)
+    scheduler.schedule()
+    return workers
+
+
+def test_groups_by_shared_fixtures(groups_dir):
+    workers = _schedule(groups_dir)
+    sent = sorted(sorted(worker.sent[0]) for worker in workers)
+    assert sent == [
+        sorted(COLLECTION[:2] + COLLECTION[4:5]),
+        sorted(COLLECTION[2:4]),
+        sorted(COLLECTION[5:]),
+    ]
+
+
+def test_without_durations_most_tests_first(groups_dir):
+    (first,) = _schedule(groups_dir, nodes=1)[0].sent[:1]
+    assert first == COLLECTION[:2] + COLLECTION[4:5]
+
+
+def test_longest_group_first(groups_dir):
+    durations = dict.fromkeys(COLLECTION, 1)
+    durations['tests/test_cv.py::test_publish[rhel9]'] = 100
+    (first,) = _schedule(groups_dir, durations=durations, nodes=1)[0].sent[:1]
+    assert first == COLLECTION[2:4]
+
+
+def test_without_groups_like_loadscope(tmp_path):
+    workers = _schedule(tmp_path, nodes=2)
+    sent = sorted(sorted(worker.sent[0]) for worker in workers)
+    assert sent == [sorted(COLLECTION[:5]), sorted(COLLECTION[5:])]
+
+
+def test_node_crash_requeues_group(groups_dir):
+    durations = dict.fromkeys(COLLECTION, 1)
+    durations['tests/test_cv.py::test_publish[rhel8]'] = 10
+    config = mock.Mock(**{'getvalue.return_value': ['1*popen']})
+    scheduler = FixtureAffinityScheduling(
+        config, log=mock.MagicMock(), groups_dir=groups_dir, durations=durations
+    )
+    crashed, replacement = FakeNode('gw0'), FakeNode('gw1')
+    scheduler.add_node(crashed)
+    scheduler.add_node_collection(crashed, COLLECTION)
+    scheduler.schedule()
+    assert crashed.sent == [COLLECTION[:2] + COLLECTION[4:5]]
+    # the longest group was not run by the crashed node, it is still the first one to assign
+    scheduler.remove_node(crashed)
+    scheduler.add_node(replacement)
+    scheduler.add_node_collection(replacement, COLLECTION)
+    scheduler.schedule()
+    assert replacement.sent[0] == COLLECTION[:2] + COLLECTION[4:5]
+
+
+TEST_MODULE = '''
+import pytest
+
+
+@pytest.fixture(scope='module', params=['rhel8', 'rhel9'])
+def module_host(request):
+    return request.param
+
+
+@pytest.fixture(params=['ipv4', 'ipv6'])
+def network(request):
+    return request.param
+
+
+def test_publish(module_host):
+    pass
+
+
+def test_promote(module_host, network):
+    pass
+
+
+def test_delete():
+    pass
+'''
+
+
+def test_affinity_groups_of_collected_items(tmp_path):
+    (tmp_path / 'test_cv.py').write_text(TEST_MODULE)
+
+    class GroupsCollector:
+        def pytest_collection_finish(self, session):
+            self.groups = affinity_groups(session.items)
+
+    collector = GroupsCollector()
+    pytest.main(['--collect-only', '-q', '-p', 'no:cacheprovider', str(tmp_path)], [collector])
+    rhel8, rhel9 = (f'test_cv.py{{"module_host": "{host}"}}' for host in ('rhel8', 'rhel9'))
+    assert collector.groups == {
+        'test_cv.py::test_publish[rhel8]': rhel8,
+        'test_cv.py::test_promote[rhel8-ipv4]': rhel8,
+        'test_cv.py::test_promote[rhel8-ipv6]': rhel8,
+        'test_cv.py::test_publish[rhel9]': rhel9,
+        'test_cv.py::test_promote[rhel9-ipv4]': rhel9,
+        'test_cv.py::test_promote[rhel9-ipv6]': rhel9,
+        # the tests without module parameters join the first group of the module
+        'test_cv.py::test_delete': rhel8,
+    }
@@ -0,0 +1,82 @@
+"""Tests for ``pytest_plugins.fixture_profiler``."""
+
+from collections import Counter
+import json
+
+import pytest
+
+from pytest_plugins.fixture_profiler import FixtureProfiler, FixtureStats
+
+
+def _key(params=None, cls=None, module='tests/test_cv.py'):
+    return json.dumps([params or {}, cls, module], sort_keys=True)
+
+
+@pytest.fixture
+def org_stats():
+    return FixtureStats(
+        fixture='function_org',
+        module='pytest_fixtures.core.sat_cap_factory',
+        scope='function',
+        setups=6,
+        setup_time=5.0,
+        teardowns=6,
+        teardown_time=1.0,
+        instances=Counter(
+            {
+                _key(): 2,
+                _key(cls='tests/test_cv.py::TestCV'): 2,
+                _key({'host': 'rhel8'}, module='tests/test_org.py'): 1,
+                _key({'host': 'rhel9'}, module='tests/test_org.py'): 1,
+            }
+        ),
+    )
+
+
+def test_rebuilds(org_stats):
+    # built 4 times without parameters, and once per host
+    assert org_stats.rebuilds == 3
+
+
+def test_savings(org_stats):
+    assert org_stats.savings('class') == (2, 2.0)
+    assert org_stats.savings('module') == (3, 3.0)
+    assert org_stats.savings('session') == (3, 3.0)
+    assert org_stats.savings('function') == (0, 0.0)
+
+
+def test_merge_workers(org_stats, tmp_path):
+    profiler = FixtureProfiler(tmp_path / 'profile.json')
+    node = type('Node', (), {'workeroutput': {'fixture_profile': [org_stats.to_dict()]}})
+    profiler.pytest_testnodedown(node, None)
+    profiler.pytest_testnodedown(node, None)
+    (stats,) = profiler.stats.values()
+    assert stats.setups == 12
+    assert stats.instances[_key()] == 4
+    # the same fixture instances built on both workers
+    assert stats.savings('module') == (9, 9.0)
+
+
+def test_candidates(org_stats, tmp_path):
+    profiler = FixtureProfiler(tmp_path / 'profile.json')
+    module_host = FixtureStats(
+        fixture='module_host',
+        module='pytest_fixtures.core.contenthosts',
+        scope='module',
+        setups=2,
+        setup_time=120.0,
+        instances=Counter({_key(): 1, _key(module='tests/test_org.py'): 1}),
+    )
+    session_sat = FixtureStats(fixture='session_sat', module='conftest', scope='session', setups=1)
+    profiler.stats = {'org': org_stats, 'host': module_host, 'sat': session_sat}
+    candidates = profiler.candidates()
+    assert [(c['fixture'], c['promote_to'], c['saved_setups']) for c in candidates] == [
+        ('module_host', 'session', 1),
+        ('function_org', 'module', 3),
+    ]
+    report = profiler.report()
+    assert [fixture['fixture'] for fixture in report['fixtures']] == [
+        'module_host',
+        'function_org',
+        'session_sat',
+    ]
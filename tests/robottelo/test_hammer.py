@@ -1,7 +1,17 @@
 """Tests for Robottelo's hammer helpers"""
 
+import json
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
 from robottelo.cli import hammer
 
+INFO_CORPUS = sorted((Path(__file__).parent / 'data' / 'hammer_info').glob('*.txt'))
+JSON_CORPUS_DIR = Path(__file__).parent / 'data' / 'hammer_json'
+JSON_CORPUS = sorted(JSON_CORPUS_DIR.glob('*.json'))
+
 
 class TestParseCSV:
     """Tests for parsing CSV hammer output"""
@@ -109,6 +119,40 @@ class TestParseJSON:
 
         assert hammer.parse_json(json_output) == hammer.parse_csv(csv_ouput_lines)[0]
 
+    @pytest.mark.parametrize('json_file', JSON_CORPUS, ids=lambda path: path.stem)
+    @pytest.mark.parametrize('fast_decoder', [True, False], ids=['orjson', 'json'])
+    def test_parse_json_lazy_matches_parse_json(self, json_file, fast_decoder, monkeypatch):
+        """A lazy mapping compares equal to the eagerly normalized output"""
+        if not fast_decoder:
+            monkeypatch.setattr(hammer, 'orjson', None)
+        output = json_file.read_text()
+        assert hammer.parse_json_lazy(output) == hammer.parse_json(output)
+        assert hammer.parse_output(output, hammer.JSON_LAZY).normalized() == hammer.parse_json(
+            output
+        )
+
+    def test_parse_json_lazy_access(self):
+        """Keys and values are normalized when they are read"""
+        output = (JSON_CORPUS_DIR / 'host_info.json').read_text()
+        host = hammer.parse_json_lazy(output)
+        assert isinstance(host, hammer.HammerMapping)
+        assert host['id'] == '103'
+        assert host['managed'] is True
+        assert host['content-information']['content-view']['id'] == '12'
+        assert host['network-interfaces'][0]['mac-address'] == '52:54:00:3c:1a:01'
+        assert host['network-interfaces'][-1:] == [host['network-interfaces'][1]]
+        assert 'Id' not in host
+        assert host.get('missing') is None
+        with pytest.raises(KeyError):
+            host['missing']
+        with pytest.raises(TypeError):
+            host['id'] = '1'
+
+    def test_output_option(self):
+        """The lazy JSON output mode runs hammer with the json output"""
+        assert hammer.output_option(hammer.JSON_LAZY) == 'json'
+        assert hammer.output_option('csv') == 'csv'
+
 
 class TestParseHelp:
     """Tests for parsing hammer help output"""
@@ -296,6 +340,20 @@ class TestParseHelp:
 class TestParseInfo:
     """Tests for parsing info hammer output"""
 
+    @pytest.mark.parametrize('info_file', INFO_CORPUS, ids=lambda path: path.stem)
+    def test_parse_recorded_output(self, info_file):
+        """Can parse the recorded info outputs of the corpus"""
+        expected = json.loads(info_file.with_suffix('.json').read_text())
+        assert hammer.parse_info(info_file.read_text()) == expected
+
+    def test_indentation_level(self):
+        """Tabs count as 4 spaces and a partial level counts as a level"""
+        assert hammer.get_line_indentation_level('Name: x') == 0
+        assert hammer.get_line_indentation_level('   x') == 1
+        assert hammer.get_line_indentation_level('     x') == 2
+        assert hammer.get_line_indentation_level('\t    x') == 2
+        assert hammer.get_line_indentation_level(' 1)') == 0
+
     def test_parse_simple(self):
         """Can parse a simple info output"""
         output = '\n'.join(
@@ -536,3 +594,107 @@ class TestParseInfo:
     def test_parse_json_list(self):
         """Can parse a list in json"""
         assert hammer.parse_json('["item1", "item2"]') == ['item1', 'item2']
+
+
+HELP_PAGES = {
+    'hammer': '\n'.join(
+        [
+            'Subcommands:',
+            ' host                          Manipulate hosts',
+            ' org                           Manipulate organizations',
+            'Options:',
+            ' --version                     Show version',
+        ]
+    ),
+    'hammer host': '\n'.join(
+        [
+            'Subcommands:',
+            ' create                        Create a host',
+            'Options:',
+            ' -h, --help                    Print help',
+        ]
+    ),
+    'hammer host create': '\n'.join(
+        [
+            'Options:',
+            ' --name VALUE                  Host name',
+            ' --location-title, --loc-title VALUE  Location title',
+            ' --[no-]build                  Build the host',
+        ]
+    ),
+    'hammer org': 'Options:\n -h, --help                    Print help',
+}
+
+
+class TestCommandIndex:
+    """Tests for crawling and indexing the hammer command tree"""
+
+    @pytest.fixture
+    def ssh_command(self):
+        def command(cmd, hostname=None):
+            if cmd == 'hammer --version':
+                stdout = (
+                    'hammer (3.9.0)\n * hammer_cli_foreman (3.9.0)\n * hammer_cli_katello (1.11.1)'
+                )
+            elif cmd.startswith('rpm'):
+                stdout = '6.15.0'
+            else:
+                stdout = HELP_PAGES[cmd.removesuffix(' --help')]
+            return mock.Mock(status=0, stdout=stdout)
+
+        with mock.patch('robottelo.ssh.command', side_effect=command) as ssh_command:
+            yield ssh_command
+
+    def test_parse_version(self):
+        assert hammer.parse_version('hammer (3.9.0)\n * hammer_cli_foreman (3.9.0.1)') == {
+            'hammer': '3.9.0',
+            'hammer_cli_foreman': '3.9.0.1',
+        }
+
+    def test_crawl_command_tree(self, ssh_command):
+        """Every command is crawled once, and the tree has the format of hammer_commands.json"""
+        tree = hammer.crawl_command_tree(hostname='sat.example.com', max_workers=2)
+        assert ssh_command.call_count == len(HELP_PAGES)
+        assert [sub['name'] for sub in tree['subcommands']] == ['host', 'org']
+        host = tree['subcommands'][0]
+        assert host['description'] == 'Manipulate hosts'
+        assert host['subcommands'][0]['options'][0]['name'] == 'name'
+
+    def test_index_lookups(self, ssh_command, tmp_path):
+        """The index is cached on disk for the versions of the Satellite"""
+        index = hammer.get_command_index(hostname='sat.example.com', directory=tmp_path)
+        assert 'hammer host create' in index
+        assert index.subcommands('hammer host') == ['create']
+        assert index.option('hammer host create', 'name')['value'] == 'VALUE'
+        assert index.option('hammer host create', 'missing') is None
+        assert index.description('hammer org') == 'Manipulate organizations'
+        assert index.key == {
+            'satellite': '6.15.0',
+            'hammer': {
+                'hammer': '3.9.0',
+                'hammer_cli_foreman': '3.9.0',
+                'hammer_cli_katello': '1.11.1',
+            },
+        }
+
+        ssh_command.reset_mock()
+        cached = hammer.get_command_index(hostname='sat.example.com', directory=tmp_path)
+        assert ssh_command.call_count == 2  # only the versions were fetched
+        assert cached.to_tree() == index.to_tree()
+        assert hammer.HammerCommandIndex.load({'satellite': '6.16.0'}, tmp_path) is None
+
+    def test_index_option_aliases(self, ssh_command, tmp_path):
+        """Options are found by their deprecated names and negations, after a reload too"""
+        index = hammer.get_command_index(hostname='sat.example.com', directory=tmp_path)
+        cached = hammer.HammerCommandIndex.load(index.key, tmp_path)
+        for command_index in (index, cached):
+            assert (
+                command_index.validate('hammer host create', ['loc-title', 'build', 'no-build'])
+                is None
+            )
+            assert command_index.option('hammer host create', 'loc-title')['name'] == (
+                'location-title'
+            )
+        assert "Unrecognised option '--no-name'" in index.validate(
+            'hammer host create', ['no-name']
+        )
@@ -0,0 +1,297 @@
+"""Benchmarks for parsing hammer output
+
+``info`` parsers are run on the recorded outputs of ``tests/robottelo/data/hammer_info``. The
+previous implementation of :func:`robottelo.cli.hammer.parse_info` is kept here as the reference,
+both for the parsed results and for the throughput (``lines_per_second``) and peak memory
+(``peak_allocated_bytes``) reported in the benchmark ``extra_info``.
+
+The output formats of ``list`` and ``info`` (csv, json and json-lazy) are compared on large
+payloads built from the recorded outputs of ``tests/robottelo/data/hammer_json``.
+
+Run with ``pytest tests/robottelo/test_hammer_benchmark.py --benchmark-only``, and compare runs
+with ``--benchmark-autosave``/``--benchmark-compare``.
+"""
+
+import csv
+import io
+import json
+from pathlib import Path
+import random
+import re
+import tracemalloc
+
+import pytest
+
+from robottelo.cli import hammer
+
+pytest.importorskip('pytest_benchmark')
+
+CORPUS_DIR = Path(__file__).parent / 'data' / 'hammer_info'
+JSON_CORPUS_DIR = Path(__file__).parent / 'data' / 'hammer_json'
+
+
+def _legacy_indentation_level(line, tab_spaces=4, indentation_spaces=4):
+    if not line or len(line) < tab_spaces:
+        return 0
+    spaces = 0
+    for char in line:
+        if char not in (' ', '\t'):
+            break
+        if char == '\t':
+            spaces += tab_spaces
+        else:
+            spaces += 1
+    return spaces // indentation_spaces + (1 if spaces % indentation_spaces > 0 else 0)
+
+
+def legacy_parse_info(output):
+    """``robottelo.cli.hammer.parse_info`` before it was made single-pass"""
+    # info dictionary
+    contents = {}
+    sub_prop = None  # stores name of the last group of sub-properties
+    sub_num = None  # is not None when list of properties
+    second_level_key = None  # is set when a possible second level is detected
+
+    for line in output.splitlines():
+        # skip empty lines and dividers
+        if line == '' or line == '---':
+            continue
+        current_indent_level = _legacy_indentation_level(line)
+        if current_indent_level <= 1:
+            # we are entering or leaving a second level from lower/upper levels
+            # clear the second level key
+            second_level_key = None
+        if line.startswith(' '):  # sub-properties are indented
+            # values are separated by ':' or '=>', but not by '::' which can be
+            # entity name like 'test::params::keys'
+            if line.find(':') != -1 and line.find('::') == -1:
+                key, value = line.lstrip().split(":", 1)
+            elif line.find('=>') != -1 and len(line.lstrip().split(" =>", 1)) == 2:
+                key, value = line.lstrip().split(" =>", 1)
+            else:
+                key = value = None
+
+            if key is None and value is None:
+                # Parse single attribute collection properties
+                # Template
+                #  1) template1
+                #  2) template2
+                #
+                # or
+                # Template
+                #  template1
+                #  template2
+                match = re.match(r'\d+\)\s+(.+)$', line.lstrip())
+
+                if match is None:
+                    match = re.match(r'(.*)$', line.lstrip())
+
+                value = match.group(1)
+
+                # adding list to 1 level, for example:
+                # {'template': ['template1', 'template2']}
+                if isinstance(contents[sub_prop], dict) and not contents[sub_prop]:
+                    contents[sub_prop] = []
+                    contents[sub_prop].append(value)
+                elif isinstance(contents[sub_prop], list):
+                    contents[sub_prop].append(value)
+                else:
+                    # adding list to 2 level, for example:
+                    # {'subscription-information':
+                    #      {'registered-by-activation-keys': ['ak1', 'ak2']}
+                    #  }
+                    last_key = list(contents[sub_prop].keys())[-1]
+                    if not contents[sub_prop][last_key]:
+                        contents[sub_prop][last_key] = [value]
+                    else:
+                        contents[sub_prop][last_key].append(value)
+            else:
+                # some properties have many numbered values
+                # Example:
+                # Content:
+                #  1) Repo Name: repo1
+                #     URL:       /custom/4f84fc90-9ffa-...
+                #  2) Repo Name: puppet1
+                #     URL:       /custom/4f84fc90-9ffa-...
+                starts_with_number = re.match(r'(\d+)\)', key)
+                if starts_with_number:
+                    # if this is a numbered list on level 2, do nothing - this script doesn't support it
+                    if current_indent_level >= 2:
+                        continue
+                    sub_num = int(starts_with_number.group(1))
+                    # no. 1) we need to change dict() to list()
+                    if sub_num == 1:
+                        contents[sub_prop] = []
+                    # remove number from key
+                    key = re.sub(r'\d+\)', '', key)
+                    # append empty dict to array
+                    contents[sub_prop].append({})
+
+                key = key.lstrip().replace(' ', '-').lower()
+                value = value.lstrip()
+                # add value to dictionary
+                if sub_num is not None:
+                    contents[sub_prop][-1][key] = value
+                else:
+                    # a third level is always represented as a dictionary and
+                    # we need to detect if we are at third level
+                    # example:
+                    # Content Information:
+                    #     Content View:
+                    #         ID:   10
+                    #         Name: Default Organization View
+                    # the "ID" and "Name" are located at third indent level
+                    # "content view" is located at second indent level
+                    if current_indent_level == 2 and second_level_key:
+                        # we are at third level indentation
+                        if not contents[sub_prop][second_level_key]:
+                            contents[sub_prop][second_level_key] = {}
+                        contents[sub_prop][second_level_key][key] = value
+                    else:
+                        contents[sub_prop][key] = value
+                    if current_indent_level == 1 and not value:
+                        # always set the last possible second level key
+                        # that can form a third level
+                        second_level_key = key
+        else:
+            sub_num = None  # new property implies no sub property
+            key, value = line.lstrip().split(":", 1)
+            key = key.lstrip().replace(' ', '-').lower()
+            if value.lstrip() == '':  # 'key:' no value, new sub-property
+                sub_prop = key
+                contents[sub_prop] = {}
+            else:  # 'key: value' line
+                contents[key] = value.lstrip()
+
+    return contents
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    return [path.read_text() for path in sorted(CORPUS_DIR.glob('*.txt'))]
+
+
+def _fuzz_outputs(count=500, seed=0):
+    """Yield random info outputs made of the line shapes hammer produces"""
+    rand = random.Random(seed)
+    shapes = [
+        'Name: {word}',
+        'Group:',
+        ' {num}) {word}',
+        ' {num}) Key {word}: {word}',
+        '    Key {word}: {word}',
+        '    Key {word}:',
+        '        Sub {word}: {word}',
+        '    {word} => {word}',
+        '    {word}',
+        '     {num}) {word}',
+        '    a::b::{word}',
+        '\t{word}: {word}',
+        '---',
+        '',
+    ]
+    for _ in range(count):
+        lines = ['Group:']
+        for _ in range(rand.randint(1, 30)):
+            word = rand.choice(['x', 'Value', 'two words', '1) y', ''])
+            lines.append(rand.choice(shapes).format(word=word, num=rand.randint(1, 3)))
+        yield '\n'.join(lines)
+
+
+def _outcome(parser, output):
+    try:
+        return parser(output)
+    except Exception as err:
+        return type(err)
+
+
+def test_parse_info_matches_legacy_on_fuzzed_output():
+    for output in _fuzz_outputs():
+        assert _outcome(hammer.parse_info, output) == _outcome(legacy_parse_info, output), output
+
+
+@pytest.mark.parametrize(
+    'parser', [legacy_parse_info, hammer.parse_info], ids=['legacy', 'single_pass']
+)
+def test_parse_info_throughput(benchmark, corpus, parser):
+    """Parse the whole corpus, reporting lines per second and peak memory"""
+
+    def parse_corpus():
+        return [parser(output) for output in corpus]
+
+    tracemalloc.start()
+    parse_corpus()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    benchmark.group = 'hammer parse_info'
+    results = benchmark(parse_corpus)
+
+    lines = sum(len(output.splitlines()) for output in corpus)
+    benchmark.extra_info['lines'] = lines
+    benchmark.extra_info['peak_allocated_bytes'] = peak
+    if benchmark.stats:  # not set with --benchmark-disable
+        benchmark.extra_info['lines_per_second'] = round(lines / benchmark.stats.stats.mean)
+    assert results == [legacy_parse_info(output) for output in corpus]
+
+
+@pytest.fixture(scope='module')
+def repository_list_outputs():
+    """csv and json outputs of ``hammer repository list`` for 5000 repositories"""
+    recorded = json.loads((JSON_CORPUS_DIR / 'repository_list.json').read_text())
+    rows = [
+        {**row, 'Id': index, 'Name': f'{row["Name"]} {index}'}
+        for index, row in enumerate(recorded * 1250)
+    ]
+    csv_output = io.StringIO()
+    writer = csv.DictWriter(csv_output, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+    return {'csv': csv_output.getvalue(), 'json': json.dumps(rows, indent=2)}
+
+
+@pytest.fixture(scope='module')
+def host_info_output():
+    """json output of ``hammer host info`` for a host with 2000 parameters"""
+    host = json.loads((JSON_CORPUS_DIR / 'host_info.json').read_text())
+    host['All parameters'] = [
+        {'Name': f'app_setting_{index}', 'Value': index} for index in range(2000)
+    ]
+    return json.dumps(host, indent=2)
+
+
+@pytest.mark.parametrize('fast_decoder', [True, False], ids=['orjson', 'json'])
+@pytest.mark.parametrize('output_format', ['csv', 'json', hammer.JSON_LAZY])
+def test_repository_list_read_two_fields(
+    benchmark, repository_list_outputs, output_format, fast_decoder, monkeypatch
+):
+    """Parse a large list output and read two fields of every row"""
+    if output_format == 'csv' and not fast_decoder:
+        pytest.skip('no JSON is decoded from csv output')
+    if not fast_decoder:
+        monkeypatch.setattr(hammer, 'orjson', None)
+    output = repository_list_outputs['json' if output_format == hammer.JSON_LAZY else output_format]
+
+    def read_fields():
+        return [(row['id'], row['name']) for row in hammer.parse_output(output, output_format)]
+
+    benchmark.group = 'hammer repository list'
+    fields = benchmark(read_fields)
+    assert fields[-1] == ('4999', 'iso-files 4999')
+
+
+@pytest.mark.parametrize('fast_decoder', [True, False], ids=['orjson', 'json'])
+@pytest.mark.parametrize('output_format', ['json', hammer.JSON_LAZY])
+def test_host_info_read_two_fields(
+    benchmark, host_info_output, output_format, fast_decoder, monkeypatch
+):
+    """Parse a large info output and read two nested fields"""
+    if not fast_decoder:
+        monkeypatch.setattr(hammer, 'orjson', None)
+
+    def read_fields():
+        host = hammer.parse_output(host_info_output, output_format)
+        return host['content-information']['content-view']['id'], host['network']['domain']
+
+    benchmark.group = 'hammer host info'
+    assert benchmark(read_fields) == ('12', 'example.com')
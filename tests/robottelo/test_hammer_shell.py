@@ -0,0 +1,125 @@
+"""Tests for module ``robottelo.cli.hammer_shell``."""
+
+import json
+import sys
+from unittest import mock
+
+import pytest
+
+from robottelo.cli import hammer_shell
+from robottelo.exceptions import HammerShellError
+
+
+class FakeShell:
+    """An interactive shell answering each request with a canned driver response"""
+
+    def __init__(self, status=0, stdout='', stderr=''):
+        self.response = {'status': status, 'stdout': stdout, 'stderr': stderr}
+        self.sent = []
+        self.pending = ['motd line\n', json.dumps({'ready': True}) + '\n']
+
+    def send(self, cmd):
+        self.sent.append(cmd)
+        if cmd.startswith('{'):
+            request = json.loads(cmd)
+            self.pending.append(json.dumps({'id': request['id'], **self.response}) + '\n')
+
+    def stdout(self):
+        return self.pending.pop(0) if self.pending else None
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def shell_session():
+    session = hammer_shell.HammerShell('sat.example.com', 'admin', 'changeme', 'en_US')
+    session._client = mock.Mock()
+    session._shell = FakeShell(stdout='ID,Name\n1,Default Organization View\n')
+    session._read_response()  # skip the motd line
+    assert session._read_response() == {'ready': True}
+    return session
+
+
+def test_start_uses_ssh_settings():
+    session = hammer_shell.HammerShell('sat.example.com', 'admin', 'changeme', 'en_US')
+    hosts = mock.Mock()
+    hosts.ContentHost.return_value.execute.return_value.status = 0
+    hosts.ContentHost.return_value.session.shell.return_value = FakeShell()
+    kwargs = {'hostname': 'sat.example.com', 'username': 'root', 'password': 'pass', 'port': 2222}
+    with (
+        mock.patch.dict(sys.modules, {'robottelo.hosts': hosts}),
+        mock.patch('robottelo.cli.hammer_shell.ssh.client_kwargs', return_value=kwargs),
+    ):
+        session.start()
+    hosts.ContentHost.assert_called_once_with(**kwargs)
+    assert session.alive
+
+
+def test_run_frames_response(shell_session):
+    result = shell_session.run(['content-view', 'list'])
+    assert json.loads(shell_session._shell.sent[-1])['args'] == ['content-view', 'list']
+    assert result.status == 0
+    assert result.stdout.startswith('ID,Name')
+    assert result.stderr == ''
+
+
+def test_run_dead_channel_raises(shell_session):
+    shell_session._shell.send = lambda cmd: None  # the request is sent, but never answered
+    with pytest.raises(HammerShellError):
+        shell_session.run(['content-view', 'list'])
+    assert not shell_session.alive
+
+
+def test_run_unsent_request_returns_none(shell_session):
+    shell_session._shell.send = mock.Mock(side_effect=OSError)
+    assert shell_session.run(['content-view', 'list']) is None
+    assert not shell_session.alive
+
+
+def test_execute_parses_output(shell_session):
+    with mock.patch('robottelo.cli.hammer_shell._get_session', return_value=shell_session):
+        result = hammer_shell.execute(
+            'content-view list --organization-id="1"',
+            hostname='sat.example.com',
+            user='admin',
+            password='changeme',
+            locale='en_US',
+            output_format='csv',
+        )
+    args = json.loads(shell_session._shell.sent[-1])['args']
+    assert args == [
+        '-v',
+        '-u',
+        'admin',
+        '-p',
+        'changeme',
+        '--output=csv',
+        'content-view',
+        'list',
+        '--organization-id=1',
+    ]
+    assert result.stdout == [{'id': '1', 'name': 'Default Organization View'}]
+
+
+def test_execute_shell_syntax_goes_one_shot():
+    assert (
+        hammer_shell.execute(
+            'host list | grep foo',
+            hostname='sat.example.com',
+            user='admin',
+            password='changeme',
+            locale='en_US',
+        )
+        is None
+    )
+
+
+def test_changed_credentials_close_session():
+    hammer_shell.close_sessions()
+    session = hammer_shell._get_session('sat.example.com', 'user', 'pass', 'en_US')
+    assert hammer_shell._get_session('sat.example.com', 'user', 'pass', 'en_US') is session
+    with mock.patch.object(session, 'close') as close:
+        assert hammer_shell._get_session('sat.example.com', 'user', 'new', 'en_US') is None
+    close.assert_called_once()
+    hammer_shell.close_sessions()
@@ -0,0 +1,63 @@
+"""Tests for module ``robottelo.cli.hammer_timing``."""
+
+import csv
+
+import pytest
+
+from robottelo.cli import hammer_timing
+
+
+@pytest.mark.parametrize(
+    ('stderr', 'expected_stderr'),
+    [
+        ('real 1.52\nuser 0.91\nsys 0.12\n', ''),
+        ('Warning: something\nreal 1.52\nuser 0.91\nsys 0.12', 'Warning: something\n'),
+        (
+            'Error: Unrecognised option\nCommand exited with non-zero status 64\n'
+            'real 1.52\nuser 0.91\nsys 0.12\n',
+            'Error: Unrecognised option\n',
+        ),
+    ],
+)
+def test_strip_time_output(stderr, expected_stderr):
+    stripped, times = hammer_timing.strip_time_output(stderr)
+    assert stripped == expected_stderr
+    assert times == {'real': 1.52, 'user': 0.91, 'sys': 0.12}
+
+
+def test_strip_time_output_without_timing():
+    assert hammer_timing.strip_time_output('real problem\n') == ('real problem\n', None)
+    assert hammer_timing.strip_time_output(None) == (None, None)
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert hammer_timing.percentile(values, 50) == 50
+    assert hammer_timing.percentile(values, 99) == 99
+    assert hammer_timing.percentile([3.0], 95) == 3.0
+
+
+def test_collector_report():
+    collector = hammer_timing.HammerTimingCollector()
+    for test, real in [('test_a', 1.0), ('test_a', 3.0), ('test_b', 2.0), (None, 4.0)]:
+        collector.test = test
+        collector.record('host list', {'real': real, 'user': 0.5, 'sys': 0.1})
+    collector.test = 'test_b'
+    collector.record('host info', {'real': 1.0, 'user': 0.5, 'sys': 0.1})
+
+    report = collector.report({'snap_version': '1.0'})
+    assert report['metadata'] == {'snap_version': '1.0'}
+    assert report['session']['host list']['count'] == 4
+    assert report['session']['host list']['real']['p50'] == 2.0
+    assert report['session']['host list']['real']['max'] == 4.0
+    assert report['tests']['test_a']['host list']['real']['mean'] == 2.0
+    assert set(report['tests']['test_b']) == {'host info', 'host list'}
+
+    # timings from an xdist worker
+    worker = hammer_timing.HammerTimingCollector()
+    worker.extend(collector.to_dicts())
+    assert worker.report() == {**report, 'metadata': {}}
+
+    rows = list(csv.DictReader(collector.to_csv().splitlines()))
+    assert [row['command'] for row in rows] == ['host info', 'host list']
+    assert rows[1]['real_p95'] == '4.0'
@@ -0,0 +1,133 @@
+"""Tests for ``robottelo.host_checkin``."""
+
+import threading
+from unittest import mock
+
+import pytest
+
+from robottelo import host_checkin
+from robottelo.host_checkin import CheckinQueue, release_hosts, setup_hosts
+
+
+class FakeBroker:
+    """Records the check-ins, failing the first ``failures`` of them"""
+
+    checked_in = []
+    failures = 0
+    released = threading.Event()
+
+    def __init__(self, hosts):
+        self.hosts = hosts
+
+    def checkin(self):
+        if FakeBroker.failures:
+            FakeBroker.failures -= 1
+            raise RuntimeError('broker is down')
+        FakeBroker.released.wait(timeout=10)
+        FakeBroker.checked_in.extend(self.hosts)
+
+
+@pytest.fixture(autouse=True)
+def broker():
+    FakeBroker.checked_in = []
+    FakeBroker.failures = 0
+    FakeBroker.released.set()
+    with mock.patch('robottelo.host_checkin.Broker', FakeBroker):
+        yield FakeBroker
+
+
+@pytest.fixture
+def settings():
+    with mock.patch('robottelo.host_checkin.settings') as settings:
+        settings.broker.async_checkin.enabled = True
+        settings.broker.async_checkin.max_workers = 2
+        settings.broker.async_checkin.retries = 1
+        settings.broker.async_checkin.retry_delay = 0
+        yield settings
+
+
+@pytest.fixture
+def queue(settings):
+    queue = CheckinQueue()
+    with mock.patch.object(host_checkin, 'checkin_queue', queue):
+        yield queue
+
+
+def _host(name, skip_context_checkin=False):
+    return mock.Mock(hostname=name, _skip_context_checkin=skip_context_checkin)
+
+
+def test_release_in_background(broker, queue):
+    broker.released.clear()
+    hosts = [_host('host1'), _host('host2')]
+    release_hosts(hosts, unregister=True)
+    # the check-in doesn't block the caller
+    assert not broker.checked_in
+    broker.released.set()
+    assert queue.drain(timeout=10) == []
+    assert broker.checked_in == hosts
+    for host in hosts:
+        host.unregister.assert_called_once()
+        host.teardown.assert_called_once()
+
+
+def test_release_retries(broker, queue):
+    broker.failures = 1
+    release_hosts([_host('host1')])
+    assert queue.drain(timeout=10) == []
+    assert len(broker.checked_in) == 1
+
+
+def test_release_failure_reported(broker, queue):
+    broker.failures = 2
+    host = _host('host1')
+    host.teardown.side_effect = RuntimeError('unreachable')
+    release_hosts([host])
+    assert queue.drain(timeout=10) == [
+        host_checkin.CheckinFailure(hostnames=['host1'], error='broker is down')
+    ]
+    assert not broker.checked_in
+
+
+def test_release_synchronously(broker, settings):
+    settings.broker.async_checkin.enabled = False
+    host = _host('host1')
+    release_hosts([host], teardown=False, unregister=True)
+    assert broker.checked_in == [host]
+    host.unregister.assert_called_once()
+    host.teardown.assert_not_called()
+
+
+def test_release_synchronously_teardown_failure(broker, settings):
+    settings.broker.async_checkin.enabled = False
+    hosts = [_host('host1'), _host('host2')]
+    hosts[0].teardown.side_effect = RuntimeError('unreachable')
+    with pytest.raises(RuntimeError, match='unreachable'):
+        release_hosts(hosts)
+    # the hosts are checked in anyway, and not leaked
+    assert broker.checked_in == hosts
+    hosts[1].teardown.assert_called_once()
+
+
+@pytest.mark.parametrize('async_checkin', [True, False], ids=['async', 'sync'])
+def test_setup_hosts_skip_context_checkin(broker, queue, settings, async_checkin):
+    settings.broker.async_checkin.enabled = async_checkin
+    hosts = [_host('host1'), _host('host2')]
+    with setup_hosts(hosts):
+        hosts[1]._skip_context_checkin = True
+    queue.drain(timeout=10)
+    assert broker.checked_in == [hosts[0]]
+    # the hosts are checked in by the caller when called directly
+    release_hosts([hosts[1]])
+    queue.drain(timeout=10)
+    assert broker.checked_in == hosts
+
+
+def test_setup_hosts(broker, queue):
+    host = _host('host1')
+    with setup_hosts(host) as entered:
+        assert entered is host
+        host.setup.assert_called_once()
+    queue.drain(timeout=10)
+    host.teardown.assert_called_once()
+    assert broker.checked_in == [host]
@@ -0,0 +1,160 @@
+"""Tests for ``robottelo.host_pool``."""
+
+import itertools
+import threading
+from unittest import mock
+
+import pytest
+
+from robottelo.host_pool import HostPool
+
+RHEL8 = {'workflow': 'deploy-rhel', 'deploy_rhel_version': '8'}
+RHEL9 = {'workflow': 'deploy-rhel', 'deploy_rhel_version': '9'}
+
+
+class FakeBroker:
+    """Checks out hosts named after their flavor, and records the check-ins"""
+
+    counter = itertools.count()
+    checked_out = []
+    checked_in = []
+    lock = threading.Lock()
+    fail = False
+
+    def __init__(self, hosts=None, host_class=None, _count=1, **conf):
+        self.hosts = hosts
+        self.count = _count
+        self.conf = conf
+
+    def checkout(self):
+        if FakeBroker.fail:
+            raise RuntimeError('no capacity')
+        with self.lock:
+            hosts = [
+                mock.Mock(
+                    hostname=f'rhel{self.conf["deploy_rhel_version"]}-{next(self.counter)}',
+                    _skip_context_checkin=False,
+                )
+                for _ in range(self.count)
+            ]
+            self.checked_out.extend(hosts)
+        return hosts if self.count > 1 else hosts[0]
+
+    def checkin(self):
+        with self.lock:
+            self.checked_in.extend(self.hosts)
+
+
+@pytest.fixture(autouse=True)
+def broker():
+    FakeBroker.checked_out = []
+    FakeBroker.checked_in = []
+    FakeBroker.fail = False
+    with (
+        mock.patch('robottelo.host_pool.Broker', FakeBroker),
+        mock.patch('robottelo.host_checkin.Broker', FakeBroker),
+        mock.patch('robottelo.host_checkin.settings') as settings,
+    ):
+        settings.broker.async_checkin.enabled = False
+        yield FakeBroker
+
+
+def test_prewarm_and_refill(broker):
+    pool = HostPool(mock.Mock, depth=2)
+    pool.plan(RHEL8, 3)
+    pool.plan(RHEL9)
+    pool.start()
+    # at most depth hosts per flavor, no more than needed
+    pool._executor.shutdown(wait=True)
+    assert sorted(host.hostname[:5] for host in broker.checked_out) == ['rhel8', 'rhel8', 'rhel9']
+    pool._executor = mock.Mock()
+    hosts = pool.checkout(RHEL8)
+    assert hosts[0] in broker.checked_out
+    # a host is checked out to replace the one handed out, one more test needs rhel8
+    pool._executor.submit.assert_called_once()
+
+
+def test_plan_after_start(broker):
+    # xdist workers plan the hosts of their tests as the controller sends them
+    pool = HostPool(mock.Mock, depth=2)
+    pool.start()
+    pool._executor = mock.Mock()
+    assert not pool._executor.submit.called
+    pool.plan(RHEL8, 3)
+    # only the planned flavor is checked out, right away
+    assert pool._executor.submit.call_count == 2
+    assert {
+        call.args[1]['deploy_rhel_version'] for call in pool._executor.submit.call_args_list
+    } == {'8'}
+    pool.plan(RHEL8)
+    assert pool._executor.submit.call_count == 2
+
+
+def test_checkout_more_than_ready(broker):
+    pool = HostPool(mock.Mock, depth=1)
+    pool.plan(RHEL8, 2)
+    pool.start()
+    hosts = pool.checkout(RHEL8, count=2)
+    assert len(hosts) == 2
+    assert {host.hostname[:5] for host in hosts} == {'rhel8'}
+    pool.close()
+    assert not broker.checked_in
+
+
+def test_checkout_unplanned_flavor(broker):
+    pool = HostPool(mock.Mock)
+    (host,) = pool.checkout(RHEL9)
+    assert host.hostname.startswith('rhel9')
+    pool.close()
+    assert broker.checked_out == [host]
+
+
+def test_failed_prewarm_falls_back(broker):
+    broker.fail = True
+    pool = HostPool(mock.Mock)
+    pool.plan(RHEL8)
+    pool.start()
+    pool._executor.shutdown(wait=True)
+    broker.fail = False
+    (host,) = pool.checkout(RHEL8)
+    assert host.hostname.startswith('rhel8')
+
+
+def test_hosts_context(broker):
+    pool = HostPool(mock.Mock)
+    pool.plan(RHEL8, 2)
+    pool.start()
+    with pool.hosts(RHEL8, count=2) as hosts:
+        for host in hosts:
+            host.setup.assert_called_once()
+    for host in hosts:
+        host.teardown.assert_called_once()
+    assert broker.checked_in == hosts
+    pool.close()
+
+
+def test_close_checks_in_leftovers(broker):
+    pool = HostPool(mock.Mock, depth=3)
+    pool.plan(RHEL8, 5)
+    pool.plan(RHEL9)
+    pool.start()
+    pool.close()
+    # the checkouts not started yet are cancelled
+    checked_out = len(broker.checked_out)
+    assert checked_out <= 4
+    assert sorted(broker.checked_in, key=id) == sorted(broker.checked_out, key=id)
+    # nothing is checked out ahead of time anymore once closed
+    pool.checkout(RHEL8)
+    assert len(broker.checked_out) == checked_out + 1
+
+
+def test_take_only_prewarmed_hosts(broker):
+    pool = HostPool(mock.Mock, depth=1)
+    pool.plan(RHEL8)
+    pool.start()
+    assert len(pool.take(RHEL8)) == 1
+    # neither planned nor needed anymore, nothing to take
+    assert pool.take(RHEL8) == []
+    assert pool.take(RHEL9) == []
+    pool.close()
+    assert len(broker.checked_out) == 1
@@ -0,0 +1,136 @@
+"""Tests for module ``robottelo.http_sessions``."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from unittest import mock
+
+import pytest
+import requests
+
+from robottelo.http_sessions import HTTPSessionPool, PooledRequests
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep connections alive
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        self.server.requests.append(self.path)
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = self.headers.get('Cookie', '').encode()
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Set-Cookie', 'session=abc; Path=/')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.do_GET()
+
+    do_DELETE = do_PUT = do_POST
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.connections, httpd.requests, httpd.statuses = set(), [], []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f'http://127.0.0.1:{httpd.server_port}'
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def pool():
+    pool = HTTPSessionPool(retries=2, backoff_factor=0)
+    yield pool
+    pool.clear()
+
+
+@pytest.fixture
+def settings():
+    with mock.patch('robottelo.config.settings') as settings:
+        settings.server.http_client.pool = True
+        settings.server.http_client.pool_size = 4
+        settings.server.http_client.retries = 2
+        settings.server.http_client.backoff_factor = 0
+        yield settings
+
+
+def test_connections_are_reused(server, pool):
+    session = pool.session(server.url)
+    for _ in range(5):
+        assert session.get(f'{server.url}/ping').status_code == 200
+    assert len(server.requests) == 5
+    assert len(server.connections) == 1
+    assert pool.session(f'{server.url}/other') is session
+    assert len(pool) == 1
+
+
+def test_new_session_shares_connections(server, pool):
+    session = pool.new_session(server.url)
+    session.headers['X-Test'] = 'yes'
+    session.get(server.url)
+    pool.session(server.url).get(server.url)
+    assert pool.new_session(server.url) is not session
+    assert 'X-Test' not in pool.session(server.url).headers
+    assert len(server.connections) == 1
+
+
+def test_shared_session_keeps_no_cookies(server, pool):
+    session = pool.session(server.url)
+    session.get(server.url)
+    assert session.get(server.url).text == ''
+    assert not session.cookies
+
+
+def test_retries(server, pool):
+    server.statuses = [503, 503]
+    assert pool.session(server.url).get(server.url).status_code == 200
+    assert len(server.requests) == 3
+    server.statuses = [503, 503, 503]
+    assert pool.session(server.url).get(server.url).status_code == 503
+
+
+@pytest.mark.parametrize('method', ['post', 'put', 'delete'])
+def test_unsafe_methods_not_retried(server, pool, method):
+    server.statuses = [503]
+    assert pool.session(server.url).request(method, server.url, data='x').status_code == 503
+    assert len(server.requests) == 1
+
+
+def test_pool_is_reset_in_child_process(server, pool):
+    session = pool.session(server.url)
+    with mock.patch('os.getpid', return_value=-1):
+        assert pool.session(server.url) is not session
+    assert len(pool) == 1
+
+
+def test_pooled_requests(server, settings):
+    pooled_requests = PooledRequests()
+    with mock.patch('robottelo.http_sessions.session_pool', HTTPSessionPool()) as pool:
+        assert pooled_requests.get(f'{server.url}/one', params={'a': 1}).status_code == 200
+        assert pooled_requests.get(f'{server.url}/two').status_code == 200
+        assert pool.pool_size == 4
+        assert len(pool) == 1
+        pool.clear()
+    assert server.requests == ['/one?a=1', '/two']
+    assert len(server.connections) == 1
+    assert pooled_requests.HTTPError is requests.HTTPError
+
+
+def test_pooled_requests_without_pool(server, settings):
+    settings.server.http_client.pool = False
+    with (
+        mock.patch('robottelo.http_sessions.session_pool') as pool,
+        mock.patch('requests.request', wraps=requests.request) as request,
+    ):
+        assert PooledRequests().get(server.url).status_code == 200
+    pool.session.assert_not_called()
+    request.assert_called_once_with('get', server.url, params=None)
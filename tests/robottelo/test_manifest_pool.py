@@ -0,0 +1,162 @@
+"""Tests for ``robottelo.manifest_pool``."""
+
+import itertools
+import threading
+from unittest import mock
+
+import pytest
+
+from robottelo.manifest_pool import ManifestPool
+
+
+class FakeManifester:
+    """Generates manifest files named after a counter, and records the deleted allocations"""
+
+    counter = itertools.count()
+    generated = []
+    deleted = []
+
+    def __init__(self, manifest_category=None, **kwargs):
+        self.category = manifest_category
+
+    def get_manifest(self):
+        uuid = f'uuid-{next(self.counter)}'
+        path = self.directory / f'{uuid}_manifest.zip'
+        path.write_bytes(uuid.encode())
+        self.generated.append(uuid)
+        return mock.Mock(uuid=uuid, path=path, name=path.name)
+
+    def delete_subscription_allocation(self, uuid=None):
+        self.deleted.append(uuid)
+
+
+@pytest.fixture(autouse=True)
+def manifester(tmp_path):
+    FakeManifester.directory = tmp_path
+    FakeManifester.generated = []
+    FakeManifester.deleted = []
+    with (
+        mock.patch('robottelo.manifest_pool.Manifester', FakeManifester),
+        mock.patch('robottelo.manifest_pool.settings') as settings,
+    ):
+        settings.server.hostname = 'sat1.example.com'
+        yield FakeManifester
+
+
+def _started_pool(tmp_path, planned=1, depth=2):
+    pool = ManifestPool(tmp_path, depth=depth)
+    pool.plan('golden_ticket', planned)
+    pool.start()
+    pool._executor.shutdown(wait=True)
+    # the refills after the leases are only recorded
+    pool._executor = mock.Mock()
+    return pool
+
+
+def test_generated_ahead(manifester, tmp_path):
+    pool = _started_pool(tmp_path, planned=5)
+    # no more than depth manifests ahead
+    assert len(manifester.generated) == 2
+    with pool.lease('golden_ticket') as manifest:
+        assert manifest.uuid in manifester.generated
+        assert manifest.content == manifest.uuid.encode()
+    # one more manifest generated to replace the leased one
+    pool._executor.submit.assert_called_once()
+
+
+def test_leased_again_only_for_other_satellites(manifester, tmp_path):
+    pool = _started_pool(tmp_path)
+    with pool.lease('golden_ticket') as first:
+        pass
+    # imported in an organization of sat1 already, a new one is generated
+    with pool.lease('golden_ticket') as second:
+        assert second.uuid != first.uuid
+    with pool.lease('golden_ticket', hostname='sat2.example.com') as manifest:
+        assert manifest.uuid == first.uuid
+    assert manifester.generated == [first.uuid, second.uuid]
+
+
+def test_leased_manifests_are_distinct(tmp_path):
+    pool = _started_pool(tmp_path)
+    with (
+        pool.lease('golden_ticket') as first,
+        pool.lease('golden_ticket', hostname='sat2.example.com') as second,
+    ):
+        assert first.uuid != second.uuid
+
+
+def test_consumed_not_leased_again(manifester, tmp_path):
+    pool = _started_pool(tmp_path)
+    with pool.lease('golden_ticket') as consumed:
+        pool.consume(consumed)
+        assert manifester.deleted == []
+    # the allocation is deleted at the end of the lease
+    assert manifester.deleted == [consumed.uuid]
+    with pool.lease('golden_ticket', hostname='sat2.example.com') as manifest:
+        assert manifest.uuid != consumed.uuid
+    pool.close()
+    assert manifester.deleted.count(consumed.uuid) == 1
+
+
+def test_not_reusable_not_leased_again(manifester, tmp_path):
+    pool = _started_pool(tmp_path)
+    with pool.lease('golden_ticket', reusable=False) as consumed:
+        pass
+    assert manifester.deleted == [consumed.uuid]
+    with pool.lease('golden_ticket', hostname='sat2.example.com') as manifest:
+        assert manifest.uuid != consumed.uuid
+
+
+def test_consumed_after_lease(manifester, tmp_path):
+    pool = _started_pool(tmp_path)
+    with pool.lease('golden_ticket') as manifest:
+        pass
+    pool.consume(manifest)
+    assert manifester.deleted == [manifest.uuid]
+    with pool._store() as store:
+        assert manifest.uuid not in store['manifests']
+
+
+def test_store_updates_are_not_lost(tmp_path):
+    # pools of distinct processes only share the lock file
+    pools = [ManifestPool(tmp_path) for _ in range(4)]
+
+    def update(pool):
+        for _ in range(25):
+            with pool._store() as store:
+                store['generating']['golden_ticket'] = (
+                    store['generating'].get('golden_ticket', 0) + 1
+                )
+
+    threads = [threading.Thread(target=update, args=(pool,)) for pool in pools]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with pools[0]._store() as store:
+        assert store['generating']['golden_ticket'] == 100
+
+
+def test_shared_by_workers(manifester, tmp_path):
+    workers = [ManifestPool(tmp_path, depth=1) for _ in range(3)]
+    for pool in workers:
+        pool.plan('golden_ticket')
+        pool.start()
+        pool._executor.shutdown(wait=True)
+        pool._executor = mock.Mock()
+    assert len(manifester.generated) == 1
+    with workers[1].lease('golden_ticket') as manifest:
+        assert manifest.uuid == manifester.generated[0]
+    for pool in workers:
+        pool.close(delete=False)
+    assert manifester.deleted == []
+    ManifestPool(tmp_path).close()
+    assert sorted(manifester.deleted) == sorted(manifester.generated)
+
+
+def test_unplanned_category(manifester, tmp_path):
+    pool = ManifestPool(tmp_path)
+    with pool.lease('els_rhel_manifest') as manifest:
+        assert manifester.generated == [manifest.uuid]
+    pool.close()
+    assert manifester.deleted == [manifest.uuid]
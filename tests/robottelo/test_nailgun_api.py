@@ -0,0 +1,59 @@
+"""Tests for module ``robottelo.host_helpers.nailgun_api``."""
+
+from nailgun import entities
+import pytest
+
+from robottelo.host_helpers import nailgun_api
+
+URL = 'https://sat.example.com'
+AUTH = ('admin', 'changeme')
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    nailgun_api.clear_cache()
+    yield
+    nailgun_api.clear_cache()
+
+
+def test_entity_is_bound_to_server_config():
+    api = nailgun_api.get_api(URL, AUTH, False)
+    organization = api.Organization(id=1)
+    assert isinstance(organization, entities.Organization)
+    assert organization._server_config is api.server_config
+    assert api.server_config.url == URL
+    assert api.server_config.auth == AUTH
+    assert api.Organization.__name__ == 'Organization'
+
+
+def test_entities_are_built_lazily():
+    api = nailgun_api.get_api(URL, AUTH, False)
+    assert 'Organization' not in vars(api)
+    entity = api.Organization
+    assert vars(api)['Organization'] is entity
+    assert api.Organization is entity
+    assert 'Host' not in vars(api)
+
+
+def test_namespace_is_shared_per_server_config():
+    api = nailgun_api.get_api(URL, AUTH, False)
+    assert nailgun_api.get_api(URL, list(AUTH), False) is api
+    assert nailgun_api.get_api(URL, AUTH, False).Host is api.Host
+    assert nailgun_api.get_api('https://other.example.com', AUTH, False) is not api
+    assert nailgun_api.get_api(URL, ('viewer', 'changeme'), False).Host is not api.Host
+    nailgun_api.clear_cache()
+    assert nailgun_api.get_api(URL, AUTH, False) is not api
+
+
+def test_unknown_entity():
+    api = nailgun_api.get_api(URL, AUTH, False)
+    assert not hasattr(api, 'NotAnEntity')
+    # imported by nailgun.entities, but not an entity
+    assert not hasattr(api, 'EntityCreateMixin')
+    assert not hasattr(api, '__wrapped__')
+
+
+def test_dir_lists_entities():
+    names = dir(nailgun_api.get_api(URL, AUTH, False))
+    assert {'Organization', 'Host', 'server_config'} <= set(names)
+    assert 'EntityCreateMixin' not in names
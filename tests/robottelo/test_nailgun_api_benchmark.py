@@ -0,0 +1,81 @@
+"""Benchmarks for the nailgun entities exposed by ``Satellite.api``
+
+The previous implementation of ``Satellite.api``, which built a pair of subclasses for every
+nailgun entity of every ``Satellite`` object, is kept here as the reference for the lazy and
+process-wide cached namespaces of :mod:`robottelo.host_helpers.nailgun_api`.
+
+Run with ``pytest tests/robottelo/test_nailgun_api_benchmark.py --benchmark-only``.
+"""
+
+import functools
+
+from nailgun import entities
+from nailgun.config import ServerConfig
+from nailgun.entity_mixins import Entity
+import pytest
+
+from robottelo.host_helpers import nailgun_api
+from robottelo.hosts import Satellite
+
+pytest.importorskip('pytest_benchmark')
+
+URL = 'https://sat.example.com'
+AUTH = ('admin', 'changeme')
+# entities looked up by a typical test
+ENTITIES = ('Organization', 'Location', 'Product', 'Repository', 'ContentView', 'Host')
+
+
+def legacy_api(url, auth, verify):
+    """``Satellite.api`` before it was made lazy"""
+
+    def inject_config(cls, server_config):
+        class DecClass(cls):
+            __init__ = functools.partialmethod(cls.__init__, server_config=server_config)
+
+        return DecClass
+
+    api = type('api', (), {'_configured': False})
+    server_config = ServerConfig(auth=auth, url=url, verify=verify)
+    for name, obj in entities.__dict__.items():
+        try:
+            if Entity in obj.mro():
+                setattr(api, name, inject_config(type(name, (obj,), {}), server_config))
+        except AttributeError:
+            pass
+    api._configured = True
+    return api
+
+
+def lazy_api(url, auth, verify):
+    return nailgun_api.get_api(url, auth, verify)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    nailgun_api.clear_cache()
+    yield
+    nailgun_api.clear_cache()
+
+
+@pytest.mark.parametrize('build_api', [legacy_api, lazy_api], ids=['legacy', 'lazy'])
+def test_api_entity_access(benchmark, build_api):
+    """A new namespace per Satellite object, then the lookup of a few entities"""
+
+    def access():
+        api = build_api(URL, AUTH, False)
+        return [getattr(api, name) for name in ENTITIES]
+
+    benchmark.group = 'satellite api entity access'
+    classes = benchmark(access)
+    assert all(issubclass(cls, Entity) for cls in classes)
+
+
+def test_satellite_api_access(benchmark):
+    """Satellite objects pointing to the same server, as made by get_sat_version and friends"""
+
+    def create_and_access():
+        satellite = Satellite(hostname='sat.example.com')
+        return satellite.api.Organization
+
+    benchmark.group = 'satellite api entity access'
+    assert benchmark(create_and_access) is create_and_access()
@@ -0,0 +1,130 @@
+"""Tests for the pipelined mode of ``RepositoryCollection.setup``."""
+
+from concurrent.futures import Future
+import threading
+from unittest import mock
+
+from nailgun.entity_mixins import TaskFailedError, TaskTimedOutError
+import pytest
+
+from robottelo.exceptions import CLIReturnCodeError
+from robottelo.host_helpers import repository_mixins
+
+
+class FakeTaskWatcher:
+    """Resolves the watched sync tasks on demand, keeping track of the concurrent syncs"""
+
+    def __init__(self, failing=(), timing_out=()):
+        self.failing = set(failing)
+        self.timing_out = set(timing_out)
+        self.futures = {}
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def watch(self, task_id, timeout):
+        future = Future()
+        with self.lock:
+            self.futures[task_id] = future
+            running = sum(not future.done() for future in self.futures.values())
+            self.max_running = max(self.max_running, running)
+        # finish the task right away, from another thread like the real watcher
+        threading.Timer(0.01, self.finish, (task_id,)).start()
+        return future
+
+    def finish(self, task_id):
+        future = self.futures[task_id]
+        if task_id in self.timing_out:
+            future.set_exception(TaskTimedOutError(f'Timed out polling task {task_id}'))
+        elif task_id in self.failing:
+            future.set_exception(TaskFailedError(f'Task {task_id} did not succeed'))
+        else:
+            future.set_result({'id': task_id, 'result': 'success'})
+
+
+@pytest.fixture
+def satellite():
+    satellite = mock.Mock()
+    satellite.task_watcher = FakeTaskWatcher()
+    created = []
+
+    def make_repository(options):
+        created.append(options['url'])
+        return {'id': options['url'].rsplit('/', 1)[-1], 'url': options['url']}
+
+    satellite.cli_factory.make_repository.side_effect = make_repository
+    satellite.cli_factory.make_product_wait.return_value = mock.MagicMock(id=1)
+    satellite.api.Repository.side_effect = lambda id: mock.Mock(
+        **{'sync.return_value': {'id': f'task-{id}'}}
+    )
+    satellite.created = created
+    return satellite
+
+
+@pytest.fixture
+def collection(satellite):
+    repo_class = type('YumRepository', (repository_mixins.YumRepository,), {'satellite': satellite})
+    collection_class = type(
+        'RepositoryCollection', (repository_mixins.RepositoryCollection,), {'satellite': satellite}
+    )
+    return collection_class(
+        repositories=[repo_class(url=f'http://repos.example.com/repo{index}') for index in range(6)]
+    )
+
+
+def test_setup_pipelined(collection, satellite):
+    _, repos_info = collection.setup(org_id=1, pipelined=True, max_concurrent_syncs=2)
+    assert [repo_info['id'] for repo_info in repos_info] == [f'repo{index}' for index in range(6)]
+    assert collection.repos_info == repos_info
+    assert sorted(satellite.task_watcher.futures) == [f'task-repo{index}' for index in range(6)]
+    assert satellite.task_watcher.max_running <= 2
+    satellite.cli.Repository.synchronize.assert_not_called()
+    satellite.wait_for_tasks.assert_called_once()
+
+
+def test_setup_pipelined_without_sync(collection, satellite):
+    collection.setup(org_id=1, synchronize=False, pipelined=True)
+    assert len(satellite.created) == 6
+    assert not satellite.task_watcher.futures
+
+
+def test_setup_pipelined_sync_failure(collection, satellite):
+    satellite.task_watcher.failing = {'task-repo3', 'task-repo1'}
+    with pytest.raises(CLIReturnCodeError, match='task-repo1') as error:
+        collection.setup(org_id=1, pipelined=True, max_concurrent_syncs=1)
+    assert isinstance(error.value.__cause__, TaskFailedError)
+    # no sync is started after the first failure
+    assert sorted(satellite.task_watcher.futures) == ['task-repo0', 'task-repo1']
+    assert not collection.repos_info
+
+
+@pytest.mark.parametrize('pipelined', [False, True])
+@pytest.mark.parametrize('timed_out', [False, True])
+def test_setup_sync_failure_error_type(collection, satellite, pipelined, timed_out):
+    """Both modes raise the error of ``hammer repository synchronize`` for a failed sync"""
+    if timed_out:
+        satellite.task_watcher.timing_out = {'task-repo2'}
+    else:
+        satellite.task_watcher.failing = {'task-repo2'}
+
+    def synchronize(options, timeout):
+        if options['id'] == 'repo2':
+            raise CLIReturnCodeError(70, 'Task did not succeed', 'repository synchronize failed')
+
+    satellite.cli.Repository.synchronize.side_effect = synchronize
+    with pytest.raises(CLIReturnCodeError) as error:
+        collection.setup(org_id=1, pipelined=pipelined, max_concurrent_syncs=2)
+    assert error.value.status == 70
+
+
+def test_setup_pipelined_create_failure(collection, satellite):
+    make_repository = satellite.cli_factory.make_repository.side_effect
+
+    def failing_make_repository(options):
+        if options['url'].endswith(('repo2', 'repo4')):
+            raise repository_mixins.RepositoryDataNotFound(options['url'])
+        return make_repository(options)
+
+    satellite.cli_factory.make_repository.side_effect = failing_make_repository
+    with pytest.raises(repository_mixins.RepositoryDataNotFound, match='repo2'):
+        collection.setup(org_id=1, pipelined=True)
+    assert not satellite.task_watcher.futures
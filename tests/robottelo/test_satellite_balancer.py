@@ -0,0 +1,99 @@
+"""Tests for ``robottelo.satellite_balancer``."""
+
+import threading
+from unittest import mock
+
+import pytest
+
+from pytest_plugins.satellite_balancing import SatelliteLoadCoordinator
+from robottelo.satellite_balancer import STATE_DIR_KEY, SatelliteBalancer
+
+HOSTNAMES = ['sat1.example.com', 'sat2.example.com', 'sat3.example.com']
+
+
+@pytest.fixture
+def balancer(tmp_path):
+    return SatelliteBalancer(tmp_path)
+
+
+def test_spread_workers_without_pending_work(balancer):
+    chosen = [balancer.choose(f'gw{index}', HOSTNAMES) for index in range(4)]
+    assert chosen == [*HOSTNAMES, HOSTNAMES[0]]
+
+
+def test_least_queued_work(balancer):
+    for index in range(3):
+        balancer.choose(f'gw{index}', HOSTNAMES)
+    balancer.publish_pending({'gw0': 300.0, 'gw1': 20.0, 'gw2': 100.0})
+    assert balancer.choose('gw3', HOSTNAMES) == HOSTNAMES[1]
+    # gw4 isn't known to the controller yet, it counts for the mean of the others
+    assert balancer.loads(HOSTNAMES)[HOSTNAMES[1]] == [20.0 + 140.0, 2]
+    assert balancer.choose('gw4', HOSTNAMES) == HOSTNAMES[2]
+
+
+def test_sampled_load_weights_queued_work(balancer):
+    for index in range(3):
+        balancer.choose(f'gw{index}', HOSTNAMES)
+    balancer.publish_pending({'gw0': 100.0, 'gw1': 60.0, 'gw2': 80.0})
+    samples = {HOSTNAMES[0]: 0.1, HOSTNAMES[1]: 2.0, HOSTNAMES[2]: 0.2}
+    assert balancer.choose('gw3', HOSTNAMES, sample=samples.get) == HOSTNAMES[2]
+
+
+def test_unreachable_satellite_last(balancer):
+    def sample(hostname):
+        if hostname == HOSTNAMES[0]:
+            raise ConnectionError('no route to host')
+        return 0.5
+
+    assert balancer.choose('gw0', HOSTNAMES, sample=sample) == HOSTNAMES[1]
+
+
+def test_from_config(tmp_path):
+    assert SatelliteBalancer.from_config(mock.Mock(spec=[])) is None
+    config = mock.Mock(workerinput={STATE_DIR_KEY: str(tmp_path)})
+    assert SatelliteBalancer.from_config(config).state_dir == tmp_path
+
+
+class FakeScheduler:
+    """Stands for the --dist load scheduler, queueing tests on the workers on schedule()"""
+
+    def __init__(self, queued):
+        self.queued = queued
+        self.collection = None
+        self.node2pending = {}
+
+    def schedule(self):
+        self.collection = []
+        for worker_id, count in self.queued.items():
+            node = mock.Mock(gateway=mock.Mock(id=worker_id))
+            start = len(self.collection)
+            self.collection.extend(f'test_{worker_id}_{index}' for index in range(count))
+            self.node2pending[node] = list(range(start, len(self.collection)))
+
+
+def test_queued_work_published_at_startup():
+    coordinator = SatelliteLoadCoordinator(mock.Mock())
+    scheduler = FakeScheduler({'gw0': 4, 'gw1': 1, 'gw2': 1})
+    hook = coordinator.pytest_xdist_make_scheduler(config=None, log=None)
+    next(hook)
+    with pytest.raises(StopIteration):
+        hook.send(mock.Mock(get_result=mock.Mock(return_value=scheduler)))
+    balancer = SatelliteBalancer(coordinator.balancer.state_dir)
+    # no test has finished yet, the workers align to a Satellite during their first setup
+    scheduler.schedule()
+    hostnames = HOSTNAMES[:2]
+    chosen = [balancer.choose(worker_id, hostnames, wait=1) for worker_id in ('gw0', 'gw1', 'gw2')]
+    # gw2 joins gw1, the Satellite of gw0 has the most queued work
+    assert chosen == [hostnames[0], hostnames[1], hostnames[1]]
+    coordinator.pytest_unconfigure(None)
+
+
+def test_choose_waits_for_queued_work(balancer):
+    balancer.choose('gw0', HOSTNAMES[:2])
+    timer = threading.Timer(0.2, balancer.publish_pending, [{'gw0': 10.0, 'gw1': 1.0}])
+    timer.start()
+    assert balancer.choose('gw1', HOSTNAMES[:2], wait=5) == HOSTNAMES[1]
+    assert balancer.choose('gw2', HOSTNAMES[:2], wait=5) == HOSTNAMES[1]
+    timer.join()
+    # nothing is published, the wait gives up
+    assert SatelliteBalancer(balancer.state_dir / 'nothing').wait_for_pending(0.2) is False
@@ -2,6 +2,8 @@
 
 from unittest import mock
 
+import pytest
+
 from robottelo import ssh
 
 
@@ -102,3 +104,114 @@ class TestSSH:
 
         ret = ssh.command('ls -la')
         assert ret[1].cmd == 'ls -la'
+
+
+class FakeClient:
+    """A ``ContentHost`` stand-in recording how it was built and used"""
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+        self._session = None
+        self.closed = False
+        self.status = 0
+
+    def execute(self, cmd, timeout=None):
+        self._session = True
+        return mock.Mock(status=self.status, stdout=cmd)
+
+    def close(self):
+        self.closed = True
+
+
+class TestSSHConnectionPool:
+    """Tests for ``robottelo.ssh.SSHConnectionPool``."""
+
+    params = {
+        'hostname': 'sat.example.com',
+        'username': 'root',
+        'password': 'pass',
+        'port': 22,
+        'net_type': 'ipv4',
+    }
+
+    def test_reuse_client(self):
+        pool = ssh.SSHConnectionPool()
+        client = pool.get(FakeClient, **self.params)
+        assert pool.get(FakeClient, **self.params) is client
+        assert len(pool) == 1
+
+    def test_distinct_keys(self):
+        pool = ssh.SSHConnectionPool()
+        client = pool.get(FakeClient, **self.params)
+        other = pool.get(FakeClient, **{**self.params, 'hostname': 'cap.example.com'})
+        assert other is not client
+        assert len(pool) == 2
+
+    def test_password_change_rebuilds_client(self):
+        pool = ssh.SSHConnectionPool()
+        client = pool.get(FakeClient, **self.params)
+        new_client = pool.get(FakeClient, **{**self.params, 'password': 'new'})
+        assert new_client is not client
+        assert client.closed
+
+    def test_idle_client_evicted(self):
+        pool = ssh.SSHConnectionPool(max_idle=10)
+        with mock.patch('robottelo.ssh.time.monotonic', return_value=0):
+            client = pool.get(FakeClient, **self.params)
+        with mock.patch('robottelo.ssh.time.monotonic', return_value=11):
+            assert pool.get(FakeClient, **self.params) is not client
+        assert client.closed
+
+    def test_dead_client_replaced(self):
+        pool = ssh.SSHConnectionPool(keepalive_interval=5)
+        with mock.patch('robottelo.ssh.time.monotonic', return_value=0):
+            client = pool.get(FakeClient, **self.params)
+            client.execute('ls')
+        client.status = 255
+        with mock.patch('robottelo.ssh.time.monotonic', return_value=6):
+            assert pool.get(FakeClient, **self.params) is not client
+        assert client.closed
+
+    def test_discard(self):
+        pool = ssh.SSHConnectionPool()
+        client = pool.get(FakeClient, **self.params)
+        pool.discard(client)
+        assert client.closed
+        assert len(pool) == 0
+
+
+class TestCommandReconnects:
+    """Tests for ``robottelo.ssh.command`` on a pooled session which died."""
+
+    params = TestSSHConnectionPool.params
+
+    def _patched(self, pool):
+        return (
+            mock.patch.object(ssh, 'connection_pool', pool),
+            mock.patch.object(
+                ssh, 'get_client', side_effect=lambda **kwargs: pool.get(FakeClient, **self.params)
+            ),
+        )
+
+    def test_dead_session_reconnects(self):
+        pool = ssh.SSHConnectionPool()
+        dead = pool.get(FakeClient, **self.params)
+        dead._session = True
+        dead.execute = mock.Mock(side_effect=OSError('Socket disconnected'))
+        patch_pool, patch_get_client = self._patched(pool)
+        with patch_pool, patch_get_client as get_client:
+            result = ssh.command('hammer ping')
+        assert result.stdout == 'hammer ping'
+        assert get_client.call_count == 2
+        assert dead.closed
+        assert len(pool) == 1
+
+    def test_command_errors_not_retried(self):
+        pool = ssh.SSHConnectionPool()
+        client = pool.get(FakeClient, **self.params)
+        client.execute = mock.Mock(side_effect=TimeoutError('command timed out'))
+        patch_pool, patch_get_client = self._patched(pool)
+        with patch_pool, patch_get_client as get_client, pytest.raises(TimeoutError):
+            ssh.command('sleep 1000', timeout=1)
+        assert get_client.call_count == 1
+        assert client.closed
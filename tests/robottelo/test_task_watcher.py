@@ -0,0 +1,143 @@
+"""Tests for module ``robottelo.host_helpers.task_watcher``."""
+
+import re
+import threading
+from unittest import mock
+
+from nailgun import entity_mixins
+from nailgun.entity_mixins import TaskFailedError, TaskTimedOutError
+import pytest
+
+from robottelo.exceptions import ForemanTaskError
+from robottelo.host_helpers.task_watcher import TaskWatcher, get_task_watcher
+
+
+class FakeTasks:
+    """Stands for the ForemanTask search API, tasks finish after a number of searches"""
+
+    def __init__(self, **tasks):
+        # task id -> (searches until the task is finished, result)
+        self.tasks = tasks
+        self.searches = []
+        self.lock = threading.Lock()
+
+    def search_json(self, query):
+        task_ids = re.fullmatch(r'id \^ \((.*)\)', query['search']).group(1).split(', ')
+        with self.lock:
+            self.searches.append(task_ids)
+            results = []
+            for task_id in task_ids:
+                remaining, result = self.tasks[task_id]
+                self.tasks[task_id] = (remaining - 1, result)
+                state = 'stopped' if remaining <= 1 else 'running'
+                results.append({'id': task_id, 'state': state, 'result': result})
+        return {'results': results}
+
+
+def _query(*task_ids):
+    return {'search': f'id ^ ({", ".join(task_ids)})', 'per_page': len(task_ids)}
+
+
+@pytest.fixture
+def tasks():
+    return FakeTasks(
+        a=(1, 'success'), b=(3, 'success'), c=(2, 'warning'), d=(100, 'pending'), e=(2, 'error')
+    )
+
+
+@pytest.fixture
+def watcher(tasks):
+    satellite = mock.Mock(hostname='sat.example.com')
+    satellite.api.ForemanTask.return_value = tasks
+    return TaskWatcher(satellite, min_interval=0.01, max_interval=0.05, jitter=0)
+
+
+def test_wait(watcher, tasks):
+    results = watcher.wait(['b', 'a'], timeout=5)
+    assert [task['id'] for task in results] == ['b', 'a']
+    # every search covers the tasks still watched
+    assert tasks.searches[0] == ['b', 'a']
+    assert all(search == ['b'] for search in tasks.searches[1:])
+    assert len(tasks.searches) == 3
+
+
+def test_wait_failures(watcher):
+    with pytest.raises(ForemanTaskError) as error:
+        watcher.wait(['a', 'c', 'd', 'e'], timeout=0.2)
+    assert str(error.value) == '3 of 4 tasks failed (3 sub-exceptions)'
+    assert [type(err) for err in error.value.exceptions] == [
+        TaskFailedError,
+        TaskTimedOutError,
+        TaskFailedError,
+    ]
+    assert watcher.wait(['c'], timeout=5, must_succeed=False)[0]['result'] == 'warning'
+
+
+def test_wait_failures_are_task_failed_errors(watcher):
+    # callers catching the errors of nailgun's ForemanTask.poll keep working
+    with pytest.raises(TaskFailedError) as error:
+        watcher.wait(['e'], timeout=5)
+    assert type(error.value) is TaskFailedError
+    with pytest.raises(TaskTimedOutError):
+        watcher.wait(['d'], timeout=0.2)
+    with pytest.raises(TaskFailedError) as error:
+        watcher.wait(['a', 'e'], timeout=5)
+    assert isinstance(error.value, ForemanTaskError)
+
+
+def test_watch_callback(watcher):
+    done = []
+    future = watcher.watch('b', timeout=5, callback=done.append)
+    assert future.result(timeout=5)['state'] == 'stopped'
+    assert done == [future]
+    # the polling thread stops once nothing is watched
+    if (thread := watcher._thread) is not None:
+        thread.join(timeout=5)
+    assert watcher._thread is None
+
+
+def test_watch_same_task(watcher, tasks):
+    first, second = watcher.watch('b', timeout=5), watcher.watch('b', timeout=5)
+    assert first.result(timeout=5) == second.result(timeout=5)
+    assert all(search == ['b'] for search in tasks.searches)
+
+
+def test_backoff(watcher, tasks):
+    watcher.max_interval = 1
+    with mock.patch.object(watcher._condition, 'wait', wraps=watcher._condition.wait) as wait:
+        watcher.wait(['b'], timeout=5)
+    intervals = [call.args[0] for call in wait.call_args_list]
+    assert intervals == pytest.approx([0.015, 0.0225])
+
+
+def test_max_interval_defaults_to_task_poll_rate():
+    # a task is noticed as finished no later than with ForemanTask.poll
+    assert TaskWatcher(mock.Mock()).max_interval == entity_mixins.TASK_POLL_RATE
+
+
+def test_search_errors_are_retried(watcher, tasks):
+    with mock.patch.object(
+        tasks, 'search_json', side_effect=[ConnectionError, tasks.search_json(_query('a'))]
+    ):
+        assert watcher.wait(['a'], timeout=5)[0]['id'] == 'a'
+
+
+def test_watcher_is_shared_per_hostname():
+    satellite = mock.Mock(hostname='shared.example.com')
+    watcher = get_task_watcher(satellite)
+    assert get_task_watcher(mock.Mock(hostname='shared.example.com')) is watcher
+    assert get_task_watcher(mock.Mock(hostname='other.example.com')) is not watcher
+
+
+def test_watch_same_task_per_caller_settings(watcher, tasks):
+    lenient, strict = (
+        watcher.watch('e', timeout=5, must_succeed=False),
+        watcher.watch('e', timeout=5),
+    )
+    assert lenient.result(timeout=5)['result'] == 'error'
+    assert isinstance(strict.exception(timeout=5), TaskFailedError)
+    patient, hasty = watcher.watch('d', timeout=5), watcher.watch('d', timeout=0.1)
+    assert isinstance(hasty.exception(timeout=5), TaskTimedOutError)
+    # the task stays watched for the callers still waiting
+    assert not patient.done()
+    assert list(watcher._watches) == ['d']
@@ -0,0 +1,127 @@
+"""Tests for the scheduler and the timing store of ``pytest_plugins.xdist_scheduling``."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from pytest_plugins.xdist_scheduling import DurationScheduling, TimingStore, lpt_makespan
+
+COLLECTION = [
+    'tests/test_cv.py::test_publish[rhel8]',
+    'tests/test_cv.py::test_promote[rhel8]',
+    'tests/test_cv.py::test_publish[rhel9]',
+    'tests/test_cv.py::test_promote[rhel9]',
+    'tests/test_cv.py::test_delete',
+    'tests/test_org.py::test_create',
+    'tests/test_org.py::test_update',
+    'tests/test_org.py::test_delete',
+]
+GROUPS = {
+    **{nodeid: 'tests/test_cv.py{"module_host": "rhel8"}' for nodeid in COLLECTION[:2]},
+    **{nodeid: 'tests/test_cv.py{"module_host": "rhel9"}' for nodeid in COLLECTION[2:4]},
+    COLLECTION[4]: 'tests/test_cv.py{"module_host": "rhel8"}',
+    **{nodeid: 'tests/test_org.py' for nodeid in COLLECTION[5:]},
+}
+
+
+class FakeNode:
+    shutting_down = False
+
+    def __init__(self, id):
+        self.gateway = mock.Mock(id=id)
+        self.sent = []
+
+    def send_runtest_some(self, indexes):
+        self.sent.append([COLLECTION[index] for index in indexes])
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+COMPONENTS = {
+    nodeid: 'contentviews' if 'cv' in nodeid else 'organizations' for nodeid in COLLECTION
+}
+
+
+@pytest.fixture
+def info_dir(tmp_path):
+    info = {nodeid: {'component': component} for nodeid, component in COMPONENTS.items()}
+    (tmp_path / 'gw0.json').write_text(json.dumps(info))
+    return tmp_path
+
+
+@pytest.fixture
+def groups_dir(tmp_path):
+    groups_dir = tmp_path / 'groups'
+    groups_dir.mkdir()
+    (groups_dir / 'gw0.json').write_text(json.dumps(GROUPS))
+    return groups_dir
+
+
+def _store(tmp_path, durations, components=None):
+    store = TimingStore(tmp_path / 'timings.json')
+    store.update(durations, components or {})
+    return store
+
+
+def _schedule(info_dir=None, groups_dir=None, timings=None, nodes=3, dist='loadscope'):
+    options = {'tx': [f'{nodes}*popen'], 'dist': dist}
+    config = mock.Mock(**{'getvalue.side_effect': options.get})
+    scheduler = DurationScheduling(
+        config, log=mock.MagicMock(), groups_dir=groups_dir, info_dir=info_dir, timings=timings
+    )
+    workers = [FakeNode(f'gw{index}') for index in range(nodes)]
+    for worker in workers:
+        scheduler.add_node(worker)
+        scheduler.add_node_collection(worker, COLLECTION)
+    scheduler.schedule()
+    return scheduler, workers
+
+
+def test_without_timings_most_tests_first(groups_dir):
+    _, (worker,) = _schedule(groups_dir=groups_dir, nodes=1)
+    assert worker.sent[0] == COLLECTION[:2] + COLLECTION[4:5]
+
+
+def test_longest_group_first(groups_dir, tmp_path):
+    durations = dict.fromkeys(COLLECTION, 1)
+    durations['tests/test_cv.py::test_publish[rhel9]'] = 100
+    scheduler, (worker,) = _schedule(
+        groups_dir=groups_dir, timings=_store(tmp_path, durations), nodes=1
+    )
+    assert worker.sent[0] == COLLECTION[2:4]
+    assert scheduler.predicted_makespan == pytest.approx(107)
+
+
+def test_longest_test_first_with_dist_load(info_dir, tmp_path):
+    durations = dict.fromkeys(COLLECTION[:-1], 1)
+    durations['tests/test_org.py::test_update'] = 50
+    scheduler, workers = _schedule(
+        info_dir=info_dir, timings=_store(tmp_path, durations, COMPONENTS), nodes=2, dist='load'
+    )
+    assert workers[0].sent[0] == ['tests/test_org.py::test_update']
+    # test_delete of organizations is estimated at the mean of the organizations tests
+    assert scheduler.estimate('tests/test_org.py::test_delete') == pytest.approx(25.5)
+    assert scheduler.predicted_makespan == pytest.approx(50)
+
+
+def test_component_defaults(tmp_path):
+    store = _store(
+        tmp_path,
+        {'a': 10, 'b': 20, 'c': 60},
+        {'a': 'contentviews', 'b': 'contentviews', 'c': 'hosts'},
+    )
+    store.save()
+    store = TimingStore(tmp_path / 'timings.json')
+    assert store.estimate('a') == 10
+    assert store.estimate('new', 'contentviews') == 15
+    assert store.estimate('new', 'repositories') == 30
+    assert store.estimate('new') == 30
+    assert TimingStore().estimate('new') == 1.0
+
+
+def test_lpt_makespan():
+    assert lpt_makespan([3, 3, 2, 2, 2], 2) == 7
+    assert lpt_makespan([5], 4) == 5
+    assert lpt_makespan([], 2) == 0
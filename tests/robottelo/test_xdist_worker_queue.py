@@ -0,0 +1,52 @@
+"""Tests for ``pytest_plugins.xdist_worker_queue``."""
+
+from unittest import mock
+
+from pytest_plugins.xdist_worker_queue import on_tests_sent
+
+
+class FakeInteractor:
+    """Stands for the WorkerInteractor of xdist, queueing the indices of the tests sent"""
+
+    def __init__(self):
+        self.torun = []
+
+    def handle_command(self, command):
+        name, kwargs = command
+        if name == 'runtests':
+            self.torun.extend(kwargs['indices'])
+
+
+def _session(*plugins, worker=True):
+    config = mock.Mock(spec=['pluginmanager', 'workerinput'] if worker else ['pluginmanager'])
+    config.pluginmanager.get_plugins.return_value = [object(), *plugins]
+    return mock.Mock(config=config, items=['test_a', 'test_b', 'test_c'])
+
+
+def test_tests_sent_are_reported():
+    interactor = FakeInteractor()
+    session = _session(interactor)
+    sent = []
+
+    def callback(items):
+        # the tests are reported before they are queued
+        sent.append((items, list(interactor.torun)))
+
+    assert on_tests_sent(session, callback)
+    interactor.handle_command(('runtests', {'indices': [2, 0]}))
+    interactor.handle_command(('runtests_all', {}))
+    interactor.handle_command(('shutdown', {}))
+    assert sent == [(['test_c', 'test_a'], []), (['test_a', 'test_b', 'test_c'], [2, 0])]
+    assert interactor.torun == [2, 0]
+
+
+def test_callback_errors_are_ignored():
+    interactor = FakeInteractor()
+    assert on_tests_sent(_session(interactor), mock.Mock(side_effect=ValueError))
+    interactor.handle_command(('runtests', {'indices': [1]}))
+    assert interactor.torun == [1]
+
+
+def test_not_a_worker():
+    assert not on_tests_sent(_session(FakeInteractor(), worker=False), mock.Mock())
+    assert not on_tests_sent(_session(), mock.Mock())